@@ -0,0 +1,156 @@
+import argparse
+import asyncio
+import importlib
+import math
+import os
+import re
+import time
+from collections import Counter
+from typing import Any, NamedTuple
+
+import uvicorn
+from aiohttp import ClientError, ClientSession, TCPConnector
+
+from benchmarks.environment import add_upstream_arguments, free_port, local_environment
+
+QUANTILES = (0.5, 0.95, 0.99)
+CONNECTION_ERROR = "connection_error"
+BUCKET_LINE = re.compile(
+    r'^\w+_stage_duration_seconds_bucket\{worker="\d+",stage="(?P<stage>[^"]+)",le="(?P<le>[^"]+)"\} (?P<count>\S+)$'
+)
+
+Histograms = dict[str, list[tuple[float, float]]]
+
+
+class LoadResult(NamedTuple):
+    latencies: list[float]
+    statuses: Counter[str]
+    elapsed: float
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Drive POST /charge-pix against local stand-ins of every upstream.")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--warmup", type=int, default=50)
+    add_upstream_arguments(parser)
+    return parser.parse_args()
+
+
+def configure_environment(environment: dict[str, str]) -> None:
+    os.environ.update(environment)
+    os.environ.setdefault("PIX_RATE_LIMIT", "100000")
+    os.environ.setdefault("PIX_RATE_LIMIT_BURST", "1000")
+    os.environ.setdefault("PIX_MAX_CONCURRENCY", "256")
+
+
+async def drive_load(base_url: str, tokens: list[str], requests: int, concurrency: int) -> LoadResult:
+    latencies: list[float] = []
+    statuses: Counter[str] = Counter()
+    issued = 0
+
+    async def worker(session: ClientSession) -> None:
+        nonlocal issued
+        while issued < requests:
+            token = tokens[issued % len(tokens)]
+            issued += 1
+            started_at = time.perf_counter()
+            try:
+                async with session.post(
+                    f"{base_url}/charge-pix",
+                    json={"charge_value": 10.5},
+                    headers={"Authorization": f"Bearer {token}"},
+                ) as response:
+                    await response.read()
+                    status = str(response.status)
+            except ClientError:
+                status = CONNECTION_ERROR
+            latencies.append(time.perf_counter() - started_at)
+            statuses[status] += 1
+
+    async with ClientSession(connector=TCPConnector(limit=concurrency)) as session:
+        started_at = time.perf_counter()
+        await asyncio.gather(*(worker(session) for _ in range(concurrency)))
+        return LoadResult(latencies=latencies, statuses=statuses, elapsed=time.perf_counter() - started_at)
+
+
+async def scrape_stages(base_url: str, token: str) -> Histograms:
+    async with ClientSession() as session:
+        async with session.get(f"{base_url}/metrics", headers={"Authorization": f"Bearer {token}"}) as response:
+            text = await response.text()
+    histograms: Histograms = {}
+    for line in text.splitlines():
+        match = BUCKET_LINE.match(line)
+        if match:
+            histograms.setdefault(match["stage"], []).append((float(match["le"]), float(match["count"])))
+    return histograms
+
+
+def subtract(after: Histograms, before: Histograms) -> Histograms:
+    differences: Histograms = {}
+    for stage, buckets in after.items():
+        previous = dict(before.get(stage, []))
+        differences[stage] = [(bound, count - previous.get(bound, 0.0)) for bound, count in buckets]
+    return differences
+
+
+def histogram_quantile(quantile: float, buckets: list[tuple[float, float]]) -> float:
+    total = buckets[-1][1]
+    if total <= 0:
+        return math.nan
+    rank = quantile * total
+    lower_bound, lower_count = 0.0, 0.0
+    for bound, count in buckets:
+        if count >= rank:
+            if math.isinf(bound):
+                return lower_bound
+            return lower_bound + (bound - lower_bound) * (rank - lower_count) / max(count - lower_count, 1e-9)
+        lower_bound, lower_count = bound, count
+    return lower_bound
+
+
+def exact_quantile(quantile: float, samples: list[float]) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(quantile * len(ordered)), len(ordered) - 1)] if ordered else math.nan
+
+
+def report(result: LoadResult, stages: Histograms) -> None:
+    completed = len(result.latencies)
+    print(f"{'requests':<16} {completed}  {dict(sorted(result.statuses.items()))}")
+    print(f"{'throughput':<16} {completed / result.elapsed:.1f} req/s")
+    latency = "  ".join(f"p{round(q * 100)} {exact_quantile(q, result.latencies) * 1000:8.2f} ms" for q in QUANTILES)
+    print(f"{'latency':<16} {latency}")
+    print()
+    print(f"{'stage':<16} {'count':>8} " + " ".join(f"{f'p{round(q * 100)} (ms)':>10}" for q in QUANTILES))
+    for stage, buckets in sorted(stages.items()):
+        quantiles = " ".join(f"{histogram_quantile(q, buckets) * 1000:>10.2f}" for q in QUANTILES)
+        print(f"{stage:<16} {int(buckets[-1][1]):>8} {quantiles}")
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    port = free_port()
+    async with local_environment(arguments, port) as environment:
+        configure_environment(environment.variables)
+        app: Any = importlib.import_module("domain_payment.main").app
+        server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+        serving = asyncio.create_task(server.serve())
+        while not server.started:
+            if serving.done():
+                await serving
+                raise RuntimeError("The application did not start")
+            await asyncio.sleep(0.05)
+        base_url = f"http://127.0.0.1:{port}"
+        tokens = [environment.firebase.issue_token(uid) for uid in environment.uids]
+        metrics_token = environment.variables["METRICS_TOKEN"]
+        try:
+            await drive_load(base_url, tokens, arguments.warmup, arguments.concurrency)
+            before = await scrape_stages(base_url, metrics_token)
+            result = await drive_load(base_url, tokens, arguments.requests, arguments.concurrency)
+            report(result, subtract(await scrape_stages(base_url, metrics_token), before))
+        finally:
+            server.should_exit = True
+            await serving
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_arguments()))
@@ -0,0 +1,65 @@
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any
+
+from benchmarks.environment import add_upstream_arguments, free_port, local_environment
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure the cold start of the service in fresh interpreters.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    add_upstream_arguments(parser)
+    return parser.parse_args()
+
+
+async def start_application() -> dict[str, float]:
+    started_at = time.perf_counter()
+    app: Any = importlib.import_module("domain_payment.main").app
+    imported = time.perf_counter() - started_at
+    async with app.router.lifespan_context(app):
+        ready = time.perf_counter() - started_at
+    return {"import": imported, **app.state.startup_timings.phases, "ready": ready}
+
+
+async def measure_run(variables: dict[str, str]) -> dict[str, float]:
+    started_at = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "benchmarks.cold_start",
+        "--child",
+        env={**os.environ, **variables},
+        stdout=asyncio.subprocess.PIPE,
+    )
+    stdout, _ = await process.communicate()
+    if process.returncode:
+        raise RuntimeError(f"The application exited with status {process.returncode}")
+    return {**json.loads(stdout.decode().splitlines()[-1]), "process": time.perf_counter() - started_at}
+
+
+def report(runs: list[dict[str, float]]) -> None:
+    print(f"{'phase':<32} {'mean (ms)':>10} {'min (ms)':>10} {'max (ms)':>10}")
+    for phase in runs[0]:
+        samples = [run[phase] * 1000 for run in runs if phase in run]
+        print(f"{phase:<32} {statistics.mean(samples):>10.2f} {min(samples):>10.2f} {max(samples):>10.2f}")
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    async with local_environment(arguments, free_port()) as environment:
+        runs = [await measure_run(environment.variables) for _ in range(arguments.runs)]
+    report(runs)
+
+
+if __name__ == "__main__":
+    parsed_arguments = parse_arguments()
+    if parsed_arguments.child:
+        print(json.dumps(asyncio.run(start_application())))
+    else:
+        asyncio.run(main(parsed_arguments))
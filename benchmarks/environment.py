@@ -0,0 +1,113 @@
+import argparse
+import asyncio
+import socket
+import tempfile
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, NamedTuple
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from benchmarks.fakes import (
+    FakeEfi,
+    FakeFirebase,
+    FakeRedis,
+    FakeStorage,
+    FaultInjection,
+    create_service_account_file,
+    generate_certificates,
+)
+from benchmarks.mongo import LocalMongo
+
+PROJECT_ID = "domain-payment-benchmark"
+BUCKET_NAME = "benchmark"
+
+
+class LocalEnvironment(NamedTuple):
+    variables: dict[str, str]
+    firebase: FakeFirebase
+    uids: list[str]
+
+
+def add_upstream_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--delivery", default="bucket", choices=["bucket", "background", "inline", "route"])
+    parser.add_argument("--efi-latency", type=float, default=0.05)
+    parser.add_argument("--efi-error-rate", type=float, default=0.0)
+    parser.add_argument("--storage-latency", type=float, default=0.02)
+    parser.add_argument("--storage-error-rate", type=float, default=0.0)
+    parser.add_argument("--firebase-latency", type=float, default=0.0)
+    parser.add_argument("--cache-backend", default="local", choices=["local", "shared", "redis"])
+    parser.add_argument(
+        "--db-uri",
+        default=None,
+        help="URI of a disposable mongod, it is seeded with benchmark data. A temporary mongod is spawned if omitted.",
+    )
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+async def seed_database(database_uri: str, uids: list[str]) -> None:
+    client: AsyncIOMotorClient = AsyncIOMotorClient(database_uri)
+    try:
+        users = client["domain-account"]["users"]
+        await asyncio.gather(
+            *(users.update_one({"uid": uid}, {"$set": {"uid": uid, "cpf": "77777777777"}}, upsert=True) for uid in uids)
+        )
+        await client["configuration"]["payment"].replace_one(
+            {},
+            {
+                "pix_key": "benchmark@domain-payment.com",
+                "payment_request_types": {"pix_service_payment": "Benchmark"},
+                "pix_expiration_time": 3600,
+            },
+            upsert=True,
+        )
+    finally:
+        client.close()
+
+
+@asynccontextmanager
+async def local_environment(arguments: argparse.Namespace, app_port: int) -> AsyncIterator[LocalEnvironment]:
+    with tempfile.TemporaryDirectory(prefix="domain-payment-benchmark-") as directory:
+        certificates = generate_certificates(directory)
+        efi = FakeEfi(certificates, FaultInjection(arguments.efi_latency, arguments.efi_error_rate))
+        storage = FakeStorage(FaultInjection(arguments.storage_latency, arguments.storage_error_rate))
+        firebase = FakeFirebase(PROJECT_ID, FaultInjection(arguments.firebase_latency))
+        redis = FakeRedis()
+        fakes = (efi, storage, firebase, redis)
+        await asyncio.gather(*(fake.start() for fake in fakes))
+        uids = [f"benchmark-user-{index}" for index in range(arguments.users)]
+        firebase.users.update({uid: f"Benchmark User {index}" for index, uid in enumerate(uids)})
+        try:
+            async with LocalMongo(arguments.db_uri) as mongo:
+                await seed_database(mongo.database_uri, uids)
+                variables = {
+                    "ENV": "local",
+                    "SERVICE_NAME": "domain-payment-benchmark",
+                    "SERVICE_TAG": "benchmark",
+                    "PROJECT_ID": PROJECT_ID,
+                    "GOOGLE_CLOUD_PROJECT": PROJECT_ID,
+                    "GOOGLE_APPLICATION_CREDENTIALS": create_service_account_file(directory, PROJECT_ID),
+                    "DB_URI": mongo.database_uri,
+                    "CLIENT_ID": "benchmark",
+                    "CLIENT_SECRET": "benchmark",
+                    "PIX_BASE_URL": efi.base_url,
+                    "PIX_CERTIFICATE_FILE": certificates.client_certificate_file,
+                    "PIX_CA_FILE": certificates.ca_file,
+                    "PIX_QRCODE_BUCKET_NAME": BUCKET_NAME,
+                    "PIX_QRCODE_DELIVERY": arguments.delivery,
+                    "PIX_QRCODE_BASE_URL": f"http://127.0.0.1:{app_port}",
+                    "STORAGE_API_ROOT": storage.base_url,
+                    "FIREBASE_PUBLIC_KEYS_URL": firebase.public_keys_url,
+                    "FIREBASE_AUTH_EMULATOR_HOST": firebase.emulator_host,
+                    "METRICS_TOKEN": "benchmark",
+                    "CACHE_BACKEND": arguments.cache_backend,
+                    "CACHE_REDIS_URL": redis.url,
+                }
+                yield LocalEnvironment(variables=variables, firebase=firebase, uids=uids)
+        finally:
+            await asyncio.gather(*(fake.close() for fake in fakes))
@@ -0,0 +1,341 @@
+import asyncio
+import base64
+import datetime
+import io
+import json
+import math
+import random
+import ssl
+import time
+import uuid
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import jwt
+import segno
+from aiohttp import web
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+
+
+class Certificates(NamedTuple):
+    ca_file: str
+    server_certificate_file: str
+    server_key_file: str
+    client_certificate_file: str
+
+
+class FaultInjection(NamedTuple):
+    latency: float = 0.0
+    error_rate: float = 0.0
+
+
+def generate_private_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def private_key_pem(private_key: rsa.RSAPrivateKey) -> bytes:
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+
+def generate_certificates(directory: str) -> Certificates:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    ca_key = generate_private_key()
+    ca_name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "Benchmark CA")])
+    ca_certificate = (
+        x509.CertificateBuilder()
+        .subject_name(ca_name)
+        .issuer_name(ca_name)
+        .public_key(ca_key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(ca_key, hashes.SHA256())
+    )
+
+    def issue(common_name: str, server: bool) -> tuple[bytes, bytes]:
+        key = generate_private_key()
+        builder = (
+            x509.CertificateBuilder()
+            .subject_name(x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, common_name)]))
+            .issuer_name(ca_name)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(now + datetime.timedelta(days=1))
+        )
+        if server:
+            builder = builder.add_extension(
+                x509.SubjectAlternativeName([x509.DNSName("localhost")]),
+                critical=False,
+            )
+        certificate = builder.sign(ca_key, hashes.SHA256())
+        return certificate.public_bytes(serialization.Encoding.PEM), private_key_pem(key)
+
+    server_certificate, server_key = issue("localhost", server=True)
+    client_certificate, client_key = issue("domain-payment", server=False)
+    files = {
+        "ca.pem": ca_certificate.public_bytes(serialization.Encoding.PEM),
+        "server.pem": server_certificate,
+        "server.key": server_key,
+        "client.pem": client_certificate + client_key,
+    }
+    for name, content in files.items():
+        (Path(directory) / name).write_bytes(content)
+    return Certificates(
+        ca_file=str(Path(directory) / "ca.pem"),
+        server_certificate_file=str(Path(directory) / "server.pem"),
+        server_key_file=str(Path(directory) / "server.key"),
+        client_certificate_file=str(Path(directory) / "client.pem"),
+    )
+
+
+def create_service_account_file(directory: str, project_id: str) -> str:
+    service_file = Path(directory) / "service_account.json"
+    service_data = {
+        "type": "service_account",
+        "project_id": project_id,
+        "private_key_id": "benchmark",
+        "private_key": private_key_pem(generate_private_key()).decode(),
+        "client_email": f"benchmark@{project_id}.iam.gserviceaccount.com",
+        "client_id": "benchmark",
+        "token_uri": "http://localhost/token",
+    }
+    service_file.write_text(json.dumps(service_data), encoding="utf-8")
+    return str(service_file)
+
+
+class FakeServer:
+    def __init__(self, faults: FaultInjection = FaultInjection()) -> None:
+        self.faults = faults
+        self.requests = 0
+        self.app = web.Application(middlewares=[self.__inject_faults])
+        self.__runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    async def start(self, ssl_context: ssl.SSLContext | None = None) -> str:
+        self.__runner = web.AppRunner(self.app, access_log=None)
+        await self.__runner.setup()
+        site = web.TCPSite(self.__runner, "localhost", 0, ssl_context=ssl_context)
+        await site.start()
+        port = self.__runner.addresses[0][1]
+        self.base_url = f"{'https' if ssl_context else 'http'}://localhost:{port}"
+        return self.base_url
+
+    async def close(self) -> None:
+        if self.__runner is not None:
+            await self.__runner.cleanup()
+
+    @web.middleware
+    async def __inject_faults(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        self.requests += 1
+        if self.faults.latency:
+            await asyncio.sleep(self.faults.latency)
+        if self.faults.error_rate and random.random() < self.faults.error_rate:
+            return web.json_response({"nome": "erro_interno"}, status=500)
+        return await handler(request)
+
+
+class FakeEfi(FakeServer):
+    def __init__(self, certificates: Certificates, faults: FaultInjection = FaultInjection()) -> None:
+        super().__init__(faults)
+        self.__certificates = certificates
+        self.__charges: dict[int, dict[str, Any]] = {}
+        self.__qrcode_image = self.__render_qrcode_image()
+        self.app.add_routes(
+            [
+                web.post("/oauth/token", self.__token),
+                web.post("/v2/cob", self.__create_charge),
+                web.get("/v2/loc/{location_id}/qrcode", self.__qrcode),
+            ]
+        )
+
+    async def start(self, ssl_context: ssl.SSLContext | None = None) -> str:
+        server_context = ssl_context or ssl.create_default_context(
+            ssl.Purpose.CLIENT_AUTH, cafile=self.__certificates.ca_file
+        )
+        server_context.verify_mode = ssl.CERT_REQUIRED
+        server_context.load_cert_chain(self.__certificates.server_certificate_file, self.__certificates.server_key_file)
+        return await super().start(server_context)
+
+    async def __token(self, _: web.Request) -> web.Response:
+        return web.json_response({"access_token": uuid.uuid4().hex, "token_type": "Bearer", "expires_in": 3600})
+
+    async def __create_charge(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        location_id = len(self.__charges) + 1
+        txid = uuid.uuid4().hex
+        pix_copy_paste = f"00020101021226830014BR.GOV.BCB.PIX2561benchmark/{txid}5204000053039865802BR6304ABCD"
+        charge = {
+            **body,
+            "txid": txid,
+            "status": "ATIVA",
+            "loc": {"id": location_id},
+            "pixCopiaECola": pix_copy_paste,
+        }
+        self.__charges[location_id] = charge
+        return web.json_response(charge, status=201)
+
+    async def __qrcode(self, request: web.Request) -> web.Response:
+        charge = self.__charges.get(int(request.match_info["location_id"]))
+        if charge is None:
+            return web.json_response({"nome": "location_nao_encontrada"}, status=404)
+        return web.json_response(
+            {
+                "qrcode": charge["pixCopiaECola"],
+                "imagemQrcode": f"data:image/png;base64,{self.__qrcode_image}",
+            }
+        )
+
+    @staticmethod
+    def __render_qrcode_image() -> str:
+        image = io.BytesIO()
+        segno.make("benchmark", error="m").save(image, kind="png", scale=6)
+        return base64.b64encode(image.getvalue()).decode()
+
+
+class FakeStorage(FakeServer):
+    def __init__(self, faults: FaultInjection = FaultInjection()) -> None:
+        super().__init__(faults)
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.app.add_routes(
+            [
+                web.get("/storage/v1/b/{bucket}", self.__bucket),
+                web.post("/upload/storage/v1/b/{bucket}/o", self.__upload),
+            ]
+        )
+
+    async def __bucket(self, request: web.Request) -> web.Response:
+        bucket = request.match_info["bucket"]
+        return web.json_response({"kind": "storage#bucket", "id": bucket, "name": bucket})
+
+    async def __upload(self, request: web.Request) -> web.Response:
+        bucket = request.match_info["bucket"]
+        name = request.query["name"]
+        self.objects[(bucket, name)] = await request.read()
+        return web.json_response({"bucket": bucket, "name": name, "size": str(len(self.objects[(bucket, name)]))})
+
+
+class FakeFirebase(FakeServer):
+    KEY_ID = "benchmark"
+
+    def __init__(self, project_id: str, faults: FaultInjection = FaultInjection()) -> None:
+        super().__init__(faults)
+        self.__project_id = project_id
+        self.__private_key = generate_private_key()
+        self.users: dict[str, str] = {}
+        self.app.add_routes(
+            [
+                web.get("/jwks", self.__jwks),
+                web.post(f"/identitytoolkit.googleapis.com/v1/projects/{project_id}/accounts:lookup", self.__lookup),
+            ]
+        )
+
+    @property
+    def public_keys_url(self) -> str:
+        return f"{self.base_url}/jwks"
+
+    @property
+    def emulator_host(self) -> str:
+        return self.base_url.removeprefix("http://")
+
+    def issue_token(self, uid: str) -> str:
+        now = int(time.time())
+        claims = {
+            "iss": f"https://securetoken.google.com/{self.__project_id}",
+            "aud": self.__project_id,
+            "sub": uid,
+            "auth_time": now - 60,
+            "iat": now - 60,
+            "exp": now + 3600,
+        }
+        return jwt.encode(claims, self.__private_key, algorithm="RS256", headers={"kid": self.KEY_ID})
+
+    async def __jwks(self, _: web.Request) -> web.Response:
+        jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(self.__private_key.public_key()))
+        keys = {"keys": [{**jwk, "kid": self.KEY_ID, "alg": "RS256", "use": "sig"}]}
+        return web.json_response(keys, headers={"Cache-Control": "public, max-age=3600"})
+
+    async def __lookup(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        users = [
+            {"localId": uid, "displayName": self.users[uid], "disabled": False}
+            for uid in body.get("localId", [])
+            if uid in self.users
+        ]
+        return web.json_response({"kind": "identitytoolkit#GetAccountInfoResponse", "users": users})
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[bytes, tuple[bytes, float]] = {}
+        self.commands = 0
+        self.__server: asyncio.Server | None = None
+        self.url = ""
+
+    async def start(self) -> str:
+        self.__server = await asyncio.start_server(self.__serve, "127.0.0.1", 0)
+        port = self.__server.sockets[0].getsockname()[1]
+        self.url = f"redis://127.0.0.1:{port}/0"
+        return self.url
+
+    async def close(self) -> None:
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+
+    async def __serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                command = await self.__read_command(reader)
+                self.commands += 1
+                writer.write(self.__execute(command))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    @staticmethod
+    async def __read_command(reader: asyncio.StreamReader) -> list[bytes]:
+        header = await reader.readuntil(b"\r\n")
+        arguments = []
+        for _ in range(int(header[1:-2])):
+            length = int((await reader.readuntil(b"\r\n"))[1:-2])
+            arguments.append((await reader.readexactly(length + 2))[:-2])
+        return arguments
+
+    def __execute(self, command: list[bytes]) -> bytes:
+        name, arguments = command[0].upper(), command[1:]
+        if name == b"GET":
+            return self.__bulk(self.__get(arguments[0]))
+        if name == b"MGET":
+            return b"*%d\r\n" % len(arguments) + b"".join(self.__bulk(self.__get(key)) for key in arguments)
+        if name == b"SET":
+            expires_at = math.inf
+            if len(arguments) == 4 and arguments[2].upper() == b"PX":
+                expires_at = time.time() + int(arguments[3]) / 1000
+            self.values[arguments[0]] = (arguments[1], expires_at)
+            return b"+OK\r\n"
+        if name == b"DEL":
+            return b":%d\r\n" % sum(self.values.pop(key, None) is not None for key in arguments)
+        if name == b"PING":
+            return b"+PONG\r\n"
+        if name in (b"CLIENT", b"SELECT"):
+            return b"+OK\r\n"
+        return b"-ERR unknown command '%s'\r\n" % name
+
+    def __get(self, key: bytes) -> bytes | None:
+        value = self.values.get(key)
+        if value is None or time.time() >= value[1]:
+            return None
+        return value[0]
+
+    @staticmethod
+    def __bulk(value: bytes | None) -> bytes:
+        return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
@@ -0,0 +1,71 @@
+import asyncio
+import shutil
+import socket
+import tempfile
+from types import TracebackType
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import PyMongoError
+
+
+class LocalMongo:
+    STARTUP_TIMEOUT = 30.0
+
+    def __init__(self, database_uri: str | None) -> None:
+        self.database_uri = database_uri or ""
+        self.__process: asyncio.subprocess.Process | None = None
+        self.__directory: tempfile.TemporaryDirectory[str] | None = None
+
+    async def __aenter__(self) -> "LocalMongo":
+        if not self.database_uri:
+            await self.__spawn()
+        await self.__wait_until_ready()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self.__process is not None:
+            self.__process.terminate()
+            await self.__process.wait()
+        if self.__directory is not None:
+            self.__directory.cleanup()
+
+    async def __spawn(self) -> None:
+        mongod = shutil.which("mongod")
+        if mongod is None:
+            raise RuntimeError("mongod was not found on PATH, start one and pass its URI with --db-uri")
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        self.__directory = tempfile.TemporaryDirectory(prefix="domain-payment-mongo-")
+        self.__process = await asyncio.create_subprocess_exec(
+            mongod,
+            "--dbpath",
+            self.__directory.name,
+            "--bind_ip",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        self.database_uri = f"mongodb://127.0.0.1:{port}"
+
+    async def __wait_until_ready(self) -> None:
+        client: AsyncIOMotorClient = AsyncIOMotorClient(self.database_uri, serverSelectionTimeoutMS=500)
+        deadline = asyncio.get_running_loop().time() + self.STARTUP_TIMEOUT
+        try:
+            while True:
+                try:
+                    await client.admin.command("ping")
+                    return
+                except PyMongoError:
+                    if asyncio.get_running_loop().time() >= deadline:
+                        raise
+                    await asyncio.sleep(0.2)
+        finally:
+            client.close()
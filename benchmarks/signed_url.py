@@ -0,0 +1,71 @@
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from aiohttp import ClientSession
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from gcloud.aio.storage import Storage
+
+from domain_payment.frameworks.circuit_breaker import CircuitBreakerConfig
+from domain_payment.frameworks.gcp_storage.manager import GCPStorageFrameworkConfig, V4UrlSigner
+
+ITERATIONS = 2000
+
+
+def create_service_file(directory: str) -> str:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    service_file = Path(directory) / "service_account.json"
+    service_data = {
+        "type": "service_account",
+        "project_id": "benchmark",
+        "private_key_id": "benchmark",
+        "private_key": pem,
+        "client_email": "benchmark@benchmark.iam.gserviceaccount.com",
+        "token_uri": "https://oauth2.googleapis.com/token",
+    }
+    service_file.write_text(json.dumps(service_data), encoding="utf-8")
+    return str(service_file)
+
+
+def report(label: str, started_at: float) -> None:
+    elapsed = (time.perf_counter() - started_at) / ITERATIONS
+    print(f"{label:<24} {elapsed * 1000:.4f} ms/url")
+
+
+async def benchmark_signer(signer: V4UrlSigner) -> None:
+    started_at = time.perf_counter()
+    for index in range(ITERATIONS):
+        await signer.sign("benchmark", f"pixQRCodeImages/{index}.png", 1800)
+    report("local V4 signature", started_at)
+
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        config = GCPStorageFrameworkConfig(
+            storage_credentials=create_service_file(directory),
+            api_root=None,
+            service_account_email=None,
+            signed_url_expiration=1800,
+            upload_queue_size=1000,
+            upload_workers=4,
+            upload_retries=3,
+            upload_retry_backoff=0.5,
+            upload_drain_timeout=10.0,
+            circuit_breaker=CircuitBreakerConfig(failure_threshold=5, reset_timeout=30, call_timeout=10),
+        )
+        async with ClientSession() as session:
+            storage = Storage(session=session, service_file=config["storage_credentials"])  # type: ignore
+            signer = V4UrlSigner(config, storage, session)
+            await benchmark_signer(signer)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
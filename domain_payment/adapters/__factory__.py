@@ -1,26 +1,42 @@
+import asyncio
 from abc import ABCMeta, abstractmethod
 from typing import Generic, TypeVar
 
 from fastapi import FastAPI
 
-from domain_payment.business.__factory__ import AdaptersFactoryInterface
+from domain_payment.business.__factory__ import AdaptersFactoryInterface, Lifetime, scoped
 
 from .controllers.__binding__ import Binding
 from .interface_adapters import (
     AccountAdapter,
     AccountProviders,
     AdminAdapter,
+    AdminAdapterConfig,
+    AdminConfigurationCache,
     AdminProviders,
+    ChargeAdapter,
+    ChargeAdapterConfig,
+    ChargeProviders,
+    IdempotencyAdapter,
+    IdempotencyAdapterConfig,
+    IdempotencyProviders,
     PaymentAdapter,
     PaymentAdapterConfig,
     PaymentProviders,
+    WarmupAdapter,
+    WarmupAdapterConfig,
+    WarmupProviders,
 )
 from .interface_adapters.interfaces import (
     AuthenticationProvider,
     BucketProvider,
+    CacheProvider,
     DocumentDatabaseProvider,
+    MetricsProvider,
     PixProvider,
+    QRCodeProvider,
     UserProvider,
+    WarmupProvider,
 )
 
 T_database_co = TypeVar("T_database_co", bound=DocumentDatabaseProvider, covariant=True)
@@ -28,10 +44,22 @@ T_bucket_co = TypeVar("T_bucket_co", bound=BucketProvider, covariant=True)
 T_authentication_co = TypeVar("T_authentication_co", bound=AuthenticationProvider, covariant=True)
 T_user_co = TypeVar("T_user_co", bound=UserProvider, covariant=True)
 T_pix_provider_co = TypeVar("T_pix_provider_co", bound=PixProvider, covariant=True)
+T_qrcode_provider_co = TypeVar("T_qrcode_provider_co", bound=QRCodeProvider, covariant=True)
+T_metrics_provider_co = TypeVar("T_metrics_provider_co", bound=MetricsProvider, covariant=True)
+T_cache_provider_co = TypeVar("T_cache_provider_co", bound=CacheProvider, covariant=True)
 
 
 class FrameworksFactoryInterface(
-    Generic[T_database_co, T_bucket_co, T_authentication_co, T_user_co, T_pix_provider_co],
+    Generic[
+        T_database_co,
+        T_bucket_co,
+        T_authentication_co,
+        T_user_co,
+        T_pix_provider_co,
+        T_qrcode_provider_co,
+        T_metrics_provider_co,
+        T_cache_provider_co,
+    ],
     metaclass=ABCMeta,
 ):
     @abstractmethod
@@ -49,33 +77,107 @@ class FrameworksFactoryInterface(
     @abstractmethod
     def pix_provider(self) -> T_pix_provider_co: ...
 
+    @abstractmethod
+    def qrcode_provider(self) -> T_qrcode_provider_co: ...
 
-class AdaptersConfig(PaymentAdapterConfig): ...
+    @abstractmethod
+    def metrics_provider(self) -> T_metrics_provider_co: ...
 
+    @abstractmethod
+    def cache_provider(self) -> T_cache_provider_co: ...
 
-class AdaptersFactory(AdaptersFactoryInterface[PaymentAdapter, AccountAdapter, AdminAdapter]):
+    @abstractmethod
+    def warmup_providers(self) -> list[WarmupProvider]: ...
+
+
+class AdaptersConfig:  # pylint: disable=R0902
+    def __init__(
+        self,
+        *,
+        payment_adapter_config: PaymentAdapterConfig,
+        admin_adapter_config: AdminAdapterConfig,
+        idempotency_adapter_config: IdempotencyAdapterConfig,
+        charge_adapter_config: ChargeAdapterConfig,
+        warmup_adapter_config: WarmupAdapterConfig,
+        pix_webhook_secret: str | None,
+        metrics_token: str | None,
+        request_timeout: float,
+    ) -> None:
+        self.payment_adapter_config = payment_adapter_config
+        self.admin_adapter_config = admin_adapter_config
+        self.idempotency_adapter_config = idempotency_adapter_config
+        self.charge_adapter_config = charge_adapter_config
+        self.warmup_adapter_config = warmup_adapter_config
+        self.pix_webhook_secret = pix_webhook_secret
+        self.metrics_token = metrics_token
+        self.request_timeout = request_timeout
+
+
+class AdaptersFactory(
+    AdaptersFactoryInterface[PaymentAdapter, AccountAdapter, AdminAdapter, IdempotencyAdapter, ChargeAdapter]
+):
     def __init__(self, frameworks_factory: FrameworksFactoryInterface, config: AdaptersConfig) -> None:
         self.__factory = frameworks_factory
         self.__config = config
+        self.__admin_configuration = AdminConfigurationCache(
+            config.admin_adapter_config, frameworks_factory.cache_provider()
+        )
 
+    async def connect(self) -> None:
+        await asyncio.gather(
+            self.idempotency_service().create_indexes(),
+            self.charge_service().create_indexes(),
+        )
+
+    async def close(self) -> None:
+        self.__admin_configuration.close()
+        await self.charge_service().close()
+
+    @scoped(Lifetime.WORKER)
     def admin_service(self) -> AdminAdapter:
-        admin_providers = AdminProviders(document_database_provider=self.__factory.database_provider())
-        return AdminAdapter(admin_providers)
+        admin_providers = AdminProviders(
+            document_database_provider=self.__factory.database_provider(),
+            metrics_provider=self.__factory.metrics_provider(),
+        )
+        return AdminAdapter(admin_providers, self.__admin_configuration)
 
+    @scoped(Lifetime.WORKER)
     def account_service(self) -> AccountAdapter:
         account_providers = AccountProviders(
             document_database_provider=self.__factory.database_provider(),
             user_provider=self.__factory.user_provider(),
+            metrics_provider=self.__factory.metrics_provider(),
         )
         return AccountAdapter(account_providers)
 
+    @scoped(Lifetime.WORKER)
     def payment_service(self) -> PaymentAdapter:
         payment_providers = PaymentProviders(
             pix_provider=self.__factory.pix_provider(),
             bucket_provider=self.__factory.bucket_provider(),
+            qrcode_provider=self.__factory.qrcode_provider(),
+        )
+        return PaymentAdapter(payment_providers, self.__config.payment_adapter_config)
+
+    @scoped(Lifetime.WORKER)
+    def idempotency_service(self) -> IdempotencyAdapter:
+        idempotency_providers = IdempotencyProviders(document_database_provider=self.__factory.database_provider())
+        return IdempotencyAdapter(idempotency_providers, self.__config.idempotency_adapter_config)
+
+    @scoped(Lifetime.WORKER)
+    def charge_service(self) -> ChargeAdapter:
+        charge_providers = ChargeProviders(document_database_provider=self.__factory.database_provider())
+        return ChargeAdapter(charge_providers, self.__config.charge_adapter_config)
+
+    @scoped(Lifetime.WORKER)
+    def warmup_service(self) -> WarmupAdapter:
+        warmup_providers = WarmupProviders(
+            warmup_providers=[*self.__factory.warmup_providers(), self.admin_service(), self.payment_service()],
         )
-        return PaymentAdapter(payment_providers, self.__config)
+        return WarmupAdapter(warmup_providers, self.__config.warmup_adapter_config)
+
+    def register_routes(self, app: FastAPI) -> None:
+        Binding().register_all(app, self.__config.request_timeout)
 
-    @staticmethod
-    def register_routes(app: FastAPI) -> None:
-        Binding().register_all(app)
+    def register_metrics(self, app: FastAPI) -> None:
+        Binding().register_metrics(app, self.__factory.metrics_provider())
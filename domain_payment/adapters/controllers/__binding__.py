@@ -1,8 +1,23 @@
 from fastapi.applications import FastAPI
 
+from domain_payment.adapters.interface_adapters.interfaces import MetricsProvider
+
+from .__middlewares__ import DeadlineMiddleware, RequestMetricsMiddleware
+from .charge_controller import charge_controller
+from .metrics_controller import metrics_controller
 from .pix_controller import account_controller
+from .warmup_controller import warmup_controller
+from .webhook_controller import webhook_controller
 
 
 class Binding:
-    def register_all(self, app: FastAPI) -> None:
+    def register_all(self, app: FastAPI, request_timeout: float) -> None:
+        app.add_middleware(DeadlineMiddleware, request_timeout=request_timeout)
         app.include_router(account_controller)
+        app.include_router(charge_controller)
+        app.include_router(webhook_controller)
+        app.include_router(warmup_controller)
+
+    def register_metrics(self, app: FastAPI, metrics_provider: MetricsProvider) -> None:
+        app.add_middleware(RequestMetricsMiddleware, metrics_provider=metrics_provider)
+        app.include_router(metrics_controller)
@@ -1,19 +1,46 @@
+import hmac
 from abc import ABCMeta
-from typing import Any
+from typing import Any, Callable
 
-from fastapi import Depends, status
+from fastapi import Depends, Query, status
 from fastapi.exceptions import HTTPException
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from domain_payment.adapters.interface_adapters.interfaces import AuthenticationProvider, BearerToken
+from domain_payment.adapters.interface_adapters.interfaces import (
+    AuthenticationProvider,
+    BearerToken,
+    MetricsProvider,
+    UserUid,
+    WarmupProvider,
+)
 from domain_payment.business.__factory__ import BusinessFactory
-from domain_payment.business.use_case import ChargePixUseCase
+from domain_payment.business.use_case import (
+    ChargePixBatchUseCase,
+    ChargePixUseCase,
+    ListChargesUseCase,
+    PixQRCodeImageUseCase,
+    ReceivePixPaymentsUseCase,
+    RetrieveChargeUseCase,
+)
 
 
 def bind_controller_dependencies(
-    business_factory: BusinessFactory, authentication_service: AuthenticationProvider
+    business_factory: BusinessFactory,
+    authentication_service: AuthenticationProvider,
+    metrics_service: MetricsProvider,
+    warmup_service: Callable[[], WarmupProvider],
+    *,
+    pix_webhook_secret: str | None = None,
+    metrics_token: str | None = None,
 ) -> None:
-    _ControllerDependencyManager(business_factory, authentication_service)
+    _ControllerDependencyManager(
+        business_factory,
+        authentication_service,
+        metrics_service,
+        warmup_service,
+        pix_webhook_secret=pix_webhook_secret,
+        metrics_token=metrics_token,
+    )
 
 
 class ControllerDependencyManagerIsNotInitializedException(RuntimeError):
@@ -37,38 +64,158 @@ class _ControllerDependencyManager(metaclass=_Singleton):
         self,
         business_factory: BusinessFactory | None = None,
         authentication_service: AuthenticationProvider | None = None,
+        metrics_service: MetricsProvider | None = None,
+        warmup_service: Callable[[], WarmupProvider] | None = None,
+        *,
+        pix_webhook_secret: str | None = None,
+        metrics_token: str | None = None,
     ) -> None:
         if business_factory:
             self.__factory = business_factory
         if authentication_service:
             self.__auth = authentication_service
+        if metrics_service:
+            self.__metrics = metrics_service
+        self.__warmup = warmup_service
+        self.pix_webhook_secret = pix_webhook_secret
+        self.metrics_token = metrics_token
 
     def auth_service(self) -> AuthenticationProvider:
         if self.__auth:
             return self.__auth
         raise ControllerDependencyManagerIsNotInitializedException()
 
+    def metrics_service(self) -> MetricsProvider:
+        if self.__metrics:
+            return self.__metrics
+        raise ControllerDependencyManagerIsNotInitializedException()
+
+    def warmup_service(self) -> WarmupProvider:
+        if self.__warmup is not None:
+            return self.__warmup()
+        raise ControllerDependencyManagerIsNotInitializedException()
+
     def charge_pix_use_case(self) -> ChargePixUseCase:
         if self.__factory:
             return self.__factory.charge_pix_use_case()
         raise ControllerDependencyManagerIsNotInitializedException()
 
+    def charge_pix_batch_use_case(self) -> ChargePixBatchUseCase:
+        if self.__factory:
+            return self.__factory.charge_pix_batch_use_case()
+        raise ControllerDependencyManagerIsNotInitializedException()
+
+    def pix_qrcode_image_use_case(self) -> PixQRCodeImageUseCase:
+        if self.__factory:
+            return self.__factory.pix_qrcode_image_use_case()
+        raise ControllerDependencyManagerIsNotInitializedException()
+
+    def retrieve_charge_use_case(self) -> RetrieveChargeUseCase:
+        if self.__factory:
+            return self.__factory.retrieve_charge_use_case()
+        raise ControllerDependencyManagerIsNotInitializedException()
+
+    def list_charges_use_case(self) -> ListChargesUseCase:
+        if self.__factory:
+            return self.__factory.list_charges_use_case()
+        raise ControllerDependencyManagerIsNotInitializedException()
+
+    def receive_pix_payments_use_case(self) -> ReceivePixPaymentsUseCase:
+        if self.__factory:
+            return self.__factory.receive_pix_payments_use_case()
+        raise ControllerDependencyManagerIsNotInitializedException()
+
+
+async def _authenticate(
+    credential: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False)),
+) -> UserUid:
+    auth = _ControllerDependencyManager().auth_service()
+    if credential is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Bearer authentication is needed",
+            headers={"WWW-Authenticate": 'Bearer realm="auth_required"'},
+        )
+    bearer_token = BearerToken(credential.credentials)
+    return await auth.authenticate_by_token(bearer_token)
+
+
+async def _authenticate_back_office(
+    credential: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False)),
+) -> UserUid:
+    auth = _ControllerDependencyManager().auth_service()
+    if credential is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Bearer authentication is needed",
+            headers={"WWW-Authenticate": 'Bearer realm="auth_required"'},
+        )
+    bearer_token = BearerToken(credential.credentials)
+    return await auth.authenticate_back_office_by_token(bearer_token)
+
 
 class _ControllerDependency(metaclass=ABCMeta):
-    def __init__(self, credential: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False))) -> None:
+    def __init__(self, uid: UserUid = Depends(_authenticate)) -> None:
         self._dependency_manager = _ControllerDependencyManager()
-        auth = self._dependency_manager.auth_service()
-        if credential is None:
+        self.uid = uid
+
+
+class RegisterControllerDependencies(_ControllerDependency):
+    def __init__(self, uid: UserUid = Depends(_authenticate)) -> None:
+        super().__init__(uid)
+        self.charge_pix_use_case: ChargePixUseCase = self._dependency_manager.charge_pix_use_case()
+
+
+class ChargePixBatchControllerDependencies(_ControllerDependency):
+    def __init__(self, uid: UserUid = Depends(_authenticate_back_office)) -> None:
+        super().__init__(uid)
+        self.charge_pix_batch_use_case: ChargePixBatchUseCase = self._dependency_manager.charge_pix_batch_use_case()
+
+
+class RetrieveChargeControllerDependencies(_ControllerDependency):
+    def __init__(self, uid: UserUid = Depends(_authenticate)) -> None:
+        super().__init__(uid)
+        self.retrieve_charge_use_case: RetrieveChargeUseCase = self._dependency_manager.retrieve_charge_use_case()
+
+
+class ListChargesControllerDependencies(_ControllerDependency):
+    def __init__(self, uid: UserUid = Depends(_authenticate)) -> None:
+        super().__init__(uid)
+        self.list_charges_use_case: ListChargesUseCase = self._dependency_manager.list_charges_use_case()
+
+
+class PixQRCodeImageControllerDependencies:
+    def __init__(self) -> None:
+        dependency_manager = _ControllerDependencyManager()
+        self.pix_qrcode_image_use_case: PixQRCodeImageUseCase = dependency_manager.pix_qrcode_image_use_case()
+
+
+class PixWebhookControllerDependencies:
+    def __init__(self, secret: str | None = Query(None, alias="hmac")) -> None:
+        dependency_manager = _ControllerDependencyManager()
+        expected_secret = dependency_manager.pix_webhook_secret
+        if not expected_secret or not hmac.compare_digest((secret or "").encode(), expected_secret.encode()):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid webhook secret")
+        self.receive_pix_payments_use_case: ReceivePixPaymentsUseCase = (
+            dependency_manager.receive_pix_payments_use_case()
+        )
+
+
+class MetricsControllerDependencies:
+    def __init__(self, credential: HTTPAuthorizationCredentials | None = Depends(HTTPBearer(auto_error=False))) -> None:
+        dependency_manager = _ControllerDependencyManager()
+        expected_token = dependency_manager.metrics_token
+        token = credential.credentials if credential is not None else ""
+        if not expected_token or not hmac.compare_digest(token.encode(), expected_token.encode()):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Bearer authentication is needed",
-                headers={"WWW-Authenticate": 'Bearer realm="auth_required"'},
+                detail="Invalid metrics token",
+                headers={"WWW-Authenticate": 'Bearer realm="metrics"'},
             )
-        bearer_token = BearerToken(credential.credentials)
-        self.uid = auth.authenticate_by_token(bearer_token)
+        self.metrics_provider: MetricsProvider = dependency_manager.metrics_service()
 
 
-class RegisterControllerDependencies(_ControllerDependency):
-    def __init__(self, credential: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False))) -> None:
-        super().__init__(credential)
-        self.charge_pix_use_case: ChargePixUseCase = self._dependency_manager.charge_pix_use_case()
+class WarmupControllerDependencies:
+    def __init__(self) -> None:
+        dependency_manager = _ControllerDependencyManager()
+        self.warmup_provider: WarmupProvider = dependency_manager.warmup_service()
@@ -0,0 +1,83 @@
+import asyncio
+import time
+
+import pymongo
+from fastapi import status
+from fastapi.responses import JSONResponse
+from pymongo.errors import PyMongoError
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from domain_payment.adapters.interface_adapters.interfaces import MetricsProvider
+from domain_payment.types.deadline import request_deadline
+
+
+class DeadlineMiddleware:
+    HEADER = "X-Request-Timeout"
+    UNBOUNDED_PATHS = frozenset({"/charge-pix/batch"})
+
+    def __init__(self, app: ASGIApp, request_timeout: float) -> None:
+        self.__app = app
+        self.__request_timeout = request_timeout
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.UNBOUNDED_PATHS:
+            await self.__app(scope, receive, send)
+            return
+        timeout = self.__timeout(Headers(scope=scope))
+        response_started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            response_started = response_started or message["type"] == "http.response.start"
+            await send(message)
+
+        expires_at = time.monotonic() + timeout
+        try:
+            with request_deadline(timeout), pymongo.timeout(timeout):
+                async with asyncio.timeout(timeout):
+                    await self.__app(scope, receive, send_tracking_start)
+        except (TimeoutError, PyMongoError) as error:
+            if response_started or (isinstance(error, PyMongoError) and not error.timeout):
+                raise
+            if time.monotonic() < expires_at:
+                raise
+            content = {"msg": "error", "errors": {"DeadlineExceeded": "The request did not finish in time"}}
+            await JSONResponse(status_code=status.HTTP_504_GATEWAY_TIMEOUT, content=content)(scope, receive, send)
+
+    def __timeout(self, headers: Headers) -> float:
+        try:
+            requested_timeout = float(headers.get(self.HEADER, self.__request_timeout))
+        except ValueError:
+            return self.__request_timeout
+        if requested_timeout <= 0:
+            return self.__request_timeout
+        return min(requested_timeout, self.__request_timeout)
+
+
+class RequestMetricsMiddleware:
+    UNMATCHED_ROUTE = "unmatched"
+
+    def __init__(self, app: ASGIApp, metrics_provider: MetricsProvider) -> None:
+        self.__app = app
+        self.__metrics = metrics_provider
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.__app(scope, receive, send)
+            return
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        started_at = time.perf_counter()
+
+        async def send_tracking_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.__app(scope, receive, send_tracking_status)
+        finally:
+            route = scope.get("route")
+            route_path = getattr(route, "path", self.UNMATCHED_ROUTE)
+            self.__metrics.observe_request(scope["method"], route_path, status_code, time.perf_counter() - started_at)
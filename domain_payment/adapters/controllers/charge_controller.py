@@ -0,0 +1,44 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi.responses import JSONResponse
+
+from domain_payment.adapters.controllers.__dependencies__ import (
+    ListChargesControllerDependencies,
+    RetrieveChargeControllerDependencies,
+)
+from domain_payment.adapters.interface_adapters.exceptions import ChargeCursorInvalid, ChargeNotFound
+from domain_payment.business.ports import ListChargesInputPort, RetrieveChargeInputPort
+
+from .dtos import ListChargesOutputDTO, RetrieveChargeOutputDTO
+
+charge_controller = APIRouter()
+
+
+@charge_controller.get("/charges/{txid}", response_model=RetrieveChargeOutputDTO)
+async def retrieve_charge(
+    txid: Annotated[str, Path(pattern=r"^[a-zA-Z0-9]{26,35}$")],
+    dependencies: Annotated[RetrieveChargeControllerDependencies, Depends()],
+) -> JSONResponse | RetrieveChargeOutputDTO:
+    try:
+        input_port = RetrieveChargeInputPort(uid=dependencies.uid, txid=txid)
+        output_port = await dependencies.retrieve_charge_use_case(input_port)
+        return RetrieveChargeOutputDTO(**output_port.model_dump())
+    except ChargeNotFound as not_found:
+        content = {"msg": "error", "errors": {not_found.type: not_found.msg}}
+        return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content=content)
+
+
+@charge_controller.get("/charges", response_model=ListChargesOutputDTO)
+async def list_charges(
+    dependencies: Annotated[ListChargesControllerDependencies, Depends()],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: Annotated[str | None, Query(max_length=256)] = None,
+) -> JSONResponse | ListChargesOutputDTO:
+    try:
+        input_port = ListChargesInputPort(uid=dependencies.uid, limit=limit, cursor=cursor)
+        output_port = await dependencies.list_charges_use_case(input_port)
+        return ListChargesOutputDTO(**output_port.model_dump())
+    except ChargeCursorInvalid as invalid_cursor:
+        content = {"msg": "error", "errors": {invalid_cursor.type: invalid_cursor.msg}}
+        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=content)
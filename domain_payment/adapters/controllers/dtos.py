@@ -1,4 +1,6 @@
-from domain_payment.models import PixChargeResponseModel
+from pydantic import Field
+
+from domain_payment.models import ChargeModel, ChargePageModel, PixChargeResponseModel, PixPaymentModel
 
 from .interfaces import InputDTO, OutputDTO
 
@@ -9,3 +11,31 @@ class ChargePixInputDTO(InputDTO):
 
 class ChargePixOutputDTO(PixChargeResponseModel, OutputDTO):
     msg: str
+
+
+class ChargePixBatchItemDTO(InputDTO):
+    uid: str
+    charge_value: float
+
+
+class ChargePixBatchInputDTO(InputDTO):
+    charges: list[ChargePixBatchItemDTO] = Field(min_length=1, max_length=1000)
+
+
+class RetrieveChargeOutputDTO(ChargeModel, OutputDTO): ...
+
+
+class ListChargesOutputDTO(ChargePageModel, OutputDTO): ...
+
+
+class PixWebhookInputDTO(InputDTO):
+    pix: list[PixPaymentModel] = []
+
+
+class PixWebhookOutputDTO(OutputDTO):
+    msg: str
+
+
+class ReadinessOutputDTO(OutputDTO):
+    ready: bool
+    components: dict[str, bool]
@@ -0,0 +1,13 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from domain_payment.adapters.controllers.__dependencies__ import MetricsControllerDependencies
+
+metrics_controller = APIRouter()
+
+
+@metrics_controller.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(dependencies: Annotated[MetricsControllerDependencies, Depends()]) -> PlainTextResponse:
+    return PlainTextResponse(dependencies.metrics_provider.render(), media_type="text/plain; version=0.0.4")
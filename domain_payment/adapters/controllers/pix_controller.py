@@ -1,14 +1,24 @@
 import logging
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 
-from fastapi import APIRouter, Depends, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Header, Path, status
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic_core import ValidationError
 
-from domain_payment.adapters.controllers.__dependencies__ import RegisterControllerDependencies
-from domain_payment.business.ports import ChargePixInputPort
+from domain_payment.adapters.controllers.__dependencies__ import (
+    ChargePixBatchControllerDependencies,
+    PixQRCodeImageControllerDependencies,
+    RegisterControllerDependencies,
+)
+from domain_payment.adapters.interface_adapters.exceptions import (
+    ChargeNotFound,
+    IdempotencyKeyInProgress,
+    IdempotencyKeyReused,
+    PixQRCodeImageNotFound,
+)
+from domain_payment.business.ports import ChargePixBatchInputPort, ChargePixInputPort, PixQRCodeImageInputPort
 
-from .dtos import ChargePixInputDTO, ChargePixOutputDTO
+from .dtos import ChargePixBatchInputDTO, ChargePixInputDTO, ChargePixOutputDTO
 
 account_controller = APIRouter()
 
@@ -21,11 +31,20 @@ account_controller = APIRouter()
 async def charge_pix(
     dto: ChargePixInputDTO,
     dependencies: Annotated[RegisterControllerDependencies, Depends()],
+    idempotency_key: Annotated[str | None, Header(alias="Idempotency-Key", min_length=1, max_length=255)] = None,
 ) -> JSONResponse | ChargePixOutputDTO:
     try:
-        charge_pix_input_port = ChargePixInputPort(**dto.model_dump(), uid=dependencies.uid)
+        charge_pix_input_port = ChargePixInputPort(
+            **dto.model_dump(), uid=dependencies.uid, idempotency_key=idempotency_key
+        )
         output_port = await dependencies.charge_pix_use_case(charge_pix_input_port)
         return ChargePixOutputDTO(**output_port.model_dump())
+    except IdempotencyKeyInProgress as in_progress:
+        content = {"msg": "error", "errors": {in_progress.type: in_progress.msg}}
+        return JSONResponse(status_code=status.HTTP_409_CONFLICT, content=content)
+    except IdempotencyKeyReused as reused:
+        content = {"msg": "error", "errors": {reused.type: reused.msg}}
+        return JSONResponse(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, content=content)
     except ValidationError as errors:
         output_errors = {}
         for error in errors.errors():
@@ -33,3 +52,42 @@ async def charge_pix(
             logging.info(f"Warning [Register Account] | {error['type']} - {error['msg']}")
         content = {"msg": "error", "errors": output_errors}
         return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=content)
+
+
+@account_controller.post(
+    "/charge-pix/batch",
+    response_class=StreamingResponse,
+    responses={status.HTTP_200_OK: {"content": {"application/x-ndjson": {}}}},
+)
+async def charge_pix_batch(
+    dto: ChargePixBatchInputDTO,
+    dependencies: Annotated[ChargePixBatchControllerDependencies, Depends()],
+) -> StreamingResponse:
+    input_port = ChargePixBatchInputPort(charges=[ChargePixInputPort(**charge.model_dump()) for charge in dto.charges])
+    output_ports = await dependencies.charge_pix_batch_use_case(input_port)
+
+    async def output_lines() -> AsyncIterator[str]:
+        async for output_port in output_ports:
+            yield f"{output_port.model_dump_json(exclude_none=True)}\n"
+
+    return StreamingResponse(output_lines(), media_type="application/x-ndjson")
+
+
+@account_controller.get(
+    "/pix-qrcode/{txid}.png",
+    response_class=Response,
+    responses={status.HTTP_200_OK: {"content": {"image/png": {}}}},
+)
+async def pix_qrcode_image(
+    txid: Annotated[str, Path(pattern=r"^[a-zA-Z0-9]{26,35}$")],
+    dependencies: Annotated[PixQRCodeImageControllerDependencies, Depends()],
+) -> Response:
+    try:
+        output_port = await dependencies.pix_qrcode_image_use_case(PixQRCodeImageInputPort(txid=txid))
+    except (PixQRCodeImageNotFound, ChargeNotFound):
+        return Response(status_code=status.HTTP_404_NOT_FOUND)
+    return Response(
+        content=output_port.image,
+        media_type="image/png",
+        headers={"Cache-Control": "public, max-age=86400, immutable"},
+    )
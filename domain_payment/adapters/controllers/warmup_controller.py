@@ -0,0 +1,27 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
+
+from domain_payment.adapters.controllers.__dependencies__ import WarmupControllerDependencies
+
+from .dtos import ReadinessOutputDTO
+
+warmup_controller = APIRouter()
+
+
+@warmup_controller.get("/_ah/warmup", response_model=ReadinessOutputDTO, include_in_schema=False)
+async def warmup(dependencies: Annotated[WarmupControllerDependencies, Depends()]) -> JSONResponse:
+    await dependencies.warmup_provider.warm_up()
+    return _readiness_response(dependencies.warmup_provider.readiness())
+
+
+@warmup_controller.get("/readiness", response_model=ReadinessOutputDTO, include_in_schema=False)
+async def readiness(dependencies: Annotated[WarmupControllerDependencies, Depends()]) -> JSONResponse:
+    return _readiness_response(dependencies.warmup_provider.readiness())
+
+
+def _readiness_response(components: dict[str, bool]) -> JSONResponse:
+    output = ReadinessOutputDTO(ready=all(components.values()), components=components)
+    status_code = status.HTTP_200_OK if output.ready else status.HTTP_503_SERVICE_UNAVAILABLE
+    return JSONResponse(status_code=status_code, content=output.model_dump())
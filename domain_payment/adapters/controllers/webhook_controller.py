@@ -0,0 +1,25 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
+
+from domain_payment.adapters.controllers.__dependencies__ import PixWebhookControllerDependencies
+from domain_payment.adapters.interface_adapters.exceptions import PixPaymentBufferFull
+from domain_payment.business.ports import ReceivePixPaymentsInputPort
+
+from .dtos import PixWebhookInputDTO, PixWebhookOutputDTO
+
+webhook_controller = APIRouter()
+
+
+@webhook_controller.post("/webhooks/pix", response_model=PixWebhookOutputDTO)
+async def receive_pix_payments(
+    dto: PixWebhookInputDTO,
+    dependencies: Annotated[PixWebhookControllerDependencies, Depends()],
+) -> JSONResponse | PixWebhookOutputDTO:
+    try:
+        output_port = await dependencies.receive_pix_payments_use_case(ReceivePixPaymentsInputPort(pix=dto.pix))
+        return PixWebhookOutputDTO(**output_port.model_dump())
+    except PixPaymentBufferFull as buffer_full:
+        content = {"msg": "error", "errors": {buffer_full.type: buffer_full.msg}}
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=content)
@@ -1,13 +1,28 @@
 from .account_adapter import AccountAdapter, AccountProviders
-from .admin_adapter import AdminAdapter, AdminProviders
-from .payment_adapter import PaymentAdapter, PaymentAdapterConfig, PaymentProviders
+from .admin_adapter import AdminAdapter, AdminAdapterConfig, AdminConfigurationCache, AdminProviders
+from .charge_adapter import ChargeAdapter, ChargeAdapterConfig, ChargeProviders
+from .idempotency_adapter import IdempotencyAdapter, IdempotencyAdapterConfig, IdempotencyProviders
+from .payment_adapter import PaymentAdapter, PaymentAdapterConfig, PaymentProviders, PixQRCodeDelivery
+from .warmup_adapter import WarmupAdapter, WarmupAdapterConfig, WarmupProviders
 
 __all__ = [
     "AccountAdapter",
     "AccountProviders",
     "AdminAdapter",
+    "AdminAdapterConfig",
+    "AdminConfigurationCache",
     "AdminProviders",
+    "ChargeAdapter",
+    "ChargeAdapterConfig",
+    "ChargeProviders",
+    "IdempotencyAdapter",
+    "IdempotencyAdapterConfig",
+    "IdempotencyProviders",
     "PaymentAdapter",
     "PaymentProviders",
     "PaymentAdapterConfig",
+    "PixQRCodeDelivery",
+    "WarmupAdapter",
+    "WarmupAdapterConfig",
+    "WarmupProviders",
 ]
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, NamedTuple
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
@@ -8,6 +9,7 @@ from domain_payment.models import AccountModel, AuthenticatedUserModel
 from .exceptions import UserNotFound
 from .interfaces.document_database_provider import DatabaseName, DocumentDatabaseProvider
 from .interfaces.interfaces import InterfaceAdapter
+from .interfaces.metrics_provider import MetricsProvider
 from .interfaces.user_provider import UserProvider
 
 ProviderType = DocumentDatabaseProvider[AsyncIOMotorClient, AsyncIOMotorDatabase]
@@ -16,18 +18,35 @@ ProviderType = DocumentDatabaseProvider[AsyncIOMotorClient, AsyncIOMotorDatabase
 class AccountProviders(NamedTuple):
     document_database_provider: ProviderType
     user_provider: UserProvider
+    metrics_provider: MetricsProvider
 
 
 class AccountAdapter(InterfaceAdapter, AccountService):
     def __init__(self, providers: AccountProviders) -> None:
-        database_provider = providers.document_database_provider
-        database_provider.database = DatabaseName.ACCOUNT  # type: ignore
-        self.__users_collection = database_provider.database["users"]
+        database = providers.document_database_provider.get_database(DatabaseName.ACCOUNT)
+        self.__users_collection = database["users"]
         self.__user_provider = providers.user_provider
+        self.__metrics = providers.metrics_provider
 
     async def retrieve_user(self, port: AuthenticatedUserModel) -> AccountModel:
-        user: dict[str, Any] | None = await self.__users_collection.find_one({"uid": port.uid})
-        username = await self.__user_provider.get_username(port)
+        user: dict[str, Any] | None
+        with self.__metrics.measure("account_lookup"):
+            user, username = await asyncio.gather(
+                self.__users_collection.find_one({"uid": port.uid}),
+                self.__user_provider.get_username(port),
+            )
         if user:
             return AccountModel(**user, username=username)
         raise UserNotFound()
+
+    async def retrieve_users(self, uids: list[str]) -> dict[str, AccountModel]:
+        users_cursor = self.__users_collection.find({"uid": {"$in": uids}}, {"_id": 0, "uid": 1, "cpf": 1})
+        with self.__metrics.measure("account_lookup"):
+            users, usernames = await asyncio.gather(
+                users_cursor.to_list(None), self.__user_provider.get_usernames(uids)
+            )
+        return {
+            user["uid"]: AccountModel(**user, username=usernames[user["uid"]])
+            for user in users
+            if user["uid"] in usernames
+        }
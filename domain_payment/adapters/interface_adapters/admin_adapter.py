@@ -1,45 +1,130 @@
-from typing import NamedTuple
+import asyncio
+import logging
+import time
+from typing import Any, NamedTuple
 
-from async_property import async_cached_property
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from async_property import async_property
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo.errors import PyMongoError
 
 from domain_payment.business.services import AdminService
+from domain_payment.types.deadline import create_background_task
 
 from .exceptions import AdminIsNotProperlyConfigured
+from .interfaces.cache_provider import CacheProvider
 from .interfaces.document_database_provider import DatabaseName, DocumentDatabaseProvider
 from .interfaces.interfaces import InterfaceAdapter
+from .interfaces.metrics_provider import MetricsProvider
+from .interfaces.warmup_provider import WarmupProvider
 
 ProviderType = DocumentDatabaseProvider[AsyncIOMotorClient, AsyncIOMotorDatabase]
 
 
+class AdminAdapterConfig(NamedTuple):
+    configuration_ttl: float
+
+
 class AdminProviders(NamedTuple):
     document_database_provider: ProviderType
+    metrics_provider: MetricsProvider
+
+
+class AdminConfigurationCache:  # pylint: disable=R0902
+    CACHE_KEY = "admin:payment"
+
+    def __init__(self, config: AdminAdapterConfig, cache_provider: CacheProvider) -> None:
+        self.__logger = logging.getLogger(self.__class__.__name__)
+        self.__ttl = config.configuration_ttl
+        self.__cache = cache_provider
+        self.__document: dict[str, Any] | None = None
+        self.__expiration = 0.0
+        self.__lock = asyncio.Lock()
+        self.__watcher: asyncio.Task[None] | None = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.__document is not None
+
+    async def document(self, collection: AsyncIOMotorCollection) -> dict[str, Any]:
+        if self.__document is None or time.monotonic() >= self.__expiration:
+            async with self.__lock:
+                if self.__document is None or time.monotonic() >= self.__expiration:
+                    await self.__load(collection)
+                    self.__watch(collection)
+        if self.__document is None:
+            raise AdminIsNotProperlyConfigured()
+        return self.__document
+
+    def close(self) -> None:
+        if self.__watcher is not None:
+            self.__watcher.cancel()
 
+    async def __load(self, collection: AsyncIOMotorCollection) -> None:
+        cached = await self.__cache.get(self.CACHE_KEY)
+        if cached is not None:
+            self.__store(cached["document"], cached["expires_at"])
+            return
+        document: dict[str, Any] | None = await collection.find_one()
+        if document is None:
+            raise AdminIsNotProperlyConfigured()
+        await self.__publish(document)
 
-class AdminAdapter(InterfaceAdapter, AdminService):
-    def __init__(self, providers: AdminProviders) -> None:
-        database_provider = providers.document_database_provider
-        database_provider.database = DatabaseName.ADMIN  # type: ignore
-        self.__admin_collection = database_provider.database["payment"]
+    async def __publish(self, document: dict[str, Any]) -> None:
+        expires_at = time.time() + self.__ttl
+        self.__store(document, expires_at)
+        await self.__cache.set(self.CACHE_KEY, {"document": document, "expires_at": expires_at}, self.__ttl)
 
-    @async_cached_property
+    def __store(self, document: dict[str, Any], expires_at: float) -> None:
+        self.__document = document
+        self.__expiration = time.monotonic() + expires_at - time.time()
+
+    def __watch(self, collection: AsyncIOMotorCollection) -> None:
+        if self.__watcher is None or self.__watcher.done():
+            self.__watcher = create_background_task(self.__watch_changes(collection))
+
+    async def __watch_changes(self, collection: AsyncIOMotorCollection) -> None:
+        try:
+            async with collection.watch(full_document="updateLookup") as change_stream:
+                async for change in change_stream:
+                    document = change.get("fullDocument")
+                    if document:
+                        await self.__publish(document)
+                    else:
+                        self.__expiration = 0.0
+                        await self.__cache.delete(self.CACHE_KEY)
+        except PyMongoError as error:
+            self.__logger.info("Admin configuration change stream is unavailable, relying on TTL: %s", error)
+
+
+class AdminAdapter(InterfaceAdapter, AdminService, WarmupProvider):
+    def __init__(self, providers: AdminProviders, configuration: AdminConfigurationCache) -> None:
+        database = providers.document_database_provider.get_database(DatabaseName.ADMIN)
+        self.__admin_collection = database["payment"]
+        self.__configuration = configuration
+        self.__metrics = providers.metrics_provider
+
+    @async_property
     async def pix_key(self) -> str:
-        admin: dict[str, str] | None = await self.__admin_collection.find().next()
-        if admin:
-            return admin["pix_key"]
-        raise AdminIsNotProperlyConfigured()
+        admin = await self.__document()
+        return admin["pix_key"]
 
-    @async_cached_property
+    @async_property
     async def pix_request_type(self) -> str:
-        admin: dict[str, dict[str, str]] | None = await self.__admin_collection.find().next()
-        if admin:
-            payment_request_types = admin["payment_request_types"]
-            return payment_request_types["pix_service_payment"]
-        raise AdminIsNotProperlyConfigured()
+        admin = await self.__document()
+        payment_request_types = admin["payment_request_types"]
+        return payment_request_types["pix_service_payment"]
 
-    @async_cached_property
+    @async_property
     async def pix_expiration_time(self) -> int:
-        admin: dict[str, str] | None = await self.__admin_collection.find().next()
-        if admin:
-            return int(admin["pix_expiration_time"])
-        raise AdminIsNotProperlyConfigured()
+        admin = await self.__document()
+        return int(admin["pix_expiration_time"])
+
+    async def warm_up(self) -> None:
+        await self.__document()
+
+    def readiness(self) -> dict[str, bool]:
+        return {"admin_config": self.__configuration.loaded}
+
+    async def __document(self) -> dict[str, Any]:
+        with self.__metrics.measure("admin_config"):
+            return await self.__configuration.document(self.__admin_collection)
@@ -0,0 +1,190 @@
+import asyncio
+import base64
+import binascii
+import json
+import logging
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, UpdateOne
+from pymongo.errors import PyMongoError
+
+from domain_payment.business.services import ChargeService
+from domain_payment.models import ChargeModel, ChargePageModel, ChargeStatus, ChargeSummaryModel, PixPaymentModel
+from domain_payment.types.deadline import create_background_task
+
+from .exceptions import ChargeCursorInvalid, ChargeNotFound, PixPaymentBufferFull
+from .interfaces.document_database_provider import DatabaseName, DocumentDatabaseProvider
+from .interfaces.interfaces import InterfaceAdapter
+
+ProviderType = DocumentDatabaseProvider[AsyncIOMotorClient, AsyncIOMotorDatabase]
+
+
+class ChargeAdapterConfig(NamedTuple):
+    payment_batch_size: int
+    payment_flush_interval: float
+    payment_buffer_size: int
+
+
+class ChargeProviders(NamedTuple):
+    document_database_provider: ProviderType
+
+
+class PixPaymentBatchWriter:
+    def __init__(self, collection: AsyncIOMotorCollection, config: ChargeAdapterConfig) -> None:
+        self.__logger = logging.getLogger(self.__class__.__name__)
+        self.__collection = collection
+        self.__config = config
+        self.__buffer: list[PixPaymentModel] = []
+        self.__batch_ready = asyncio.Event()
+        self.__flusher: asyncio.Task[None] | None = None
+
+    def submit(self, payments: list[PixPaymentModel]) -> None:
+        if len(self.__buffer) + len(payments) > self.__config.payment_buffer_size:
+            raise PixPaymentBufferFull()
+        self.__buffer.extend(payment for payment in payments if payment.txid is not None)
+        if self.__flusher is None or self.__flusher.done():
+            self.__flusher = create_background_task(self.__flush_periodically())
+        if len(self.__buffer) >= self.__config.payment_batch_size:
+            self.__batch_ready.set()
+
+    async def close(self) -> None:
+        if self.__flusher is not None:
+            self.__flusher.cancel()
+            await asyncio.gather(self.__flusher, return_exceptions=True)
+        await self.__flush()
+        if self.__buffer:
+            self.__logger.error("Dropping %d unwritten Pix payments on shutdown", len(self.__buffer))
+
+    async def __flush_periodically(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self.__batch_ready.wait(), self.__config.payment_flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self.__batch_ready.clear()
+            await self.__flush()
+
+    async def __flush(self) -> None:
+        batch_size = self.__config.payment_batch_size
+        while self.__buffer:
+            batch, self.__buffer = self.__buffer[:batch_size], self.__buffer[batch_size:]
+            try:
+                result = await self.__collection.bulk_write(
+                    [self.__operation(payment) for payment in batch], ordered=False
+                )
+            except asyncio.CancelledError:
+                self.__buffer[:0] = batch
+                raise
+            except PyMongoError as error:
+                self.__logger.warning("Could not write %d Pix payments, retrying later: %s", len(batch), error)
+                self.__buffer[:0] = batch
+                return
+            if result.matched_count < len(batch):
+                await self.__log_unknown_charges(batch)
+
+    async def __log_unknown_charges(self, batch: list[PixPaymentModel]) -> None:
+        txids = {payment.txid for payment in batch}
+        try:
+            known_txids = {
+                charge["_id"] async for charge in self.__collection.find({"_id": {"$in": list(txids)}}, {"_id": 1})
+            }
+        except PyMongoError as error:
+            self.__logger.warning("Could not look up the charges of %d Pix payments: %s", len(batch), error)
+            return
+        for txid in sorted(txids - known_txids, key=str):
+            self.__logger.warning("Received a Pix payment for unknown charge %s", txid)
+
+    @staticmethod
+    def __operation(payment: PixPaymentModel) -> UpdateOne:
+        return UpdateOne(
+            {"_id": payment.txid},
+            {
+                "$set": {
+                    "status": ChargeStatus.COMPLETED.value,
+                    f"payments.{payment.endToEndId}": {"value": payment.valor, "paid_at": payment.horario},
+                }
+            },
+        )
+
+
+class ChargeAdapter(InterfaceAdapter, ChargeService):
+    SUMMARY_PROJECTION = {"_id": 1, "value": 1, "status": 1, "created_at": 1, "expires_at": 1}
+    DETAIL_PROJECTION = {**SUMMARY_PROJECTION, "pix_copy_paste": 1}
+    SORT = [("created_at", DESCENDING), ("_id", DESCENDING)]
+
+    def __init__(self, providers: ChargeProviders, config: ChargeAdapterConfig) -> None:
+        self.__logger = logging.getLogger(self.__class__.__name__)
+        database = providers.document_database_provider.get_database(DatabaseName.PAYMENT)
+        self.__charges_collection = database["charges"]
+        self.__payment_writer = PixPaymentBatchWriter(self.__charges_collection, config)
+
+    async def create_indexes(self) -> None:
+        try:
+            await self.__charges_collection.create_index(
+                [("uid", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]
+            )
+        except PyMongoError as error:
+            self.__logger.warning("Could not create the charges indexes: %s", error)
+
+    async def close(self) -> None:
+        await self.__payment_writer.close()
+
+    async def save_charge(self, uid: str, charge_model: ChargeModel) -> None:
+        document = charge_model.model_dump(exclude={"txid", "status"})
+        document["created_at"] = self.__truncate(charge_model.created_at)
+        await self.__charges_collection.update_one(
+            {"_id": charge_model.txid},
+            {"$set": {"uid": uid, **document}, "$setOnInsert": {"status": charge_model.status}},
+            upsert=True,
+        )
+
+    async def retrieve_charge(self, uid: str, txid: str) -> ChargeModel:
+        charge: dict[str, Any] | None = await self.__charges_collection.find_one(
+            {"_id": txid, "uid": uid}, self.DETAIL_PROJECTION
+        )
+        if charge is None:
+            raise ChargeNotFound()
+        return ChargeModel(txid=charge.pop("_id"), **charge)
+
+    async def retrieve_pix_copy_paste(self, txid: str) -> str:
+        charge: dict[str, Any] | None = await self.__charges_collection.find_one({"_id": txid}, {"pix_copy_paste": 1})
+        if charge is None or not charge.get("pix_copy_paste"):
+            raise ChargeNotFound()
+        return charge["pix_copy_paste"]
+
+    async def list_charges(self, uid: str, limit: int, cursor: str | None) -> ChargePageModel:
+        query: dict[str, Any] = {"uid": uid}
+        if cursor is not None:
+            created_at, txid = self.__decode_cursor(cursor)
+            query["$or"] = [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "_id": {"$lt": txid}},
+            ]
+        documents = self.__charges_collection.find(query, self.SUMMARY_PROJECTION, sort=self.SORT, limit=limit + 1)
+        charges = [ChargeSummaryModel(txid=charge.pop("_id"), **charge) async for charge in documents]
+        if len(charges) <= limit:
+            return ChargePageModel(charges=charges)
+        charges = charges[:limit]
+        return ChargePageModel(charges=charges, next_cursor=self.__encode_cursor(charges[-1]))
+
+    async def register_payments(self, payments: list[PixPaymentModel]) -> None:
+        self.__payment_writer.submit(payments)
+
+    @staticmethod
+    def __truncate(created_at: datetime) -> datetime:
+        return created_at.replace(microsecond=created_at.microsecond // 1000 * 1000)
+
+    @staticmethod
+    def __encode_cursor(charge: ChargeSummaryModel) -> str:
+        position = json.dumps([charge.created_at.isoformat(), charge.txid], separators=(",", ":"))
+        return base64.urlsafe_b64encode(position.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def __decode_cursor(cursor: str) -> tuple[datetime, str]:
+        try:
+            created_at, txid = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            return datetime.fromisoformat(created_at), str(txid)
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as error:
+            raise ChargeCursorInvalid() from error
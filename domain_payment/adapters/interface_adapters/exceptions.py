@@ -21,3 +21,38 @@ class AdminIsNotProperlyConfigured(InterfaceAdaptersException):
 class PixQRCodeImageTemporarilyUnavailable(InterfaceAdaptersException):
     def __init__(self) -> None:
         super().__init__("Pix service cannot generate QR Code images temporarily")
+
+
+class PixQRCodeImageNotFound(InterfaceAdaptersException):
+    def __init__(self) -> None:
+        super().__init__("There is no Pix QR Code image related to the provided txid")
+
+
+class IdempotencyKeyInProgress(InterfaceAdaptersException):
+    def __init__(self) -> None:
+        super().__init__("A request with the same Idempotency-Key is still being processed")
+
+
+class IdempotencyKeyReused(InterfaceAdaptersException):
+    def __init__(self) -> None:
+        super().__init__("The Idempotency-Key was already used with a different request")
+
+
+class PixChargeTemporarilyUnavailable(InterfaceAdaptersException):
+    def __init__(self) -> None:
+        super().__init__("Pix service cannot create charges temporarily")
+
+
+class ChargeNotFound(InterfaceAdaptersException):
+    def __init__(self) -> None:
+        super().__init__("There is no charge related to the provided txid")
+
+
+class ChargeCursorInvalid(InterfaceAdaptersException):
+    def __init__(self) -> None:
+        super().__init__("The provided charges cursor is invalid")
+
+
+class PixPaymentBufferFull(InterfaceAdaptersException):
+    def __init__(self) -> None:
+        super().__init__("Pix payment notifications cannot be accepted temporarily")
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from enum import UNIQUE, Enum, verify
+from typing import Any, Awaitable, Callable, NamedTuple
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo.errors import DuplicateKeyError, PyMongoError
+
+from domain_payment.business.services import IdempotencyService
+
+from .exceptions import IdempotencyKeyInProgress, IdempotencyKeyReused
+from .interfaces.document_database_provider import DatabaseName, DocumentDatabaseProvider
+from .interfaces.interfaces import InterfaceAdapter
+
+ProviderType = DocumentDatabaseProvider[AsyncIOMotorClient, AsyncIOMotorDatabase]
+Operation = Callable[[], Awaitable[dict[str, Any]]]
+
+
+@verify(UNIQUE)
+class IdempotencyStatus(Enum):
+    PENDING = "pending"
+    COMPLETED = "completed"
+
+
+class IdempotencyAdapterConfig(NamedTuple):
+    key_ttl: int
+    lease_timeout: float
+    wait_timeout: float
+    poll_interval: float
+
+
+class IdempotencyProviders(NamedTuple):
+    document_database_provider: ProviderType
+
+
+class IdempotencyAdapter(InterfaceAdapter, IdempotencyService):
+    def __init__(self, providers: IdempotencyProviders, config: IdempotencyAdapterConfig) -> None:
+        self.__logger = logging.getLogger(self.__class__.__name__)
+        database = providers.document_database_provider.get_database(DatabaseName.PAYMENT)
+        self.__idempotency_keys = database["idempotency_keys"]
+        self.__config = config
+        self.__in_flight: dict[tuple[str, str], asyncio.Task[dict[str, Any]]] = {}
+
+    async def create_indexes(self) -> None:
+        try:
+            await self.__idempotency_keys.create_index("expires_at", expireAfterSeconds=0)
+        except PyMongoError as error:
+            self.__logger.warning("Could not create the idempotency keys indexes: %s", error)
+
+    async def execute(self, uid: str, key: str, fingerprint: str, operation: Operation) -> dict[str, Any]:
+        in_flight_key = (f"{uid}:{key}", fingerprint)
+        task = self.__in_flight.get(in_flight_key)
+        if task is None:
+            task = asyncio.create_task(self.__execute(*in_flight_key, operation))
+            self.__in_flight[in_flight_key] = task
+            task.add_done_callback(lambda _: self.__in_flight.pop(in_flight_key, None))
+        return await asyncio.shield(task)
+
+    async def __execute(self, record_id: str, fingerprint: str, operation: Operation) -> dict[str, Any]:
+        deadline = time.monotonic() + self.__config.wait_timeout
+        lease_id = uuid.uuid4().hex
+        while True:
+            if await self.__reserve(record_id, fingerprint, lease_id):
+                return await self.__complete(record_id, lease_id, operation)
+            response = await self.__read_response(record_id, fingerprint)
+            if response is not None:
+                return response
+            if time.monotonic() >= deadline:
+                raise IdempotencyKeyInProgress()
+            await asyncio.sleep(self.__config.poll_interval)
+
+    async def __reserve(self, record_id: str, fingerprint: str, lease_id: str) -> bool:
+        now = datetime.now(timezone.utc)
+        record = {
+            "_id": record_id,
+            "fingerprint": fingerprint,
+            "status": IdempotencyStatus.PENDING.value,
+            "lease_id": lease_id,
+            "locked_until": now + timedelta(seconds=self.__config.lease_timeout),
+            "created_at": now,
+            "expires_at": now + timedelta(seconds=self.__config.key_ttl),
+        }
+        try:
+            await self.__idempotency_keys.insert_one(record)
+        except DuplicateKeyError:
+            result = await self.__idempotency_keys.replace_one(
+                {
+                    "_id": record_id,
+                    "$or": [
+                        {"expires_at": {"$lte": now}},
+                        {
+                            "fingerprint": fingerprint,
+                            "status": IdempotencyStatus.PENDING.value,
+                            "locked_until": {"$lt": now},
+                        },
+                    ],
+                },
+                record,
+            )
+            if result.modified_count == 0:
+                return False
+            self.__logger.warning("Took over the expired idempotency key %s", record_id)
+        return True
+
+    async def __complete(self, record_id: str, lease_id: str, operation: Operation) -> dict[str, Any]:
+        try:
+            response = await operation()
+        except Exception:
+            await self.__idempotency_keys.delete_one(
+                {"_id": record_id, "status": IdempotencyStatus.PENDING.value, "lease_id": lease_id}
+            )
+            raise
+        await self.__idempotency_keys.update_one(
+            {"_id": record_id, "lease_id": lease_id},
+            {"$set": {"status": IdempotencyStatus.COMPLETED.value, "response": response}},
+        )
+        return response
+
+    async def __read_response(self, record_id: str, fingerprint: str) -> dict[str, Any] | None:
+        record: dict[str, Any] | None = await self.__idempotency_keys.find_one(
+            {"_id": record_id, "expires_at": {"$gt": datetime.now(timezone.utc)}}
+        )
+        if record is None:
+            return None
+        if record["fingerprint"] != fingerprint:
+            raise IdempotencyKeyReused()
+        if record["status"] == IdempotencyStatus.COMPLETED.value:
+            return record["response"]
+        return None
@@ -1,8 +1,12 @@
 from .authentication_provider import AuthenticationProvider, BearerToken, UserUid
 from .bucket_provider import BucketProvider, BucketUploader, ImageUploadInput, ImageUploadOutput
+from .cache_provider import CacheProvider
 from .document_database_provider import DatabaseName, DocumentDatabaseProvider
+from .metrics_provider import MetricsProvider
 from .pix_provider import PixProvider
+from .qrcode_provider import QRCodeProvider
 from .user_provider import UserProvider
+from .warmup_provider import WarmupProvider
 
 __all__ = [
     "DocumentDatabaseProvider",
@@ -11,9 +15,13 @@ __all__ = [
     "BearerToken",
     "UserUid",
     "PixProvider",
+    "QRCodeProvider",
     "UserProvider",
     "BucketUploader",
     "BucketProvider",
     "ImageUploadInput",
     "ImageUploadOutput",
+    "MetricsProvider",
+    "CacheProvider",
+    "WarmupProvider",
 ]
@@ -9,4 +9,7 @@ class BearerToken(str): ...
 
 class AuthenticationProvider(metaclass=ABCMeta):
     @abstractmethod
-    def authenticate_by_token(self, token: BearerToken) -> UserUid: ...
+    async def authenticate_by_token(self, token: BearerToken) -> UserUid: ...
+
+    @abstractmethod
+    async def authenticate_back_office_by_token(self, token: BearerToken) -> UserUid: ...
@@ -6,6 +6,7 @@ class ImageUploadInput(NamedTuple):
     image: bytes
     bucket_name: str
     image_name_on_bucket: str
+    content_type: str = "image/png"
 
 
 class ImageUploadOutput(NamedTuple):
@@ -16,8 +17,14 @@ class BucketUploader(metaclass=ABCMeta):
     @abstractmethod
     async def upload(self, port: ImageUploadInput) -> ImageUploadOutput: ...
 
+    @abstractmethod
+    async def schedule_upload(self, port: ImageUploadInput) -> ImageUploadOutput: ...
+
 
 class BucketProvider(metaclass=ABCMeta):
+    @abstractmethod
+    async def bucket_metadata(self, bucket_name: str) -> dict[str, Any]: ...
+
     @abstractmethod
     async def __aenter__(self) -> BucketUploader: ...
 
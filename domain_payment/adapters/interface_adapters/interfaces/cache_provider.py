@@ -0,0 +1,16 @@
+from abc import ABCMeta, abstractmethod
+from typing import Any
+
+
+class CacheProvider(metaclass=ABCMeta):
+    @abstractmethod
+    async def get(self, key: str) -> Any | None: ...
+
+    @abstractmethod
+    async def get_many(self, keys: list[str]) -> dict[str, Any]: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: float) -> None: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
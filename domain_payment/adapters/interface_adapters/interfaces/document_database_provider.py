@@ -10,6 +10,7 @@ DatabaseT = TypeVar("DatabaseT")
 class DatabaseName(Enum):
     ACCOUNT = "domain-account"
     ADMIN = "configuration"
+    PAYMENT = "domain-payment"
 
 
 class DocumentDatabaseProvider(Generic[ClientT, DatabaseT], metaclass=ABCMeta):
@@ -17,10 +18,5 @@ class DocumentDatabaseProvider(Generic[ClientT, DatabaseT], metaclass=ABCMeta):
     @abstractmethod
     def client(self) -> ClientT: ...
 
-    @property
-    @abstractmethod
-    def database(self) -> DatabaseT: ...
-
-    @database.setter
     @abstractmethod
-    def database(self, database_name: DatabaseName) -> None: ...
+    def get_database(self, database_name: DatabaseName) -> DatabaseT: ...
@@ -0,0 +1,13 @@
+from abc import ABCMeta, abstractmethod
+from contextlib import AbstractContextManager
+
+
+class MetricsProvider(metaclass=ABCMeta):
+    @abstractmethod
+    def measure(self, stage: str) -> AbstractContextManager[None]: ...
+
+    @abstractmethod
+    def observe_request(self, method: str, route: str, status_code: int, duration: float) -> None: ...
+
+    @abstractmethod
+    def render(self) -> str: ...
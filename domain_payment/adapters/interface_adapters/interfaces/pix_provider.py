@@ -15,4 +15,4 @@ class _ABCMetaSingleton(ABCMeta):
 
 class PixProvider(metaclass=_ABCMetaSingleton):
     @abstractmethod
-    async def create_charge(self, pix_model: PixModel) -> PixChargeModel: ...
+    async def create_charge(self, pix_model: PixModel, qrcode_image: bool = True) -> PixChargeModel: ...
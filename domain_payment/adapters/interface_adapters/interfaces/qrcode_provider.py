@@ -0,0 +1,6 @@
+from abc import ABCMeta, abstractmethod
+
+
+class QRCodeProvider(metaclass=ABCMeta):
+    @abstractmethod
+    async def render_png(self, payload: str) -> bytes: ...
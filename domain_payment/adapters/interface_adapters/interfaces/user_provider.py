@@ -6,3 +6,6 @@ from domain_payment.models.user_model import AuthenticatedUserModel
 class UserProvider(metaclass=ABCMeta):
     @abstractmethod
     async def get_username(self, user: AuthenticatedUserModel) -> str: ...
+
+    @abstractmethod
+    async def get_usernames(self, uids: list[str]) -> dict[str, str]: ...
@@ -0,0 +1,9 @@
+from abc import ABCMeta, abstractmethod
+
+
+class WarmupProvider(metaclass=ABCMeta):
+    @abstractmethod
+    async def warm_up(self) -> None: ...
+
+    @abstractmethod
+    def readiness(self) -> dict[str, bool]: ...
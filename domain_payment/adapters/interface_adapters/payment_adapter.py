@@ -1,40 +1,99 @@
+import base64
+from enum import UNIQUE, Enum, verify
 from typing import NamedTuple
 
 from domain_payment.business.services import PaymentService
-from domain_payment.models import AuthenticatedUserModel, PixChargeResponseModel, PixModel
+from domain_payment.models import AuthenticatedUserModel, PixChargeModel, PixChargeResponseModel, PixModel
 
-from .interfaces import BucketProvider, ImageUploadInput, PixProvider
+from .exceptions import PixQRCodeImageNotFound, PixQRCodeImageTemporarilyUnavailable
+from .interfaces import BucketProvider, ImageUploadInput, PixProvider, QRCodeProvider, WarmupProvider
+
+
+@verify(UNIQUE)
+class PixQRCodeDelivery(Enum):
+    BUCKET = "bucket"
+    BACKGROUND = "background"
+    INLINE = "inline"
+    ROUTE = "route"
 
 
 class PaymentAdapterConfig(NamedTuple):
     pix_qrcode_bucket_name: str
+    pix_qrcode_delivery: PixQRCodeDelivery
+    pix_qrcode_base_url: str
 
 
 class PaymentProviders(NamedTuple):
     pix_provider: PixProvider
     bucket_provider: BucketProvider
+    qrcode_provider: QRCodeProvider
 
 
-class PaymentAdapter(PaymentService):
+class PaymentAdapter(PaymentService, WarmupProvider):
     def __init__(self, providers: PaymentProviders, config: PaymentAdapterConfig):
         self.__pix_provider = providers.pix_provider
         self.__bucket_provider = providers.bucket_provider
-        self.__bucket_name = config.pix_qrcode_bucket_name
+        self.__qrcode_provider = providers.qrcode_provider
+        self.__config = config
+        self.__uses_bucket = config.pix_qrcode_delivery in (PixQRCodeDelivery.BUCKET, PixQRCodeDelivery.BACKGROUND)
+        self.__bucket_loaded = False
 
     async def generate_pix_qrcode(
         self, pix_model: PixModel, user_model: AuthenticatedUserModel
     ) -> PixChargeResponseModel:
-        pix_charge_model = await self.__pix_provider.create_charge(pix_model)
-        pix_qrcode_image_path = f"{user_model.uid}.png"
+        pix_charge_model = await self.__pix_provider.create_charge(pix_model, qrcode_image=self.__uses_bucket)
+        if self.__config.pix_qrcode_delivery is PixQRCodeDelivery.INLINE:
+            image = await self.__qrcode_provider.render_png(pix_charge_model.pix_copy_paste)
+            pix_qrcode_path = f"data:image/png;base64,{base64.b64encode(image).decode()}"
+        elif self.__config.pix_qrcode_delivery is PixQRCodeDelivery.ROUTE:
+            pix_qrcode_path = f"{self.__config.pix_qrcode_base_url}/pix-qrcode/{pix_charge_model.txid}.png"
+        elif self.__config.pix_qrcode_delivery is PixQRCodeDelivery.BACKGROUND:
+            pix_qrcode_path = await self.__schedule_pix_qrcode_upload(pix_charge_model)
+        else:
+            pix_qrcode_path = await self.__upload_pix_qrcode(pix_charge_model)
+        return PixChargeResponseModel(
+            txid=pix_charge_model.txid,
+            pix_copy_paste=pix_charge_model.pix_copy_paste,
+            pix_qrcode_path=pix_qrcode_path,
+        )
+
+    async def warm_up(self) -> None:
+        if self.__uses_bucket:
+            await self.__bucket_provider.bucket_metadata(self.__config.pix_qrcode_bucket_name)
+            self.__bucket_loaded = True
+
+    def readiness(self) -> dict[str, bool]:
+        if not self.__uses_bucket:
+            return {}
+        return {"qrcode_bucket": self.__bucket_loaded}
+
+    async def pix_qrcode_image(self, pix_copy_paste: str) -> bytes:
+        if self.__config.pix_qrcode_delivery is not PixQRCodeDelivery.ROUTE:
+            raise PixQRCodeImageNotFound()
+        return await self.__qrcode_provider.render_png(pix_copy_paste)
+
+    async def __upload_pix_qrcode(self, pix_charge_model: PixChargeModel) -> str:
+        if pix_charge_model.pix_qrcode_image is None:
+            raise PixQRCodeImageTemporarilyUnavailable()
         async with self.__bucket_provider as bucket_uploader:
             image_upload_result = await bucket_uploader.upload(
                 ImageUploadInput(
                     image=pix_charge_model.pix_qrcode_image,
-                    bucket_name=self.__bucket_name,
-                    image_name_on_bucket=f"pixQRCodeImages/{pix_qrcode_image_path}",
+                    bucket_name=self.__config.pix_qrcode_bucket_name,
+                    image_name_on_bucket=f"pixQRCodeImages/{pix_charge_model.txid}.png",
                 )
             )
-            return PixChargeResponseModel(
-                pix_copy_paste=pix_charge_model.pix_copy_paste,
-                pix_qrcode_path=image_upload_result.image_uri,
+            return image_upload_result.image_uri
+
+    async def __schedule_pix_qrcode_upload(self, pix_charge_model: PixChargeModel) -> str:
+        if pix_charge_model.pix_qrcode_image is None:
+            raise PixQRCodeImageTemporarilyUnavailable()
+        async with self.__bucket_provider as bucket_uploader:
+            image_upload_result = await bucket_uploader.schedule_upload(
+                ImageUploadInput(
+                    image=pix_charge_model.pix_qrcode_image,
+                    bucket_name=self.__config.pix_qrcode_bucket_name,
+                    image_name_on_bucket=f"pixQRCodeImages/{pix_charge_model.txid}.png",
+                )
             )
+            return image_upload_result.image_uri
@@ -0,0 +1,47 @@
+import asyncio
+import logging
+from typing import NamedTuple
+
+from domain_payment.types.deadline import create_background_task
+
+from .interfaces.warmup_provider import WarmupProvider
+
+
+class WarmupAdapterConfig(NamedTuple):
+    component_timeout: float
+
+
+class WarmupProviders(NamedTuple):
+    warmup_providers: list[WarmupProvider]
+
+
+class WarmupAdapter(WarmupProvider):
+    def __init__(self, providers: WarmupProviders, config: WarmupAdapterConfig) -> None:
+        self.__logger = logging.getLogger(self.__class__.__name__)
+        self.__providers = providers.warmup_providers
+        self.__component_timeout = config.component_timeout
+        self.__warming: asyncio.Task[None] | None = None
+
+    async def warm_up(self) -> None:
+        if self.__warming is None or self.__warming.done():
+            self.__warming = create_background_task(self.__warm_up_all())
+        await asyncio.shield(self.__warming)
+
+    def readiness(self) -> dict[str, bool]:
+        components: dict[str, bool] = {}
+        for provider in self.__providers:
+            components.update(provider.readiness())
+        return components
+
+    async def __warm_up_all(self) -> None:
+        await asyncio.gather(*(self.__warm_up(provider) for provider in self.__providers))
+        cold_components = [name for name, warm in self.readiness().items() if not warm]
+        if cold_components:
+            self.__logger.warning("Warm-up finished with cold components: %s", ", ".join(cold_components))
+
+    async def __warm_up(self, provider: WarmupProvider) -> None:
+        try:
+            async with asyncio.timeout(self.__component_timeout):
+                await provider.warm_up()
+        except Exception as error:  # pylint: disable=W0718
+            self.__logger.warning("%s could not be warmed up: %s", provider.__class__.__name__, error)
@@ -1,20 +1,73 @@
+import os
 from abc import ABCMeta, abstractmethod
-from typing import Generic
+from enum import UNIQUE, Enum, verify
+from functools import wraps
+from typing import Any, Callable, Generic, NamedTuple
 
 from typing_extensions import TypeVar
 
-from domain_payment.business.use_case import ChargePixServices, ChargePixUseCase
+from domain_payment.business.use_case import (
+    ChargePixBatchServices,
+    ChargePixBatchUseCase,
+    ChargePixServices,
+    ChargePixUseCase,
+    ListChargesServices,
+    ListChargesUseCase,
+    PixQRCodeImageServices,
+    PixQRCodeImageUseCase,
+    ReceivePixPaymentsServices,
+    ReceivePixPaymentsUseCase,
+    RetrieveChargeServices,
+    RetrieveChargeUseCase,
+)
 
-from .services import AccountService, AdminService, PaymentService
+from .services import AccountService, AdminService, ChargeService, IdempotencyService, PaymentService
 
 T_payment_service_co = TypeVar("T_payment_service_co", bound=PaymentService, covariant=True)
 T_account_service_co = TypeVar("T_account_service_co", bound=AccountService, covariant=True)
 T_admin_service_co = TypeVar("T_admin_service_co", bound=AdminService, covariant=True)
+T_idempotency_service_co = TypeVar("T_idempotency_service_co", bound=IdempotencyService, covariant=True)
+T_charge_service_co = TypeVar("T_charge_service_co", bound=ChargeService, covariant=True)
+T_factory = TypeVar("T_factory")
+T_scoped = TypeVar("T_scoped")
+
+
+@verify(UNIQUE)
+class Lifetime(Enum):
+    SINGLETON = "singleton"
+    WORKER = "worker"
+    REQUEST = "request"
+
+
+def scoped(
+    lifetime: Lifetime,
+) -> Callable[[Callable[[T_factory], T_scoped]], Callable[[T_factory], T_scoped]]:
+    def decorator(factory_method: Callable[[T_factory], T_scoped]) -> Callable[[T_factory], T_scoped]:
+        @wraps(factory_method)
+        def wrapper(factory: T_factory) -> T_scoped:
+            if lifetime is Lifetime.REQUEST:
+                return factory_method(factory)
+            scope = os.getpid() if lifetime is Lifetime.WORKER else None
+            instances: dict[tuple[str, int | None], Any] = vars(factory).setdefault("_scoped_instances", {})
+            key = (factory_method.__name__, scope)
+            if key not in instances:
+                instances[key] = factory_method(factory)
+            return instances[key]
+
+        return wrapper
+
+    return decorator
 
 
 # noinspection PyTypeHints
 class AdaptersFactoryInterface(
-    Generic[T_payment_service_co, T_account_service_co, T_admin_service_co],
+    Generic[
+        T_payment_service_co,
+        T_account_service_co,
+        T_admin_service_co,
+        T_idempotency_service_co,
+        T_charge_service_co,
+    ],
     metaclass=ABCMeta,
 ):
     @abstractmethod
@@ -26,15 +79,62 @@ class AdaptersFactoryInterface(
     @abstractmethod
     def payment_service(self) -> T_payment_service_co: ...
 
+    @abstractmethod
+    def idempotency_service(self) -> T_idempotency_service_co: ...
+
+    @abstractmethod
+    def charge_service(self) -> T_charge_service_co: ...
+
+
+class BusinessConfig(NamedTuple):
+    charge_batch_concurrency: int
+
 
 class BusinessFactory:
-    def __init__(self, adapters_factory: AdaptersFactoryInterface) -> None:
+    def __init__(self, adapters_factory: AdaptersFactoryInterface, config: BusinessConfig) -> None:
         self.__factory = adapters_factory
+        self.__config = config
 
+    @scoped(Lifetime.WORKER)
     def charge_pix_use_case(self) -> ChargePixUseCase:
         services = ChargePixServices(
             payment_service=self.__factory.payment_service(),
             admin_service=self.__factory.admin_service(),
             account_service=self.__factory.account_service(),
+            idempotency_service=self.__factory.idempotency_service(),
+            charge_service=self.__factory.charge_service(),
         )
         return ChargePixUseCase(services)
+
+    @scoped(Lifetime.WORKER)
+    def charge_pix_batch_use_case(self) -> ChargePixBatchUseCase:
+        services = ChargePixBatchServices(
+            payment_service=self.__factory.payment_service(),
+            admin_service=self.__factory.admin_service(),
+            account_service=self.__factory.account_service(),
+            charge_service=self.__factory.charge_service(),
+        )
+        return ChargePixBatchUseCase(services, self.__config.charge_batch_concurrency)
+
+    @scoped(Lifetime.WORKER)
+    def pix_qrcode_image_use_case(self) -> PixQRCodeImageUseCase:
+        services = PixQRCodeImageServices(
+            payment_service=self.__factory.payment_service(),
+            charge_service=self.__factory.charge_service(),
+        )
+        return PixQRCodeImageUseCase(services)
+
+    @scoped(Lifetime.WORKER)
+    def retrieve_charge_use_case(self) -> RetrieveChargeUseCase:
+        services = RetrieveChargeServices(charge_service=self.__factory.charge_service())
+        return RetrieveChargeUseCase(services)
+
+    @scoped(Lifetime.WORKER)
+    def list_charges_use_case(self) -> ListChargesUseCase:
+        services = ListChargesServices(charge_service=self.__factory.charge_service())
+        return ListChargesUseCase(services)
+
+    @scoped(Lifetime.WORKER)
+    def receive_pix_payments_use_case(self) -> ReceivePixPaymentsUseCase:
+        services = ReceivePixPaymentsServices(charge_service=self.__factory.charge_service())
+        return ReceivePixPaymentsUseCase(services)
@@ -1,11 +1,63 @@
-from domain_payment.models import AuthenticatedUserModel, PixChargeResponseModel
+from domain_payment.models import (
+    AuthenticatedUserModel,
+    ChargeModel,
+    ChargePageModel,
+    PixChargeResponseModel,
+    PixPaymentModel,
+)
 
 from .interfaces import InputPort, OutputPort
 
 
 class ChargePixInputPort(AuthenticatedUserModel, InputPort):
     charge_value: float
+    idempotency_key: str | None = None
 
 
 class ChargePixOutputPort(PixChargeResponseModel, OutputPort):
     msg: str
+
+
+class ChargePixBatchInputPort(InputPort):
+    charges: list[ChargePixInputPort]
+
+
+class ChargePixBatchOutputPort(OutputPort):
+    index: int
+    uid: str
+    msg: str
+    txid: str | None = None
+    pix_copy_paste: str | None = None
+    pix_qrcode_path: str | None = None
+    error: str | None = None
+
+
+class PixQRCodeImageInputPort(InputPort):
+    txid: str
+
+
+class PixQRCodeImageOutputPort(OutputPort):
+    image: bytes
+
+
+class RetrieveChargeInputPort(AuthenticatedUserModel, InputPort):
+    txid: str
+
+
+class RetrieveChargeOutputPort(ChargeModel, OutputPort): ...
+
+
+class ListChargesInputPort(AuthenticatedUserModel, InputPort):
+    limit: int
+    cursor: str | None = None
+
+
+class ListChargesOutputPort(ChargePageModel, OutputPort): ...
+
+
+class ReceivePixPaymentsInputPort(InputPort):
+    pix: list[PixPaymentModel]
+
+
+class ReceivePixPaymentsOutputPort(OutputPort):
+    msg: str
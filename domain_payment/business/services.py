@@ -1,6 +1,15 @@
 from abc import ABCMeta, abstractmethod
+from typing import Any, Awaitable, Callable
 
-from domain_payment.models import AccountModel, AuthenticatedUserModel, PixChargeResponseModel, PixModel
+from domain_payment.models import (
+    AccountModel,
+    AuthenticatedUserModel,
+    ChargeModel,
+    ChargePageModel,
+    PixChargeResponseModel,
+    PixModel,
+    PixPaymentModel,
+)
 
 from .interfaces import Service
 
@@ -11,6 +20,9 @@ class PaymentService(Service, metaclass=ABCMeta):
         self, pix_model: PixModel, user_model: AuthenticatedUserModel
     ) -> PixChargeResponseModel: ...
 
+    @abstractmethod
+    async def pix_qrcode_image(self, pix_copy_paste: str) -> bytes: ...
+
 
 class AdminService(Service, metaclass=ABCMeta):
     @property
@@ -29,3 +41,30 @@ class AdminService(Service, metaclass=ABCMeta):
 class AccountService(Service, metaclass=ABCMeta):
     @abstractmethod
     async def retrieve_user(self, port: AuthenticatedUserModel) -> AccountModel: ...
+
+    @abstractmethod
+    async def retrieve_users(self, uids: list[str]) -> dict[str, AccountModel]: ...
+
+
+class IdempotencyService(Service, metaclass=ABCMeta):
+    @abstractmethod
+    async def execute(
+        self, uid: str, key: str, fingerprint: str, operation: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]: ...
+
+
+class ChargeService(Service, metaclass=ABCMeta):
+    @abstractmethod
+    async def save_charge(self, uid: str, charge_model: ChargeModel) -> None: ...
+
+    @abstractmethod
+    async def retrieve_charge(self, uid: str, txid: str) -> ChargeModel: ...
+
+    @abstractmethod
+    async def retrieve_pix_copy_paste(self, txid: str) -> str: ...
+
+    @abstractmethod
+    async def list_charges(self, uid: str, limit: int, cursor: str | None) -> ChargePageModel: ...
+
+    @abstractmethod
+    async def register_payments(self, payments: list[PixPaymentModel]) -> None: ...
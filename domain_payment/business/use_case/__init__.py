@@ -1,4 +1,24 @@
+from .charge_pix_batch_use_case import ChargePixBatchServices, ChargePixBatchUseCase
 from .charge_pix_use_case import ChargePixServices, ChargePixUseCase
-from .interfaces import UseCase
+from .interfaces import StreamUseCase, UseCase
+from .list_charges_use_case import ListChargesServices, ListChargesUseCase
+from .pix_qrcode_image_use_case import PixQRCodeImageServices, PixQRCodeImageUseCase
+from .receive_pix_payments_use_case import ReceivePixPaymentsServices, ReceivePixPaymentsUseCase
+from .retrieve_charge_use_case import RetrieveChargeServices, RetrieveChargeUseCase
 
-__all__ = ["ChargePixUseCase", "ChargePixServices", "UseCase"]
+__all__ = [
+    "ChargePixBatchUseCase",
+    "ChargePixBatchServices",
+    "ChargePixUseCase",
+    "ChargePixServices",
+    "ListChargesUseCase",
+    "ListChargesServices",
+    "PixQRCodeImageUseCase",
+    "PixQRCodeImageServices",
+    "ReceivePixPaymentsUseCase",
+    "ReceivePixPaymentsServices",
+    "RetrieveChargeUseCase",
+    "RetrieveChargeServices",
+    "StreamUseCase",
+    "UseCase",
+]
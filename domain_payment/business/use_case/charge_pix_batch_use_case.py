@@ -0,0 +1,63 @@
+import asyncio
+from typing import AsyncIterator, NamedTuple
+
+from domain_payment.models import AccountModel
+
+from ..ports import ChargePixBatchInputPort, ChargePixBatchOutputPort, ChargePixInputPort
+from ..services import AccountService, AdminService, ChargeService, PaymentService
+from .interfaces import StreamUseCase
+from .pix_charge_issuer import PixChargeIssuer, PixSettings
+
+
+class ChargePixBatchServices(NamedTuple):
+    payment_service: PaymentService
+    admin_service: AdminService
+    account_service: AccountService
+    charge_service: ChargeService
+
+
+class ChargePixBatchUseCase(StreamUseCase[ChargePixBatchInputPort, ChargePixBatchOutputPort]):
+    def __init__(self, services: ChargePixBatchServices, concurrency: int) -> None:
+        self.__admin_service = services.admin_service
+        self.__account_service = services.account_service
+        self.__charge_issuer = PixChargeIssuer(services.payment_service, services.charge_service)
+        self.__semaphore = asyncio.Semaphore(concurrency)
+
+    async def __call__(self, input_port: ChargePixBatchInputPort) -> AsyncIterator[ChargePixBatchOutputPort]:
+        uids = list(dict.fromkeys(charge.uid for charge in input_port.charges))
+        accounts, pix_expiration_time, pix_key, pix_request_type = await asyncio.gather(
+            self.__account_service.retrieve_users(uids),
+            self.__admin_service.pix_expiration_time,
+            self.__admin_service.pix_key,
+            self.__admin_service.pix_request_type,
+        )
+        settings = PixSettings(expiration_time=pix_expiration_time, key=pix_key, request_type=pix_request_type)
+        return self.__charge_all(input_port, accounts, settings)
+
+    async def __charge_all(
+        self, input_port: ChargePixBatchInputPort, accounts: dict[str, AccountModel], settings: PixSettings
+    ) -> AsyncIterator[ChargePixBatchOutputPort]:
+        charges = [
+            asyncio.create_task(self.__charge(index, charge, accounts.get(charge.uid), settings))
+            for index, charge in enumerate(input_port.charges)
+        ]
+        try:
+            for charge_result in asyncio.as_completed(charges):
+                yield await charge_result
+        finally:
+            for charge_task in charges:
+                charge_task.cancel()
+
+    async def __charge(
+        self, index: int, charge: ChargePixInputPort, account: AccountModel | None, settings: PixSettings
+    ) -> ChargePixBatchOutputPort:
+        if account is None:
+            return ChargePixBatchOutputPort(
+                index=index, uid=charge.uid, msg="error", error="There is no User related to the provided UID"
+            )
+        async with self.__semaphore:
+            try:
+                pix_charge_model = await self.__charge_issuer.issue(charge, account, charge.charge_value, settings)
+            except Exception as error:  # pylint: disable=W0718
+                return ChargePixBatchOutputPort(index=index, uid=charge.uid, msg="error", error=str(error))
+        return ChargePixBatchOutputPort(index=index, uid=charge.uid, msg="ok", **pix_charge_model.model_dump())
@@ -1,36 +1,49 @@
-from typing import NamedTuple
-
-from domain_payment.models import PixModel
-from domain_payment.models.pix_model import CalendarModel, DebtorModel, ValueModel
+import asyncio
+from typing import Any, NamedTuple
 
 from ..ports import ChargePixInputPort, ChargePixOutputPort
-from ..services import AccountService, AdminService, PaymentService
+from ..services import AccountService, AdminService, ChargeService, IdempotencyService, PaymentService
 from .interfaces import UseCase
+from .pix_charge_issuer import PixChargeIssuer, PixSettings
 
 
 class ChargePixServices(NamedTuple):
     payment_service: PaymentService
     admin_service: AdminService
     account_service: AccountService
+    idempotency_service: IdempotencyService
+    charge_service: ChargeService
 
 
 class ChargePixUseCase(UseCase[ChargePixInputPort, ChargePixOutputPort]):
     def __init__(self, services: ChargePixServices) -> None:
-        self.__payment_service = services.payment_service
         self.__admin_service = services.admin_service
         self.__account_service = services.account_service
+        self.__idempotency_service = services.idempotency_service
+        self.__charge_issuer = PixChargeIssuer(services.payment_service, services.charge_service)
 
     async def __call__(self, input_port: ChargePixInputPort) -> ChargePixOutputPort:
-        account = await self.__account_service.retrieve_user(input_port)
-        calendar_model = CalendarModel(expiracao=await self.__admin_service.pix_expiration_time)
-        debtor_model = DebtorModel(cpf=account.cpf, nome=account.username)
-        value_model = ValueModel(original=str(round(input_port.charge_value, ndigits=2)))
-        pix_model = PixModel(
-            calendario=calendar_model,
-            devedor=debtor_model,
-            valor=value_model,
-            chave=await self.__admin_service.pix_key,
-            solicitacaoPagador=await self.__admin_service.pix_request_type,
+        if input_port.idempotency_key is None:
+            return await self.__charge(input_port)
+        output = await self.__idempotency_service.execute(
+            input_port.uid,
+            input_port.idempotency_key,
+            f"{input_port.charge_value:.2f}",
+            lambda: self.__charge_document(input_port),
+        )
+        return ChargePixOutputPort(**output)
+
+    async def __charge_document(self, input_port: ChargePixInputPort) -> dict[str, Any]:
+        output_port = await self.__charge(input_port)
+        return output_port.model_dump()
+
+    async def __charge(self, input_port: ChargePixInputPort) -> ChargePixOutputPort:
+        account, pix_expiration_time, pix_key, pix_request_type = await asyncio.gather(
+            self.__account_service.retrieve_user(input_port),
+            self.__admin_service.pix_expiration_time,
+            self.__admin_service.pix_key,
+            self.__admin_service.pix_request_type,
         )
-        pix_charge_model = await self.__payment_service.generate_pix_qrcode(pix_model, input_port)
+        settings = PixSettings(expiration_time=pix_expiration_time, key=pix_key, request_type=pix_request_type)
+        pix_charge_model = await self.__charge_issuer.issue(input_port, account, input_port.charge_value, settings)
         return ChargePixOutputPort(msg="ok", **pix_charge_model.model_dump())
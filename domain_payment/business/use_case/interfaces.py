@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from typing import Generic, TypeVar
+from typing import AsyncIterator, Generic, TypeVar
 
 from domain_payment.business.interfaces import InputPort, OutputPort, Service
 
@@ -13,3 +13,11 @@ class UseCase(Generic[T_input, T_output_co], metaclass=ABCMeta):
 
     @abstractmethod
     async def __call__(self, input_port: T_input) -> T_output_co: ...
+
+
+class StreamUseCase(Generic[T_input, T_output_co], metaclass=ABCMeta):
+    @abstractmethod
+    def __init__(self, *service: Service) -> None: ...
+
+    @abstractmethod
+    async def __call__(self, input_port: T_input) -> AsyncIterator[T_output_co]: ...
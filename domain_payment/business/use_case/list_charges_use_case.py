@@ -0,0 +1,20 @@
+from typing import NamedTuple
+
+from ..ports import ListChargesInputPort, ListChargesOutputPort
+from ..services import ChargeService
+from .interfaces import UseCase
+
+
+class ListChargesServices(NamedTuple):
+    charge_service: ChargeService
+
+
+class ListChargesUseCase(UseCase[ListChargesInputPort, ListChargesOutputPort]):
+    def __init__(self, services: ListChargesServices) -> None:
+        self.__charge_service = services.charge_service
+
+    async def __call__(self, input_port: ListChargesInputPort) -> ListChargesOutputPort:
+        charge_page_model = await self.__charge_service.list_charges(
+            input_port.uid, input_port.limit, input_port.cursor
+        )
+        return ListChargesOutputPort(**charge_page_model.model_dump())
@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
+
+from domain_payment.models import AccountModel, AuthenticatedUserModel, ChargeModel, ChargeStatus, PixModel
+from domain_payment.models.pix_model import CalendarModel, DebtorModel, PixChargeResponseModel, ValueModel
+
+from ..services import ChargeService, PaymentService
+
+
+class PixSettings(NamedTuple):
+    expiration_time: int
+    key: str
+    request_type: str
+
+
+class PixChargeIssuer:
+    def __init__(self, payment_service: PaymentService, charge_service: ChargeService) -> None:
+        self.__payment_service = payment_service
+        self.__charge_service = charge_service
+
+    async def issue(
+        self, user_model: AuthenticatedUserModel, account: AccountModel, charge_value: float, settings: PixSettings
+    ) -> PixChargeResponseModel:
+        calendar_model = CalendarModel(expiracao=settings.expiration_time)
+        debtor_model = DebtorModel(cpf=account.cpf, nome=account.username)
+        value_model = ValueModel(original=str(round(charge_value, ndigits=2)))
+        pix_model = PixModel(
+            calendario=calendar_model,
+            devedor=debtor_model,
+            valor=value_model,
+            chave=settings.key,
+            solicitacaoPagador=settings.request_type,
+        )
+        pix_charge_model = await self.__payment_service.generate_pix_qrcode(pix_model, user_model)
+        created_at = datetime.now(timezone.utc)
+        charge_model = ChargeModel(
+            txid=pix_charge_model.txid,
+            value=value_model.original,
+            status=ChargeStatus.ACTIVE.value,
+            pix_copy_paste=pix_charge_model.pix_copy_paste,
+            created_at=created_at,
+            expires_at=created_at + timedelta(seconds=settings.expiration_time),
+        )
+        await self.__charge_service.save_charge(user_model.uid, charge_model)
+        return pix_charge_model
@@ -0,0 +1,21 @@
+from typing import NamedTuple
+
+from ..ports import PixQRCodeImageInputPort, PixQRCodeImageOutputPort
+from ..services import ChargeService, PaymentService
+from .interfaces import UseCase
+
+
+class PixQRCodeImageServices(NamedTuple):
+    payment_service: PaymentService
+    charge_service: ChargeService
+
+
+class PixQRCodeImageUseCase(UseCase[PixQRCodeImageInputPort, PixQRCodeImageOutputPort]):
+    def __init__(self, services: PixQRCodeImageServices) -> None:
+        self.__payment_service = services.payment_service
+        self.__charge_service = services.charge_service
+
+    async def __call__(self, input_port: PixQRCodeImageInputPort) -> PixQRCodeImageOutputPort:
+        pix_copy_paste = await self.__charge_service.retrieve_pix_copy_paste(input_port.txid)
+        image = await self.__payment_service.pix_qrcode_image(pix_copy_paste)
+        return PixQRCodeImageOutputPort(image=image)
@@ -0,0 +1,18 @@
+from typing import NamedTuple
+
+from ..ports import ReceivePixPaymentsInputPort, ReceivePixPaymentsOutputPort
+from ..services import ChargeService
+from .interfaces import UseCase
+
+
+class ReceivePixPaymentsServices(NamedTuple):
+    charge_service: ChargeService
+
+
+class ReceivePixPaymentsUseCase(UseCase[ReceivePixPaymentsInputPort, ReceivePixPaymentsOutputPort]):
+    def __init__(self, services: ReceivePixPaymentsServices) -> None:
+        self.__charge_service = services.charge_service
+
+    async def __call__(self, input_port: ReceivePixPaymentsInputPort) -> ReceivePixPaymentsOutputPort:
+        await self.__charge_service.register_payments(input_port.pix)
+        return ReceivePixPaymentsOutputPort(msg="ok")
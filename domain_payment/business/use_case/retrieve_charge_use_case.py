@@ -0,0 +1,18 @@
+from typing import NamedTuple
+
+from ..ports import RetrieveChargeInputPort, RetrieveChargeOutputPort
+from ..services import ChargeService
+from .interfaces import UseCase
+
+
+class RetrieveChargeServices(NamedTuple):
+    charge_service: ChargeService
+
+
+class RetrieveChargeUseCase(UseCase[RetrieveChargeInputPort, RetrieveChargeOutputPort]):
+    def __init__(self, services: RetrieveChargeServices) -> None:
+        self.__charge_service = services.charge_service
+
+    async def __call__(self, input_port: RetrieveChargeInputPort) -> RetrieveChargeOutputPort:
+        charge_model = await self.__charge_service.retrieve_charge(input_port.uid, input_port.txid)
+        return RetrieveChargeOutputPort(**charge_model.model_dump())
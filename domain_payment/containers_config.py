@@ -5,12 +5,26 @@ from environs import Env
 
 from domain_payment.adapters.__factory__ import AdaptersConfig, AdaptersFactory
 from domain_payment.adapters.controllers.__dependencies__ import bind_controller_dependencies
-from domain_payment.business.__factory__ import BusinessFactory
+from domain_payment.adapters.interface_adapters import (
+    AdminAdapterConfig,
+    ChargeAdapterConfig,
+    IdempotencyAdapterConfig,
+    PaymentAdapterConfig,
+    PixQRCodeDelivery,
+    WarmupAdapterConfig,
+)
+from domain_payment.business.__factory__ import BusinessConfig, BusinessFactory
 from domain_payment.frameworks.__factory__ import FrameworksConfig, FrameworksFactory
+from domain_payment.frameworks.cache import CacheBackend, CacheFrameworkConfig
+from domain_payment.frameworks.circuit_breaker import CircuitBreakerConfig
 from domain_payment.frameworks.firebase import FirebaseFrameworkConfig
 from domain_payment.frameworks.gcp_storage import GCPStorageFrameworkConfig
+from domain_payment.frameworks.metrics import MetricsFrameworkConfig
 from domain_payment.frameworks.mongodb import MotorFrameworkConfig
 from domain_payment.frameworks.pix_efi import PixFrameworkConfig
+from domain_payment.frameworks.qrcode import QRCodeFrameworkConfig
+from domain_payment.types.deadline import create_background_task
+from domain_payment.types.startup import StartupTimings
 
 
 class Config(metaclass=ABCMeta):
@@ -48,13 +62,92 @@ class ProjectConfig(Config):
             firebase_framework_config=self.__firebase_framework_config,
             pix_framework_config=self.__pix_framework_config,
             gcp_storage_framework_config=self.__gcp_storage_framework_config,
+            qrcode_framework_config=self.__qrcode_framework_config,
+            metrics_framework_config=self.__metrics_framework_config,
+            cache_framework_config=self.__cache_framework_config,
         )
 
     @property
     @lru_cache
     def adapters_config(self) -> AdaptersConfig:
         return AdaptersConfig(
+            payment_adapter_config=self.__payment_adapter_config,
+            admin_adapter_config=self.__admin_adapter_config,
+            idempotency_adapter_config=self.__idempotency_adapter_config,
+            charge_adapter_config=self.__charge_adapter_config,
+            warmup_adapter_config=self.__warmup_adapter_config,
+            pix_webhook_secret=self.__pix_webhook_secret,
+            metrics_token=self.__metrics_token,
+            request_timeout=self._env.float("REQUEST_TIMEOUT", 30),
+        )
+
+    @property
+    @lru_cache
+    def business_config(self) -> BusinessConfig:
+        return BusinessConfig(
+            charge_batch_concurrency=self._env.int("CHARGE_BATCH_CONCURRENCY", 8),
+        )
+
+    @property
+    @lru_cache
+    def __pix_webhook_secret(self) -> str | None:
+        if self.is_local:
+            return self._env.str("PIX_WEBHOOK_SECRET", None)
+        return self._env.str("PIX_WEBHOOK_SECRET")
+
+    @property
+    @lru_cache
+    def __metrics_token(self) -> str | None:
+        if self.is_local:
+            return self._env.str("METRICS_TOKEN", None)
+        return self._env.str("METRICS_TOKEN")
+
+    @property
+    @lru_cache
+    def __payment_adapter_config(self) -> PaymentAdapterConfig:
+        return PaymentAdapterConfig(
             pix_qrcode_bucket_name=self._env.str("PIX_QRCODE_BUCKET_NAME"),
+            pix_qrcode_delivery=PixQRCodeDelivery(self._env.str("PIX_QRCODE_DELIVERY", "bucket")),
+            pix_qrcode_base_url=self._env.str("PIX_QRCODE_BASE_URL", ""),
+        )
+
+    @property
+    @lru_cache
+    def __admin_adapter_config(self) -> AdminAdapterConfig:
+        return AdminAdapterConfig(
+            configuration_ttl=self._env.float("ADMIN_CONFIGURATION_TTL", 300),
+        )
+
+    @property
+    @lru_cache
+    def __idempotency_adapter_config(self) -> IdempotencyAdapterConfig:
+        key_ttl = self._env.int("IDEMPOTENCY_KEY_TTL", 1800)
+        if self.__payment_adapter_config.pix_qrcode_delivery in (
+            PixQRCodeDelivery.BUCKET,
+            PixQRCodeDelivery.BACKGROUND,
+        ):
+            key_ttl = min(key_ttl, self.__gcp_storage_framework_config["signed_url_expiration"])
+        return IdempotencyAdapterConfig(
+            key_ttl=key_ttl,
+            lease_timeout=self._env.float("IDEMPOTENCY_LEASE_TIMEOUT", 60),
+            wait_timeout=self._env.float("IDEMPOTENCY_WAIT_TIMEOUT", 10),
+            poll_interval=self._env.float("IDEMPOTENCY_POLL_INTERVAL", 0.2),
+        )
+
+    @property
+    @lru_cache
+    def __charge_adapter_config(self) -> ChargeAdapterConfig:
+        return ChargeAdapterConfig(
+            payment_batch_size=self._env.int("PIX_PAYMENT_BATCH_SIZE", 500),
+            payment_flush_interval=self._env.float("PIX_PAYMENT_FLUSH_INTERVAL", 0.5),
+            payment_buffer_size=self._env.int("PIX_PAYMENT_BUFFER_SIZE", 50000),
+        )
+
+    @property
+    @lru_cache
+    def __warmup_adapter_config(self) -> WarmupAdapterConfig:
+        return WarmupAdapterConfig(
+            component_timeout=self._env.float("WARMUP_COMPONENT_TIMEOUT", 20),
         )
 
     @property
@@ -64,6 +157,13 @@ class ProjectConfig(Config):
             database_uri=self._env.str("DB_URI"),
             service_name=self._env.str("SERVICE_NAME"),
             sandbox=self.is_local or self.is_staging,
+            max_pool_size=self._env.int("MONGO_MAX_POOL_SIZE", 20),
+            min_pool_size=self._env.int("MONGO_MIN_POOL_SIZE", 2),
+            max_idle_time_ms=self._env.int("MONGO_MAX_IDLE_TIME_MS", 300000),
+            wait_queue_timeout_ms=self._env.int("MONGO_WAIT_QUEUE_TIMEOUT_MS", None),
+            compressors=self._env.str("MONGO_COMPRESSORS", None),
+            read_preference=self._env.str("MONGO_READ_PREFERENCE", "primary"),
+            read_concern_level=self._env.str("MONGO_READ_CONCERN_LEVEL", None),
         )
 
     @property
@@ -72,6 +172,15 @@ class ProjectConfig(Config):
         return FirebaseFrameworkConfig(
             credentials=self._env.str("GOOGLE_APPLICATION_CREDENTIALS", None),
             auth_app_options={"projectId": self._env.str("PROJECT_ID")},
+            executor_max_workers=self._env.int("FIREBASE_EXECUTOR_MAX_WORKERS", 4),
+            token_cache_size=self._env.int("FIREBASE_TOKEN_CACHE_SIZE", 1024),
+            user_cache_ttl=self._env.float("FIREBASE_USER_CACHE_TTL", 300),
+            user_cache_negative_ttl=self._env.float("FIREBASE_USER_CACHE_NEGATIVE_TTL", 30),
+            public_keys_url=self._env.str(
+                "FIREBASE_PUBLIC_KEYS_URL",
+                "https://www.googleapis.com/service_accounts/v1/jwk/securetoken@system.gserviceaccount.com",
+            ),
+            circuit_breaker=self.__circuit_breaker_config("FIREBASE", call_timeout=5),
         )
 
     @property
@@ -85,6 +194,17 @@ class ProjectConfig(Config):
             client_id=self._env.str("CLIENT_ID"),
             client_secret=self._env.str("CLIENT_SECRET"),
             sandbox=self.is_local or self.is_staging,
+            base_url=self._env.str("PIX_BASE_URL", None),
+            certificate_file=self._env.str("PIX_CERTIFICATE_FILE", None),
+            ca_file=self._env.str("PIX_CA_FILE", None),
+            token_refresh_margin=self._env.int("PIX_TOKEN_REFRESH_MARGIN", 60),
+            rate_limit=self._env.float("PIX_RATE_LIMIT", 20),
+            rate_limit_burst=self._env.int("PIX_RATE_LIMIT_BURST", 20),
+            max_concurrency=self._env.int("PIX_MAX_CONCURRENCY", 10),
+            throttling_retries=self._env.int("PIX_THROTTLING_RETRIES", 3),
+            keepalive_timeout=self._env.float("PIX_KEEPALIVE_TIMEOUT", 60),
+            warmup_connections=self._env.int("PIX_WARMUP_CONNECTIONS", 2),
+            circuit_breaker=self.__circuit_breaker_config("PIX", call_timeout=10),
         )
 
     @property
@@ -92,7 +212,54 @@ class ProjectConfig(Config):
     def __gcp_storage_framework_config(self) -> GCPStorageFrameworkConfig:
         return GCPStorageFrameworkConfig(
             storage_credentials=self._env.str("GOOGLE_APPLICATION_CREDENTIALS", None),
+            api_root=self._env.str("STORAGE_API_ROOT", None),
             service_account_email=self._env.str("SERVICE_ACCOUNT_EMAIL", None),
+            signed_url_expiration=self._env.int("SIGNED_URL_EXPIRATION", 1800),
+            upload_queue_size=self._env.int("UPLOAD_QUEUE_SIZE", 1000),
+            upload_workers=self._env.int("UPLOAD_WORKERS", 4),
+            upload_retries=self._env.int("UPLOAD_RETRIES", 3),
+            upload_retry_backoff=self._env.float("UPLOAD_RETRY_BACKOFF", 0.5),
+            upload_drain_timeout=self._env.float("UPLOAD_DRAIN_TIMEOUT", 10.0),
+            circuit_breaker=self.__circuit_breaker_config("STORAGE", call_timeout=10),
+        )
+
+    def __circuit_breaker_config(self, prefix: str, call_timeout: float) -> CircuitBreakerConfig:
+        return CircuitBreakerConfig(
+            failure_threshold=self._env.int(f"{prefix}_CIRCUIT_FAILURE_THRESHOLD", 5),
+            reset_timeout=self._env.float(f"{prefix}_CIRCUIT_RESET_TIMEOUT", 30),
+            call_timeout=self._env.float(f"{prefix}_CALL_TIMEOUT", call_timeout),
+        )
+
+    @property
+    @lru_cache
+    def __qrcode_framework_config(self) -> QRCodeFrameworkConfig:
+        return QRCodeFrameworkConfig(
+            scale=self._env.int("PIX_QRCODE_SCALE", 6),
+            cache_size=self._env.int("PIX_QRCODE_IMAGE_CACHE_SIZE", 1024),
+        )
+
+    @property
+    @lru_cache
+    def __metrics_framework_config(self) -> MetricsFrameworkConfig:
+        return MetricsFrameworkConfig(
+            namespace=self._env.str("METRICS_NAMESPACE", "domain_payment"),
+            latency_buckets=self._env.list(
+                "METRICS_LATENCY_BUCKETS",
+                [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+                subcast=float,
+            ),
+        )
+
+    @property
+    @lru_cache
+    def __cache_framework_config(self) -> CacheFrameworkConfig:
+        return CacheFrameworkConfig(
+            backend=CacheBackend(self._env.str("CACHE_BACKEND", "local")),
+            key_prefix=self._env.str("CACHE_KEY_PREFIX", "domain-payment"),
+            local_max_entries=self._env.int("CACHE_LOCAL_MAX_ENTRIES", 8192),
+            shared_slots=self._env.int("CACHE_SHARED_SLOTS", 4096),
+            shared_slot_size=self._env.int("CACHE_SHARED_SLOT_SIZE", 2048),
+            redis_url=self._env.str("CACHE_REDIS_URL", None),
         )
 
 
@@ -101,9 +268,15 @@ class AppBinding:
     adapters: AdaptersFactory
     frameworks: FrameworksFactory
 
-    def __init__(self, frameworks_config: FrameworksConfig, adapters_config: AdaptersConfig) -> None:
+    def __init__(
+        self,
+        frameworks_config: FrameworksConfig,
+        adapters_config: AdaptersConfig,
+        business_config: BusinessConfig,
+    ) -> None:
         self.frameworks_config = frameworks_config
         self.adapters_config = adapters_config
+        self.business_config = business_config
 
     def bind_frameworks(self) -> None:
         self.frameworks = FrameworksFactory(self.frameworks_config)
@@ -112,14 +285,37 @@ class AppBinding:
         self.adapters = AdaptersFactory(self.frameworks, self.adapters_config)
 
     def bind_business(self) -> None:
-        self.business = BusinessFactory(self.adapters)
+        self.business = BusinessFactory(self.adapters, self.business_config)
 
     def bind_controllers(self) -> None:
         authentication_framework = self.frameworks.authentication_provider()
-        bind_controller_dependencies(self.business, authentication_framework)
+        metrics_framework = self.frameworks.metrics_provider()
+        bind_controller_dependencies(
+            self.business,
+            authentication_framework,
+            metrics_framework,
+            self.adapters.warmup_service,
+            pix_webhook_secret=self.adapters_config.pix_webhook_secret,
+            metrics_token=self.adapters_config.metrics_token,
+        )
 
     def facade(self) -> None:
         self.bind_frameworks()
         self.bind_adapters()
         self.bind_business()
         self.bind_controllers()
+
+    async def startup(self) -> StartupTimings:
+        startup_timings = StartupTimings()
+        with startup_timings.phase("frameworks"):
+            await self.frameworks.connect()
+        startup_timings.merge("frameworks", self.frameworks.startup_timings)
+        await startup_timings.measure("adapters", self.adapters.connect())
+        with startup_timings.phase("business"):
+            self.business.charge_pix_use_case()
+        create_background_task(self.adapters.warmup_service().warm_up())
+        return startup_timings
+
+    async def shutdown(self) -> None:
+        await self.adapters.close()
+        await self.frameworks.close()
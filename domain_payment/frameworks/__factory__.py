@@ -1,71 +1,130 @@
-from functools import lru_cache
+import asyncio
 
 import aiohttp
 
 from domain_payment.adapters.__factory__ import FrameworksFactoryInterface
+from domain_payment.adapters.interface_adapters.interfaces import WarmupProvider
+from domain_payment.business.__factory__ import Lifetime, scoped
+from domain_payment.types.startup import StartupTimings
 
+from .cache import CacheFrameworkConfig, CacheManager
 from .firebase import FirebaseFrameworkConfig, FirebaseManager
 from .gcp_storage import GCPStorageFrameworkConfig, GCPStorageManager
+from .metrics import MetricsFrameworkConfig, MetricsManager
 from .mongodb import MotorFrameworkConfig, MotorManager
 from .pix_efi import PixFrameworkConfig, PixManager
+from .qrcode import QRCodeFrameworkConfig, QRCodeManager
 
 
 class FrameworksConfig:
     def __init__(
         self,
+        *,
         firebase_framework_config: FirebaseFrameworkConfig,
         motor_framework_config: MotorFrameworkConfig,
         gcp_storage_framework_config: GCPStorageFrameworkConfig,
         pix_framework_config: PixFrameworkConfig,
+        qrcode_framework_config: QRCodeFrameworkConfig,
+        metrics_framework_config: MetricsFrameworkConfig,
+        cache_framework_config: CacheFrameworkConfig,
     ) -> None:
         self.firebase_framework_config = firebase_framework_config
         self.motor_framework_config = motor_framework_config
         self.gcp_storage_framework_config = gcp_storage_framework_config
         self.pix_framework_config = pix_framework_config
+        self.qrcode_framework_config = qrcode_framework_config
+        self.metrics_framework_config = metrics_framework_config
+        self.cache_framework_config = cache_framework_config
 
 
-class FrameworksFactory(
+class FrameworksFactory(  # pylint: disable=R0902
     FrameworksFactoryInterface[
         MotorManager,
         GCPStorageManager,
         FirebaseManager,
         FirebaseManager,
         PixManager,
+        QRCodeManager,
+        MetricsManager,
+        CacheManager,
     ]
 ):
     __session: aiohttp.ClientSession
 
     def __init__(self, config: FrameworksConfig) -> None:
         self.__config = config
+        self.startup_timings = StartupTimings()
+        self.__metrics_manager = MetricsManager(config.metrics_framework_config)
+        self.__cache_manager = CacheManager(config.cache_framework_config)
         self.__motor_manager = MotorManager(config.motor_framework_config)
-        self.__pix_manager = PixManager(config.pix_framework_config)
+        self.__pix_manager = PixManager(config.pix_framework_config, self.__metrics_manager, self.__cache_manager)
+        self.__qrcode_manager = QRCodeManager(config.qrcode_framework_config)
 
     async def connect(self) -> None:
-        await self.__motor_manager.connect()
-        await self.__pix_manager.connect()
         self.__session = aiohttp.ClientSession()
+        await self.startup_timings.measure("cache", self.__cache_manager.connect())
+        await asyncio.gather(
+            self.startup_timings.measure("mongodb", self.__motor_manager.connect()),
+            self.startup_timings.measure("pix", self.__pix_manager.connect()),
+            self.startup_timings.measure("firebase", self.__firebase_manager().connect(self.__session)),
+        )
+        self.__register_collectors()
 
     async def close(self) -> None:
         self.__motor_manager.close()
-        self.__pix_manager.close()
+        await self.__pix_manager.close()
+        self.__firebase_manager().close()
+        await self.bucket_provider().close()
         await self.__session.close()
+        await self.__cache_manager.close()
 
     def database_provider(self) -> MotorManager:
         return self.__motor_manager
 
+    @scoped(Lifetime.WORKER)
     def bucket_provider(self) -> GCPStorageManager:
-        return GCPStorageManager(self.__config.gcp_storage_framework_config, self.__session)
+        return GCPStorageManager(self.__config.gcp_storage_framework_config, self.__session, self.__metrics_manager)
 
     def authentication_provider(self) -> FirebaseManager:
-        return self.__firebase_manager
+        return self.__firebase_manager()
 
     def user_provider(self) -> FirebaseManager:
-        return self.__firebase_manager
+        return self.__firebase_manager()
 
     def pix_provider(self) -> PixManager:
-        return PixManager(self.__config.pix_framework_config)
+        return self.__pix_manager
 
-    @property
-    @lru_cache
+    def qrcode_provider(self) -> QRCodeManager:
+        return self.__qrcode_manager
+
+    def metrics_provider(self) -> MetricsManager:
+        return self.__metrics_manager
+
+    def cache_provider(self) -> CacheManager:
+        return self.__cache_manager
+
+    def warmup_providers(self) -> list[WarmupProvider]:
+        return [self.__motor_manager, self.__pix_manager, self.__firebase_manager()]
+
+    @scoped(Lifetime.SINGLETON)
     def __firebase_manager(self) -> FirebaseManager:
-        return FirebaseManager(self.__config.firebase_framework_config)
+        return FirebaseManager(self.__config.firebase_framework_config, self.__metrics_manager, self.__cache_manager)
+
+    def __register_collectors(self) -> None:
+        self.__metrics_manager.register_collector("cache", lambda: self.__cache_manager.metrics)
+        self.__metrics_manager.register_collector("mongodb_pool", lambda: self.__motor_manager.pool_metrics)
+        self.__metrics_manager.register_collector("pix_token_cache", lambda: self.__pix_manager.token_metrics)
+        self.__metrics_manager.register_collector("pix_rate_limiter", lambda: self.__pix_manager.rate_limiter_metrics)
+        self.__metrics_manager.register_collector(
+            "pix_circuit_breaker", lambda: self.__pix_manager.circuit_breaker_metrics
+        )
+        self.__metrics_manager.register_collector("storage_uploads", lambda: self.bucket_provider().upload_metrics)
+        self.__metrics_manager.register_collector(
+            "storage_circuit_breaker", lambda: self.bucket_provider().circuit_breaker_metrics
+        )
+        self.__metrics_manager.register_collector(
+            "firebase_user_profiles", lambda: self.__firebase_manager().user_profile_metrics
+        )
+        self.__metrics_manager.register_collector(
+            "firebase_circuit_breaker", lambda: self.__firebase_manager().circuit_breaker_metrics
+        )
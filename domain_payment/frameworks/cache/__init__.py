@@ -0,0 +1,3 @@
+from .manager import CacheBackend, CacheFrameworkConfig, CacheManager, CacheMetrics
+
+__all__ = ["CacheBackend", "CacheFrameworkConfig", "CacheManager", "CacheMetrics"]
@@ -0,0 +1,284 @@
+import hashlib
+import importlib
+import json
+import logging
+import mmap
+import multiprocessing
+import struct
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from enum import UNIQUE, Enum, verify
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Awaitable, Iterator, NamedTuple, TypedDict
+
+from domain_payment.adapters.interface_adapters.interfaces import CacheProvider
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+@verify(UNIQUE)
+class CacheBackend(Enum):
+    LOCAL = "local"
+    SHARED = "shared"
+    REDIS = "redis"
+
+
+class CacheFrameworkConfig(TypedDict):
+    backend: CacheBackend
+    key_prefix: str
+    local_max_entries: int
+    shared_slots: int
+    shared_slot_size: int
+    redis_url: str | None
+
+
+class CacheMetrics(NamedTuple):
+    backend: CacheBackend
+    hits: int
+    misses: int
+    sets: int
+    evictions: int
+    errors: int
+
+
+class CacheUnavailable(Exception): ...
+
+
+class CacheStore(CacheProvider):  # pylint: disable=W0223
+    evictions = 0
+
+    async def connect(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class LocalCache(CacheStore):
+    def __init__(self, max_entries: int) -> None:
+        self.__max_entries = max_entries
+        self.__entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+
+    async def get(self, key: str) -> Any | None:
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+        if time.time() >= entry[1]:
+            del self.__entries[key]
+            return None
+        self.__entries.move_to_end(key)
+        return entry[0]
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        values = {key: await self.get(key) for key in keys}
+        return {key: value for key, value in values.items() if value is not None}
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self.__entries[key] = (value, time.time() + ttl)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.__max_entries:
+            self.__entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        self.__entries.pop(key, None)
+
+
+class SharedMemoryCache(CacheStore):
+    HEADER = struct.Struct("<8sdI")
+
+    def __init__(self, slots: int, slot_size: int) -> None:
+        if slot_size <= self.HEADER.size:
+            raise ValueError(f"Shared cache slots must be larger than {self.HEADER.size} bytes")
+        self.__slots = slots
+        self.__slot_size = slot_size
+        self.__segment = mmap.mmap(-1, slots * slot_size)
+        self.__lock = multiprocessing.Lock()
+
+    async def get(self, key: str) -> Any | None:
+        digest, offset = self.__locate(key)
+        with self.__locked():
+            slot_digest, expires_at, length = self.HEADER.unpack_from(self.__segment, offset)
+            if slot_digest != digest or time.time() >= expires_at:
+                return None
+            start = offset + self.HEADER.size
+            payload = self.__segment[start : start + length]
+        stored_key, value = json.loads(payload)
+        return value if stored_key == key else None
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        values = {key: await self.get(key) for key in keys}
+        return {key: value for key, value in values.items() if value is not None}
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        payload = json.dumps([key, value], separators=(",", ":"), default=str).encode()
+        if len(payload) > self.__slot_size - self.HEADER.size:
+            return
+        digest, offset = self.__locate(key)
+        start = offset + self.HEADER.size
+        with self.__locked():
+            slot_digest, expires_at, _ = self.HEADER.unpack_from(self.__segment, offset)
+            if slot_digest not in (digest, bytes(8)) and time.time() < expires_at:
+                self.evictions += 1
+            self.__segment[start : start + len(payload)] = payload
+            self.HEADER.pack_into(self.__segment, offset, digest, time.time() + ttl, len(payload))
+
+    async def delete(self, key: str) -> None:
+        digest, offset = self.__locate(key)
+        with self.__locked():
+            if self.HEADER.unpack_from(self.__segment, offset)[0] == digest:
+                self.HEADER.pack_into(self.__segment, offset, bytes(8), 0.0, 0)
+
+    async def close(self) -> None:
+        self.__segment.close()
+
+    def __locate(self, key: str) -> tuple[bytes, int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        return digest, int.from_bytes(digest, "little") % self.__slots * self.__slot_size
+
+    @contextmanager
+    def __locked(self) -> Iterator[None]:
+        if not self.__lock.acquire(block=False):
+            raise CacheUnavailable("The shared memory cache lock is held by another worker")
+        try:
+            yield
+        finally:
+            self.__lock.release()
+
+
+class RedisCache(CacheStore):
+    CLIENT_MODULE = "redis.asyncio"
+
+    __redis: ModuleType
+    __client: "Redis"
+
+    def __init__(self, url: str) -> None:
+        self.__url = url
+
+    async def connect(self) -> None:
+        self.__redis = importlib.import_module(self.CLIENT_MODULE)
+        self.__client = self.__redis.Redis.from_url(self.__url)
+
+    async def get(self, key: str) -> Any | None:
+        payload = await self.__call(self.__client.get(key))
+        return json.loads(payload) if payload is not None else None
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        if not keys:
+            return {}
+        payloads = await self.__call(self.__client.mget(keys))
+        return {key: json.loads(payload) for key, payload in zip(keys, payloads) if payload is not None}
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        payload = json.dumps(value, separators=(",", ":"), default=str)
+        await self.__call(self.__client.set(key, payload, px=max(int(ttl * 1000), 1)))
+
+    async def delete(self, key: str) -> None:
+        await self.__call(self.__client.delete(key))
+
+    async def close(self) -> None:
+        await self.__client.aclose()
+
+    async def __call(self, command: Awaitable[Any]) -> Any:
+        try:
+            return await command
+        except self.__redis.RedisError as error:
+            raise CacheUnavailable(str(error)) from error
+
+
+class CacheManager(CacheProvider):  # pylint: disable=R0902
+    def __init__(self, config: CacheFrameworkConfig) -> None:
+        self.__logger = logging.getLogger(self.__class__.__name__)
+        self.__backend = config["backend"]
+        self.__key_prefix = f"{config['key_prefix']}:" if config["key_prefix"] else ""
+        self.__store = self.__create_store(config)
+        self.__available = True
+        self.__hits = 0
+        self.__misses = 0
+        self.__sets = 0
+        self.__errors = 0
+
+    async def connect(self) -> None:
+        await self.__store.connect()
+        self.__logger.info("Using the %s cache backend", self.__backend.value)
+
+    async def close(self) -> None:
+        await self.__store.close()
+
+    @property
+    def metrics(self) -> CacheMetrics:
+        return CacheMetrics(
+            backend=self.__backend,
+            hits=self.__hits,
+            misses=self.__misses,
+            sets=self.__sets,
+            evictions=self.__store.evictions,
+            errors=self.__errors,
+        )
+
+    async def get(self, key: str) -> Any | None:
+        try:
+            value = await self.__store.get(self.__key_prefix + key)
+        except CacheUnavailable as error:
+            self.__record_error(error)
+            value = None
+        else:
+            self.__record_recovery()
+        if value is None:
+            self.__misses += 1
+        else:
+            self.__hits += 1
+        return value
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        try:
+            values = await self.__store.get_many([self.__key_prefix + key for key in keys])
+        except CacheUnavailable as error:
+            self.__record_error(error)
+            values = {}
+        else:
+            self.__record_recovery()
+        found = {key: values[self.__key_prefix + key] for key in keys if self.__key_prefix + key in values}
+        self.__hits += len(found)
+        self.__misses += len(keys) - len(found)
+        return found
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        try:
+            await self.__store.set(self.__key_prefix + key, value, ttl)
+        except CacheUnavailable as error:
+            self.__record_error(error)
+        else:
+            self.__sets += 1
+            self.__record_recovery()
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self.__store.delete(self.__key_prefix + key)
+        except CacheUnavailable as error:
+            self.__record_error(error)
+        else:
+            self.__record_recovery()
+
+    def __record_error(self, error: CacheUnavailable) -> None:
+        self.__errors += 1
+        if self.__available:
+            self.__available = False
+            self.__logger.warning(
+                "The %s cache is unavailable, falling back to the origin: %s", self.__backend.value, error
+            )
+
+    def __record_recovery(self) -> None:
+        if not self.__available:
+            self.__available = True
+            self.__logger.info("The %s cache is available again", self.__backend.value)
+
+    @staticmethod
+    def __create_store(config: CacheFrameworkConfig) -> CacheStore:
+        if config["backend"] is CacheBackend.SHARED:
+            return SharedMemoryCache(config["shared_slots"], config["shared_slot_size"])
+        if config["backend"] is CacheBackend.REDIS:
+            if not config["redis_url"]:
+                raise ValueError("CACHE_REDIS_URL is required by the redis cache backend")
+            return RedisCache(config["redis_url"])
+        return LocalCache(config["local_max_entries"])
@@ -0,0 +1,3 @@
+from .manager import CircuitBreaker, CircuitBreakerConfig, CircuitBreakerMetrics, CircuitOpen, CircuitState
+
+__all__ = ["CircuitBreaker", "CircuitBreakerConfig", "CircuitBreakerMetrics", "CircuitOpen", "CircuitState"]
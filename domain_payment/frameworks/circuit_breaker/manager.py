@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import math
+import time
+from enum import UNIQUE, Enum, verify
+from typing import Awaitable, Callable, NamedTuple, TypedDict, TypeVar
+
+from fastapi import status
+from fastapi.exceptions import HTTPException
+
+from domain_payment.types.deadline import remaining_time
+
+T_result = TypeVar("T_result")
+
+
+class CircuitBreakerConfig(TypedDict):
+    failure_threshold: int
+    reset_timeout: float
+    call_timeout: float
+
+
+@verify(UNIQUE)
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreakerMetrics(NamedTuple):
+    state: CircuitState
+    consecutive_failures: int
+    failures: int
+    timeouts: int
+    rejections: int
+    openings: int
+
+
+class CircuitOpen(HTTPException):
+    def __init__(self, name: str, retry_after: float) -> None:
+        self.retry_after = max(math.ceil(retry_after), 1)
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"{name} is temporarily unavailable",
+            headers={"Retry-After": str(self.retry_after)},
+        )
+
+
+class CircuitBreaker:  # pylint: disable=R0902
+    def __init__(
+        self,
+        name: str,
+        config: CircuitBreakerConfig,
+        is_failure: Callable[[Exception], bool] = lambda _: True,
+    ) -> None:
+        self.__logger = logging.getLogger(self.__class__.__name__)
+        self.__name = name
+        self.__failure_threshold = config["failure_threshold"]
+        self.__reset_timeout = config["reset_timeout"]
+        self.__call_timeout = config["call_timeout"]
+        self.__is_failure = is_failure
+        self.__state = CircuitState.CLOSED
+        self.__opened_at = 0.0
+        self.__probing = False
+        self.__consecutive_failures = 0
+        self.__failures = 0
+        self.__timeouts = 0
+        self.__rejections = 0
+        self.__openings = 0
+
+    @property
+    def metrics(self) -> CircuitBreakerMetrics:
+        return CircuitBreakerMetrics(
+            state=self.__state,
+            consecutive_failures=self.__consecutive_failures,
+            failures=self.__failures,
+            timeouts=self.__timeouts,
+            rejections=self.__rejections,
+            openings=self.__openings,
+        )
+
+    def guard(self) -> None:
+        if self.__state is CircuitState.CLOSED:
+            return
+        retry_after = self.__opened_at + self.__reset_timeout - time.monotonic()
+        if self.__state is CircuitState.OPEN and retry_after <= 0:
+            self.__state = CircuitState.HALF_OPEN
+        if self.__state is CircuitState.HALF_OPEN and not self.__probing:
+            return
+        self.__rejections += 1
+        raise CircuitOpen(self.__name, retry_after)
+
+    async def call(self, operation: Callable[[], Awaitable[T_result]]) -> T_result:
+        self.guard()
+        probe = self.__state is CircuitState.HALF_OPEN
+        self.__probing = self.__probing or probe
+        call_timeout = remaining_time(self.__call_timeout)
+        try:
+            async with asyncio.timeout(call_timeout):
+                result = await operation()
+        except TimeoutError:
+            if call_timeout == self.__call_timeout:
+                self.__timeouts += 1
+                self.__record_failure()
+            raise
+        except Exception as error:
+            if self.__is_failure(error):
+                self.__record_failure()
+            elif probe:
+                self.__record_success()
+            raise
+        else:
+            self.__record_success()
+            return result
+        finally:
+            if probe:
+                self.__probing = False
+
+    def __record_success(self) -> None:
+        if self.__state is not CircuitState.CLOSED:
+            self.__logger.info("Circuit %s closed", self.__name)
+        self.__state = CircuitState.CLOSED
+        self.__consecutive_failures = 0
+
+    def __record_failure(self) -> None:
+        self.__failures += 1
+        self.__consecutive_failures += 1
+        if self.__state is CircuitState.HALF_OPEN or self.__consecutive_failures >= self.__failure_threshold:
+            if self.__state is not CircuitState.OPEN:
+                self.__openings += 1
+                self.__logger.warning("Circuit %s opened after %d failures", self.__name, self.__consecutive_failures)
+            self.__state = CircuitState.OPEN
+            self.__opened_at = time.monotonic()
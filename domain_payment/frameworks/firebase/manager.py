@@ -1,56 +1,394 @@
-from typing import TypedDict
+import asyncio
+import hashlib
+import logging
+import random
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, NamedTuple, TypedDict
 
-import firebase_admin
-import firebase_admin.auth
+import jwt
+from aiohttp import ClientError, ClientSession
 from fastapi import status
 from fastapi.exceptions import HTTPException
-from firebase_admin import credentials
 
 from domain_payment.adapters.interface_adapters.interfaces import (
     AuthenticationProvider,
     BearerToken,
+    CacheProvider,
+    MetricsProvider,
     UserProvider,
     UserUid,
+    WarmupProvider,
 )
 from domain_payment.models import AuthenticatedUserModel
+from domain_payment.types.deadline import create_background_task
+
+from ..circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitBreakerMetrics, CircuitOpen
+
+if TYPE_CHECKING:
+    import firebase_admin
 
 
 class FirebaseFrameworkConfig(TypedDict):
     credentials: str | None
     auth_app_options: dict[str, str]
+    executor_max_workers: int
+    token_cache_size: int
+    user_cache_ttl: float
+    user_cache_negative_ttl: float
+    public_keys_url: str
+    circuit_breaker: CircuitBreakerConfig
+
+
+class GooglePublicKeys:  # pylint: disable=R0902
+    DEFAULT_MAX_AGE = 3600
+    MIN_REFRESH_INTERVAL = 60
+    CACHE_KEY = "firebase:jwks"
+
+    __session: ClientSession
+
+    def __init__(self, url: str, cache_provider: CacheProvider) -> None:
+        self.__logger = logging.getLogger(self.__class__.__name__)
+        self.__url = url
+        self.__cache = cache_provider
+        self.__keys: dict[str, jwt.PyJWK] = {}
+        self.__fetched_at = 0.0
+        self.__refresh_allowed_at = 0.0
+        self.__refreshing: asyncio.Task[None] | None = None
+        self.__scheduled_refresh: asyncio.Task[None] | None = None
+
+    async def connect(self, session: ClientSession) -> None:
+        self.__session = session
+        try:
+            await self.__refresh()
+        except ClientError as error:
+            self.__logger.warning("Google public keys could not be loaded on startup: %s", error)
+
+    def close(self) -> None:
+        for task in (self.__scheduled_refresh, self.__refreshing):
+            if task is not None:
+                task.cancel()
 
+    @property
+    def loaded(self) -> bool:
+        return bool(self.__keys)
+
+    async def load(self) -> None:
+        if not self.__keys:
+            await asyncio.shield(self.__refresh())
+
+    async def get(self, key_id: str) -> jwt.PyJWK | None:
+        if key_id not in self.__keys and time.monotonic() >= self.__refresh_allowed_at:
+            await asyncio.shield(self.__refresh())
+        return self.__keys.get(key_id)
+
+    def __refresh(self) -> asyncio.Task[None]:
+        if self.__refreshing is None or self.__refreshing.done():
+            self.__refreshing = asyncio.create_task(self.__fetch_keys())
+        return self.__refreshing
+
+    async def __fetch_keys(self) -> None:
+        self.__refresh_allowed_at = time.monotonic() + self.MIN_REFRESH_INTERVAL
+        cached = await self.__cache.get(self.CACHE_KEY)
+        if cached is None or cached["fetched_at"] <= self.__fetched_at:
+            cached = await self.__download_keys()
+            await self.__cache.set(self.CACHE_KEY, cached, cached["expires_at"] - cached["fetched_at"])
+        self.__keys = {jwk["kid"]: jwt.PyJWK(jwk) for jwk in cached["jwks"]["keys"]}
+        self.__fetched_at = cached["fetched_at"]
+        expires_in = cached["expires_at"] - time.time()
+        jitter = random.uniform(0, self.MIN_REFRESH_INTERVAL)
+        self.__schedule_refresh(max(expires_in - self.MIN_REFRESH_INTERVAL - jitter, self.MIN_REFRESH_INTERVAL))
+
+    async def __download_keys(self) -> dict[str, Any]:
+        async with self.__session.get(self.__url, raise_for_status=True) as response:
+            jwks = await response.json()
+            cache_control = response.headers.get("Cache-Control", "")
+        max_age = re.search(r"max-age=(\d+)", cache_control)
+        fetched_at = time.time()
+        expires_in = int(max_age.group(1)) if max_age else self.DEFAULT_MAX_AGE
+        return {"jwks": jwks, "fetched_at": fetched_at, "expires_at": fetched_at + expires_in}
+
+    def __schedule_refresh(self, delay: float) -> None:
+        if self.__scheduled_refresh is not None:
+            self.__scheduled_refresh.cancel()
+        self.__scheduled_refresh = create_background_task(self.__refresh_later(delay))
+
+    async def __refresh_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self.__scheduled_refresh = None
+        try:
+            await asyncio.shield(self.__refresh())
+        except ClientError as error:
+            self.__logger.warning("Background Google public keys refresh failed: %s", error)
 
-class FirebaseManager(AuthenticationProvider, UserProvider):
-    def __init__(self, config: FirebaseFrameworkConfig) -> None:
-        credential = config.get("credentials")
-        app_options = config.get("auth_app_options")
+
+class FirebaseTokenVerifier:
+    def __init__(self, project_id: str, public_keys: GooglePublicKeys, cache_size: int) -> None:
+        self.__project_id = project_id
+        self.__issuer = f"https://securetoken.google.com/{project_id}"
+        self.__public_keys = public_keys
+        self.__cache_size = cache_size
+        self.__verified_tokens: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+    async def verify(self, token: str) -> dict[str, Any]:
+        token_hash = hashlib.sha256(token.encode()).hexdigest()
+        verified_claims = self.__verified_tokens.get(token_hash)
+        if verified_claims is not None and time.time() < verified_claims["exp"]:
+            self.__verified_tokens.move_to_end(token_hash)
+            return verified_claims
+        claims = await self.__decode(token)
+        self.__verified_tokens[token_hash] = claims
+        if len(self.__verified_tokens) > self.__cache_size:
+            self.__verified_tokens.popitem(last=False)
+        return claims
+
+    async def __decode(self, token: str) -> dict[str, Any]:
+        header = jwt.get_unverified_header(token)
+        public_key = await self.__public_keys.get(header.get("kid", ""))
+        if public_key is None:
+            raise jwt.InvalidTokenError("Firebase ID token has an unknown key id")
+        claims = jwt.decode(
+            token,
+            public_key.key,
+            algorithms=["RS256"],
+            audience=self.__project_id,
+            issuer=self.__issuer,
+            options={"require": ["exp", "iat", "aud", "iss", "sub", "auth_time"]},
+        )
+        if not claims["sub"] or len(claims["sub"]) > 128 or claims["auth_time"] > time.time():
+            raise jwt.InvalidTokenError("Firebase ID token has invalid claims")
+        return claims
+
+
+class UserProfile(NamedTuple):
+    display_name: str
+
+
+class UserProfileCacheMetrics(NamedTuple):
+    hits: int
+    misses: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class UserProfileCache:  # pylint: disable=R0902
+    CACHE_KEY = "firebase:user:{uid}"
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[UserProfile | None]],
+        fetch_many: Callable[[list[str]], Awaitable[dict[str, UserProfile]]],
+        cache_provider: CacheProvider,
+        ttl: float,
+        negative_ttl: float,
+    ) -> None:
+        self.__fetch = fetch
+        self.__fetch_many = fetch_many
+        self.__cache = cache_provider
+        self.__ttl = ttl
+        self.__negative_ttl = negative_ttl
+        self.__pending: dict[str, asyncio.Task[UserProfile | None]] = {}
+        self.__hits = 0
+        self.__misses = 0
+
+    @property
+    def metrics(self) -> UserProfileCacheMetrics:
+        return UserProfileCacheMetrics(hits=self.__hits, misses=self.__misses)
+
+    async def get(self, uid: str) -> UserProfile | None:
+        cached_profile = await self.__cache.get(self.CACHE_KEY.format(uid=uid))
+        if cached_profile is not None:
+            self.__hits += 1
+            return UserProfile(**cached_profile) if cached_profile else None
+        self.__misses += 1
+        pending = self.__pending.get(uid)
+        if pending is None:
+            pending = asyncio.create_task(self.__load(uid))
+            self.__pending[uid] = pending
+        return await asyncio.shield(pending)
+
+    async def get_many(self, uids: list[str]) -> dict[str, UserProfile | None]:
+        unique_uids = list(dict.fromkeys(uids))
+        keys = {uid: self.CACHE_KEY.format(uid=uid) for uid in unique_uids}
+        cached_profiles = await self.__cache.get_many(list(keys.values()))
+        profiles: dict[str, UserProfile | None] = {}
+        missing_uids = []
+        for uid in unique_uids:
+            cached_profile = cached_profiles.get(keys[uid])
+            if cached_profile is not None:
+                self.__hits += 1
+                profiles[uid] = UserProfile(**cached_profile) if cached_profile else None
+            else:
+                self.__misses += 1
+                missing_uids.append(uid)
+        if missing_uids:
+            fetched_profiles = await self.__fetch_many(missing_uids)
+            for uid in missing_uids:
+                profiles[uid] = await self.__store(uid, fetched_profiles.get(uid))
+        return profiles
+
+    async def __load(self, uid: str) -> UserProfile | None:
+        try:
+            profile = await self.__fetch(uid)
+            return await self.__store(uid, profile)
+        finally:
+            del self.__pending[uid]
+
+    async def __store(self, uid: str, profile: UserProfile | None) -> UserProfile | None:
+        if profile is None:
+            await self.__cache.set(self.CACHE_KEY.format(uid=uid), {}, self.__negative_ttl)
+        else:
+            await self.__cache.set(self.CACHE_KEY.format(uid=uid), profile._asdict(), self.__ttl)
+        return profile
+
+
+class FirebaseManager(AuthenticationProvider, UserProvider, WarmupProvider):  # pylint: disable=R0902
+    BACK_OFFICE_CLAIM = "back_office"
+    USERS_BATCH_SIZE = 100
+
+    __firebase_app: "firebase_admin.App"
+    __auth: ModuleType
+
+    def __init__(
+        self, config: FirebaseFrameworkConfig, metrics_provider: MetricsProvider, cache_provider: CacheProvider
+    ) -> None:
+        self.__metrics = metrics_provider
+        self.__config = config
+        app_options = config["auth_app_options"]
+        self.__executor = ThreadPoolExecutor(config["executor_max_workers"], thread_name_prefix="firebase")
+        self.__public_keys = GooglePublicKeys(config["public_keys_url"], cache_provider)
+        self.__circuit_breaker = CircuitBreaker("Firebase Auth", config["circuit_breaker"], self.__is_failure)
+        self.__token_verifier = FirebaseTokenVerifier(
+            app_options["projectId"], self.__public_keys, config["token_cache_size"]
+        )
+        self.__user_profiles = UserProfileCache(
+            self.__fetch_user_profile,
+            self.__fetch_user_profiles,
+            cache_provider,
+            config["user_cache_ttl"],
+            config["user_cache_negative_ttl"],
+        )
+
+    async def connect(self, session: ClientSession) -> None:
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            self.__public_keys.connect(session),
+            loop.run_in_executor(self.__executor, self.__initialize_app),
+        )
+
+    async def warm_up(self) -> None:
+        await self.__public_keys.load()
+
+    def readiness(self) -> dict[str, bool]:
+        return {"firebase": self.__public_keys.loaded}
+
+    @property
+    def user_profile_metrics(self) -> UserProfileCacheMetrics:
+        return self.__user_profiles.metrics
+
+    @property
+    def circuit_breaker_metrics(self) -> CircuitBreakerMetrics:
+        return self.__circuit_breaker.metrics
+
+    def close(self) -> None:
+        self.__public_keys.close()
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+
+    async def authenticate_by_token(self, token: BearerToken) -> UserUid:
+        claims = await self.__verify(token)
+        return UserUid(claims["sub"])
+
+    async def authenticate_back_office_by_token(self, token: BearerToken) -> UserUid:
+        claims = await self.__verify(token)
+        if claims.get(self.BACK_OFFICE_CLAIM) is not True:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Back-office access is needed")
+        return UserUid(claims["sub"])
+
+    async def get_username(self, user: AuthenticatedUserModel) -> str:
+        try:
+            user_profile = await self.__user_profiles.get(user.uid)
+        except CircuitOpen:
+            raise
+        except Exception as error:
+            raise self.__user_not_available() from error
+        if user_profile is None:
+            raise self.__user_not_available()
+        return user_profile.display_name
+
+    async def get_usernames(self, uids: list[str]) -> dict[str, str]:
+        user_profiles = await self.__user_profiles.get_many(uids)
+        return {uid: profile.display_name for uid, profile in user_profiles.items() if profile is not None}
+
+    def __initialize_app(self) -> None:
+        import firebase_admin  # pylint: disable=C0415
+        from firebase_admin import auth, credentials  # pylint: disable=C0415
+
+        credential = self.__config.get("credentials")
         if credential is None:
             self.__firebase_app = firebase_admin.initialize_app()
         else:
             self.__firebase_app = firebase_admin.initialize_app(
-                credentials.Certificate(credential), options=app_options
+                credentials.Certificate(credential), options=self.__config.get("auth_app_options")
             )
+        self.__auth = auth
 
-    def authenticate_by_token(self, token: BearerToken) -> UserUid:
+    async def __verify(self, token: BearerToken) -> dict[str, Any]:
         try:
-            decoded_token = firebase_admin.auth.verify_id_token(token, self.__firebase_app)
-        except Exception as error:
+            with self.__metrics.measure("auth"):
+                return await self.__token_verifier.verify(token)
+        except (jwt.PyJWTError, ClientError) as error:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid authentication",
                 headers={"WWW-Authenticate": 'Bearer error="invalid_token"'},
             ) from error
 
-        uid = decoded_token["uid"]
-        return UserUid(uid)
+    async def __fetch_user_profiles(self, uids: list[str]) -> dict[str, UserProfile]:
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(
+                self.__circuit_breaker.call(
+                    partial(
+                        loop.run_in_executor,
+                        self.__executor,
+                        self.__auth.get_users,
+                        [self.__auth.UidIdentifier(uid) for uid in uids[start : start + self.USERS_BATCH_SIZE]],
+                        self.__firebase_app,
+                    )
+                )
+                for start in range(0, len(uids), self.USERS_BATCH_SIZE)
+            )
+        )
+        return {
+            user_record.uid: UserProfile(display_name=user_record.display_name)
+            for result in results
+            for user_record in result.users
+        }
 
-    async def get_username(self, user: AuthenticatedUserModel) -> str:
+    async def __fetch_user_profile(self, uid: str) -> UserProfile | None:
+        loop = asyncio.get_running_loop()
         try:
-            user_record = firebase_admin.auth.get_user(user.uid, self.__firebase_app)
-            return user_record.display_name
-        except Exception as error:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User token probably already expired",
-                headers={"WWW-Authenticate": 'Bearer error="invalid_token"'},
-            ) from error
+            user_record = await self.__circuit_breaker.call(
+                partial(loop.run_in_executor, self.__executor, self.__auth.get_user, uid, self.__firebase_app)
+            )
+        except self.__auth.UserNotFoundError:
+            return None
+        return UserProfile(display_name=user_record.display_name)
+
+    def __is_failure(self, error: Exception) -> bool:
+        return not isinstance(error, self.__auth.UserNotFoundError)
+
+    @staticmethod
+    def __user_not_available() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User token probably already expired",
+            headers={"WWW-Authenticate": 'Bearer error="invalid_token"'},
+        )
@@ -1,56 +1,262 @@
-import sys
-from typing import Any, TypedDict
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, NamedTuple, TypedDict
+from urllib.parse import quote
 
+from aiohttp import ClientError
 from aiohttp import ClientSession as Session
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from gcloud.aio.auth import IamClient
 from gcloud.aio.storage import Storage
-from gcloud.aio.storage.blob import Blob
-from gcloud.aio.storage.bucket import Bucket
 
 from domain_payment.adapters.interface_adapters.interfaces import (
     BucketProvider,
     BucketUploader,
     ImageUploadInput,
     ImageUploadOutput,
+    MetricsProvider,
 )
+from domain_payment.types.deadline import create_background_task
+
+from ..circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitBreakerMetrics, CircuitOpen
 
 
 class GCPStorageFrameworkConfig(TypedDict):
     storage_credentials: str | None
+    api_root: str | None
     service_account_email: str | None
+    signed_url_expiration: int
+    upload_queue_size: int
+    upload_workers: int
+    upload_retries: int
+    upload_retry_backoff: float
+    upload_drain_timeout: float
+    circuit_breaker: CircuitBreakerConfig
+
+
+class V4UrlSigner:
+    HOST = "storage.googleapis.com"
+    ALGORITHM = "GOOG4-RSA-SHA256"
+
+    def __init__(self, config: GCPStorageFrameworkConfig, client: Storage, session: Session) -> None:
+        credentials = config.get("storage_credentials")
+        service_data: dict[str, str] = {}
+        if credentials is not None:
+            with open(credentials, encoding="utf-8") as service_file:
+                service_data = json.load(service_file)
+        self.__client_email = service_data.get("client_email") or config.get("service_account_email") or ""
+        self.__private_key = self.__load_private_key(service_data.get("private_key"))
+        self.__client = client
+        self.__session = session
+        self.__iam_client: IamClient | None = None
+
+    async def sign(self, bucket_name: str, object_name: str, expiration: int) -> str:
+        url, string_to_sign = self.__unsigned_url(bucket_name, object_name, expiration)
+        if self.__private_key is not None:
+            signature = self.__private_key.sign(string_to_sign, padding.PKCS1v15(), hashes.SHA256())
+        else:
+            signature = await self.__sign_with_iam(string_to_sign)
+        return f"{url}&X-Goog-Signature={signature.hex()}"
+
+    def __unsigned_url(self, bucket_name: str, object_name: str, expiration: int) -> tuple[str, bytes]:
+        now = datetime.now(timezone.utc)
+        request_timestamp = now.strftime("%Y%m%dT%H%M%SZ")
+        credential_scope = f"{now.strftime('%Y%m%d')}/auto/storage/goog4_request"
+        canonical_uri = f"/{bucket_name}/{quote(object_name, safe='/~')}"
+        query_params = {
+            "X-Goog-Algorithm": self.ALGORITHM,
+            "X-Goog-Credential": f"{self.__client_email}/{credential_scope}",
+            "X-Goog-Date": request_timestamp,
+            "X-Goog-Expires": str(expiration),
+            "X-Goog-SignedHeaders": "host",
+        }
+        canonical_query = "&".join(
+            f"{quote(key, safe='')}={quote(value, safe='')}" for key, value in sorted(query_params.items())
+        )
+        canonical_request = "\n".join(
+            ["GET", canonical_uri, canonical_query, f"host:{self.HOST}\n", "host", "UNSIGNED-PAYLOAD"]
+        )
+        canonical_request_hash = hashlib.sha256(canonical_request.encode()).hexdigest()
+        string_to_sign = "\n".join([self.ALGORITHM, request_timestamp, credential_scope, canonical_request_hash])
+        return f"https://{self.HOST}{canonical_uri}?{canonical_query}", string_to_sign.encode()
+
+    async def __sign_with_iam(self, string_to_sign: bytes) -> bytes:
+        if self.__iam_client is None:
+            self.__iam_client = IamClient(token=self.__client.token, session=self.__session)  # type: ignore
+        response = await self.__iam_client.sign_blob(
+            string_to_sign,
+            service_account_email=self.__client_email,
+            session=self.__session,  # type: ignore
+        )
+        return base64.b64decode(response["signedBlob"])
+
+    @staticmethod
+    def __load_private_key(private_key: str | None) -> rsa.RSAPrivateKey | None:
+        if private_key is None:
+            return None
+        key = serialization.load_pem_private_key(private_key.encode(), password=None)
+        return key if isinstance(key, rsa.RSAPrivateKey) else None
+
+
+class UploadPipelineMetrics(NamedTuple):
+    queue_depth: int
+    uploaded: int
+    retried: int
+    failed: int
+    upload_latency_total: float
+    upload_latency_max: float
+
+    @property
+    def upload_latency_average(self) -> float:
+        return self.upload_latency_total / self.uploaded if self.uploaded else 0.0
+
 
+class UploadPipeline:  # pylint: disable=R0902
+    def __init__(
+        self, upload: Callable[[ImageUploadInput], Awaitable[None]], config: GCPStorageFrameworkConfig
+    ) -> None:
+        self.__logger = logging.getLogger(self.__class__.__name__)
+        self.__upload = upload
+        self.__workers_count = config["upload_workers"]
+        self.__retries = config["upload_retries"]
+        self.__retry_backoff = config["upload_retry_backoff"]
+        self.__drain_timeout = config["upload_drain_timeout"]
+        self.__queue: asyncio.Queue[ImageUploadInput] = asyncio.Queue(config["upload_queue_size"])
+        self.__workers: list[asyncio.Task[None]] = []
+        self.__uploaded = 0
+        self.__retried = 0
+        self.__failed = 0
+        self.__latency_total = 0.0
+        self.__latency_max = 0.0
 
-class GCPStorageManager(BucketProvider, BucketUploader):
-    __client: Storage
+    @property
+    def metrics(self) -> UploadPipelineMetrics:
+        return UploadPipelineMetrics(
+            queue_depth=self.__queue.qsize(),
+            uploaded=self.__uploaded,
+            retried=self.__retried,
+            failed=self.__failed,
+            upload_latency_total=self.__latency_total,
+            upload_latency_max=self.__latency_max,
+        )
 
-    def __init__(self, config: GCPStorageFrameworkConfig, session: Session) -> None:
+    async def submit(self, port: ImageUploadInput) -> None:
+        if not self.__workers:
+            self.__workers = [create_background_task(self.__work()) for _ in range(self.__workers_count)]
+        await self.__queue.put(port)
+
+    async def close(self) -> None:
+        if not self.__workers:
+            return
+        try:
+            await asyncio.wait_for(self.__queue.join(), self.__drain_timeout)
+        except asyncio.TimeoutError:
+            self.__logger.warning("Dropping %d pending uploads on shutdown", self.__queue.qsize())
+        for worker in self.__workers:
+            worker.cancel()
+        await asyncio.gather(*self.__workers, return_exceptions=True)
+        self.__workers = []
+
+    async def __work(self) -> None:
+        while True:
+            port = await self.__queue.get()
+            try:
+                await self.__upload_with_retries(port)
+            except Exception:  # pylint: disable=W0718
+                self.__failed += 1
+                self.__logger.exception("Upload of %s failed unexpectedly", port.image_name_on_bucket)
+            finally:
+                self.__queue.task_done()
+
+    async def __upload_with_retries(self, port: ImageUploadInput) -> None:
+        for attempt in range(self.__retries + 1):
+            started_at = time.perf_counter()
+            try:
+                await self.__upload(port)
+            except (ClientError, asyncio.TimeoutError, CircuitOpen) as error:
+                if attempt == self.__retries:
+                    self.__failed += 1
+                    self.__logger.error("Upload of %s failed: %s", port.image_name_on_bucket, error)
+                    return
+                self.__retried += 1
+                await asyncio.sleep(self.__retry_backoff * 2**attempt)
+            else:
+                latency = time.perf_counter() - started_at
+                self.__uploaded += 1
+                self.__latency_total += latency
+                self.__latency_max = max(self.__latency_max, latency)
+                return
+
+
+class GCPStorageManager(BucketProvider, BucketUploader):  # pylint: disable=R0902
+    def __init__(self, config: GCPStorageFrameworkConfig, session: Session, metrics_provider: MetricsProvider) -> None:
+        self.__metrics = metrics_provider
         self.__credentials = config.get("storage_credentials")
-        self.__service_account_email = config.get("service_account_email")
         self.__session = session
+        self.__client = self.__create_app(session, config["api_root"])
+        self.__signer = V4UrlSigner(config, self.__client, session)
+        self.__signed_url_expiration = config["signed_url_expiration"]
+        self.__circuit_breaker = CircuitBreaker("Cloud Storage", config["circuit_breaker"])
+        self.__pipeline = UploadPipeline(self.__store, config)
+        self.__bucket_metadata: dict[str, dict[str, Any]] = {}
+
+    @property
+    def upload_metrics(self) -> UploadPipelineMetrics:
+        return self.__pipeline.metrics
+
+    @property
+    def circuit_breaker_metrics(self) -> CircuitBreakerMetrics:
+        return self.__circuit_breaker.metrics
+
+    async def close(self) -> None:
+        await self.__pipeline.close()
+
+    async def bucket_metadata(self, bucket_name: str) -> dict[str, Any]:
+        metadata = self.__bucket_metadata.get(bucket_name)
+        if metadata is None:
+            metadata = await self.__circuit_breaker.call(
+                lambda: self.__client.get_bucket_metadata(bucket_name, session=self.__session)
+            )
+            self.__bucket_metadata[bucket_name] = metadata
+        return metadata
 
     async def __aenter__(self) -> BucketUploader:
-        self.__client = self.__create_app(self.__session)
         return self
 
     async def __aexit__(self, *_: Any) -> None: ...
 
     async def upload(self, port: ImageUploadInput) -> ImageUploadOutput:
-        bucket = Bucket(self.__client, port.bucket_name)
-        bucket_metadata = await bucket.get_metadata(session=self.__session)  # type: ignore
-        bucket_metadata["size"] = sys.getsizeof(port.image)
-        blob = Blob(bucket, port.image_name_on_bucket, bucket_metadata)
-        upload_metadata = await blob.upload(port.image, session=self.__session)  # type: ignore
-        signed_image_uri = await Blob(
-            bucket,
-            port.image_name_on_bucket,
-            upload_metadata,
-        ).get_signed_url(
-            1800,
-            service_account_email=self.__service_account_email,
-            session=self.__session,  # type: ignore
-        )  # type: ignore
+        await self.__store(port)
+        return ImageUploadOutput(image_uri=await self.__sign(port))
+
+    async def schedule_upload(self, port: ImageUploadInput) -> ImageUploadOutput:
+        signed_image_uri = await self.__sign(port)
+        await self.__pipeline.submit(port)
         return ImageUploadOutput(image_uri=signed_image_uri)
 
-    def __create_app(self, session: Session) -> Storage:
+    async def __sign(self, port: ImageUploadInput) -> str:
+        with self.__metrics.measure("url_signing"):
+            return await self.__signer.sign(port.bucket_name, port.image_name_on_bucket, self.__signed_url_expiration)
+
+    async def __store(self, port: ImageUploadInput) -> None:
+        with self.__metrics.measure("gcs_upload"):
+            await self.__circuit_breaker.call(
+                lambda: self.__client.upload(
+                    port.bucket_name,
+                    port.image_name_on_bucket,
+                    port.image,
+                    content_type=port.content_type,
+                    session=self.__session,
+                )
+            )
+
+    def __create_app(self, session: Session, api_root: str | None) -> Storage:
         if self.__credentials is not None:
-            return Storage(session=session, service_file=self.__credentials)  # type: ignore
-        return Storage(session=session)  # type: ignore
+            return Storage(session=session, service_file=self.__credentials, api_root=api_root)  # type: ignore
+        return Storage(session=session, api_root=api_root)  # type: ignore
@@ -0,0 +1,3 @@
+from .manager import MetricsFrameworkConfig, MetricsManager
+
+__all__ = ["MetricsManager", "MetricsFrameworkConfig"]
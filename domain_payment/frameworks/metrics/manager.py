@@ -0,0 +1,123 @@
+import os
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from enum import Enum
+from typing import Callable, Iterator, NamedTuple, TypedDict
+
+from domain_payment.adapters.interface_adapters.interfaces import MetricsProvider
+
+Collector = Callable[[], NamedTuple]
+
+
+class MetricsFrameworkConfig(TypedDict):
+    namespace: str
+    latency_buckets: list[float]
+
+
+class LatencyHistogram:
+    def __init__(self, buckets: list[float]) -> None:
+        self.__buckets = buckets
+        self.__counts = [0] * (len(buckets) + 1)
+        self.__sum = 0.0
+
+    def observe(self, duration: float) -> None:
+        self.__counts[bisect_left(self.__buckets, duration)] += 1
+        self.__sum += duration
+
+    def render(self, name: str, labels: str) -> Iterator[str]:
+        cumulative = 0
+        for bucket, count in zip(self.__buckets, self.__counts):
+            cumulative += count
+            yield f'{name}_bucket{{{labels},le="{bucket}"}} {cumulative}'
+        cumulative += self.__counts[-1]
+        yield f'{name}_bucket{{{labels},le="+Inf"}} {cumulative}'
+        yield f"{name}_sum{{{labels}}} {self.__sum}"
+        yield f"{name}_count{{{labels}}} {cumulative}"
+
+
+class StageMetrics:
+    def __init__(self, buckets: list[float]) -> None:
+        self.latency = LatencyHistogram(buckets)
+        self.in_flight = 0
+        self.errors: dict[str, int] = {}
+
+
+class MetricsManager(MetricsProvider):
+    def __init__(self, config: MetricsFrameworkConfig) -> None:
+        self.__namespace = config["namespace"]
+        self.__buckets = sorted(config["latency_buckets"])
+        self.__stages: dict[str, StageMetrics] = {}
+        self.__requests: dict[tuple[str, str, int], LatencyHistogram] = {}
+        self.__collectors: dict[str, Collector] = {}
+
+    def register_collector(self, name: str, collector: Collector) -> None:
+        self.__collectors[name] = collector
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        stage_metrics = self.__stages.get(stage)
+        if stage_metrics is None:
+            stage_metrics = self.__stages[stage] = StageMetrics(self.__buckets)
+        stage_metrics.in_flight += 1
+        started_at = time.perf_counter()
+        try:
+            yield
+        except BaseException as error:
+            error_type = type(error).__name__
+            stage_metrics.errors[error_type] = stage_metrics.errors.get(error_type, 0) + 1
+            raise
+        finally:
+            stage_metrics.latency.observe(time.perf_counter() - started_at)
+            stage_metrics.in_flight -= 1
+
+    def observe_request(self, method: str, route: str, status_code: int, duration: float) -> None:
+        key = (method, route, status_code)
+        histogram = self.__requests.get(key)
+        if histogram is None:
+            histogram = self.__requests[key] = LatencyHistogram(self.__buckets)
+        histogram.observe(duration)
+
+    def render(self) -> str:
+        worker = f'worker="{os.getpid()}"'
+        lines = [*self.__render_requests(worker), *self.__render_stages(worker), *self.__render_collectors(worker)]
+        return "\n".join(lines) + "\n"
+
+    def __render_requests(self, worker: str) -> Iterator[str]:
+        name = f"{self.__namespace}_http_request_duration_seconds"
+        yield f"# HELP {name} Latency of the HTTP requests by route and status."
+        yield f"# TYPE {name} histogram"
+        for (method, route, status_code), histogram in sorted(self.__requests.items()):
+            yield from histogram.render(name, f'{worker},method="{method}",route="{route}",status="{status_code}"')
+
+    def __render_stages(self, worker: str) -> Iterator[str]:
+        stages = sorted(self.__stages.items())
+        name = f"{self.__namespace}_stage_duration_seconds"
+        yield f"# HELP {name} Latency of each request stage."
+        yield f"# TYPE {name} histogram"
+        for stage, stage_metrics in stages:
+            yield from stage_metrics.latency.render(name, f'{worker},stage="{stage}"')
+        name = f"{self.__namespace}_stage_errors_total"
+        yield f"# HELP {name} Errors raised by each request stage."
+        yield f"# TYPE {name} counter"
+        for stage, stage_metrics in stages:
+            for error_type, count in sorted(stage_metrics.errors.items()):
+                yield f'{name}{{{worker},stage="{stage}",error="{error_type}"}} {count}'
+        name = f"{self.__namespace}_stage_in_flight"
+        yield f"# HELP {name} Calls currently running in each request stage."
+        yield f"# TYPE {name} gauge"
+        for stage, stage_metrics in stages:
+            yield f'{name}{{{worker},stage="{stage}"}} {stage_metrics.in_flight}'
+
+    def __render_collectors(self, worker: str) -> Iterator[str]:
+        for collector_name, collector in sorted(self.__collectors.items()):
+            metrics = collector()
+            for field, value in zip(metrics._fields, metrics):
+                name = f"{self.__namespace}_{collector_name}_{field}"
+                yield f"# TYPE {name} gauge"
+                if isinstance(value, Enum):
+                    yield from (
+                        f'{name}{{{worker},{field}="{member.value}"}} {int(member is value)}' for member in type(value)
+                    )
+                else:
+                    yield f"{name}{{{worker}}} {float(value)}"
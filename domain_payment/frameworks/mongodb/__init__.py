@@ -1,3 +1,3 @@
-from .manager import MotorFrameworkConfig, MotorManager
+from .manager import ConnectionPoolMetrics, MotorFrameworkConfig, MotorManager
 
-__all__ = ["MotorManager", "MotorFrameworkConfig"]
+__all__ = ["MotorManager", "MotorFrameworkConfig", "ConnectionPoolMetrics"]
@@ -1,43 +1,153 @@
+import asyncio
 import logging
-from typing import TypedDict
+import threading
+import time
+from typing import Any, NamedTuple, TypedDict
 
 import certifi
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from pymongo.errors import ConnectionFailure
+from pymongo import monitoring
+from pymongo.errors import ConnectionFailure, PyMongoError
 
-from domain_payment.adapters.interface_adapters.interfaces import DatabaseName, DocumentDatabaseProvider
+from domain_payment.adapters.interface_adapters.interfaces import DatabaseName, DocumentDatabaseProvider, WarmupProvider
 
 
 class MotorFrameworkConfig(TypedDict):
     database_uri: str
     service_name: str
     sandbox: bool
+    max_pool_size: int
+    min_pool_size: int
+    max_idle_time_ms: int
+    wait_queue_timeout_ms: int | None
+    compressors: str | None
+    read_preference: str
+    read_concern_level: str | None
 
 
-class MotorManager(DocumentDatabaseProvider[AsyncIOMotorClient, AsyncIOMotorDatabase]):
-    _database_name: str
+class ConnectionPoolMetrics(NamedTuple):
+    connections_created: int
+    connections_closed: int
+    checked_out: int
+    checkouts: int
+    checkout_failures: int
+    checkout_wait_total: float
+    checkout_wait_max: float
 
+    @property
+    def checkout_wait_average(self) -> float:
+        return self.checkout_wait_total / self.checkouts if self.checkouts else 0.0
+
+
+class ConnectionPoolMetricsListener(monitoring.ConnectionPoolListener):  # pylint: disable=R0902
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__checkout_started_at = threading.local()
+        self.__connections_created = 0
+        self.__connections_closed = 0
+        self.__checked_out = 0
+        self.__checkouts = 0
+        self.__checkout_failures = 0
+        self.__checkout_wait_total = 0.0
+        self.__checkout_wait_max = 0.0
+
+    @property
+    def metrics(self) -> ConnectionPoolMetrics:
+        with self.__lock:
+            return ConnectionPoolMetrics(
+                connections_created=self.__connections_created,
+                connections_closed=self.__connections_closed,
+                checked_out=self.__checked_out,
+                checkouts=self.__checkouts,
+                checkout_failures=self.__checkout_failures,
+                checkout_wait_total=self.__checkout_wait_total,
+                checkout_wait_max=self.__checkout_wait_max,
+            )
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        with self.__lock:
+            self.__connections_created += 1
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        with self.__lock:
+            self.__connections_closed += 1
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent) -> None:
+        self.__checkout_started_at.value = time.perf_counter()
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        wait_time = self.__checkout_wait()
+        with self.__lock:
+            self.__checked_out += 1
+            self.__checkouts += 1
+            self.__checkout_wait_total += wait_time
+            self.__checkout_wait_max = max(self.__checkout_wait_max, wait_time)
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        self.__checkout_wait()
+        with self.__lock:
+            self.__checkout_failures += 1
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        with self.__lock:
+            self.__checked_out -= 1
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None: ...
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None: ...
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None: ...
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None: ...
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None: ...
+
+    def __checkout_wait(self) -> float:
+        started_at = getattr(self.__checkout_started_at, "value", None)
+        self.__checkout_started_at.value = None
+        return time.perf_counter() - started_at if started_at is not None else 0.0
+
+
+class MotorManager(  # pylint: disable=R0902
+    DocumentDatabaseProvider[AsyncIOMotorClient, AsyncIOMotorDatabase], WarmupProvider
+):
     def __init__(self, config: MotorFrameworkConfig) -> None:
         self._logger = logging.getLogger(f"{self.__class__.__name__}")
+        self._config = config
         self._service_name = config["service_name"]
         self._database_uri = config["database_uri"]
         self._sandbox = config["sandbox"]
         self._client: AsyncIOMotorClient | None = None
+        self._pool_listener = ConnectionPoolMetricsListener()
+        self._warm = False
 
     async def connect(self) -> None:
         self.close()
         try:
             self._client = self.__get_app()
-            await self._client.admin.command("ping")
+            await self.__warm_up(self._client)
         except ConnectionFailure:  # pragma: no cover
             self._logger.info("Server [%s] not available!", self._database_uri)
         else:
+            self._warm = True
             self._logger.info("Connected to MongoDB")
 
+    async def warm_up(self) -> None:
+        try:
+            await self.__warm_up(self.client)
+        except PyMongoError:
+            self._warm = False
+            raise
+        self._warm = True
+
+    def readiness(self) -> dict[str, bool]:
+        return {"mongodb": self._warm}
+
     def close(self) -> None:
         if self._client is None:
             return
         self._client.close()
+        self._warm = False
         self._logger.info("Closed MongoDB connection.")
 
     @property
@@ -47,15 +157,31 @@ class MotorManager(DocumentDatabaseProvider[AsyncIOMotorClient, AsyncIOMotorData
         return self._client
 
     @property
-    def database(self) -> AsyncIOMotorDatabase:
-        return self.client[self._database_name]
+    def pool_metrics(self) -> ConnectionPoolMetrics:
+        return self._pool_listener.metrics
+
+    def get_database(self, database_name: DatabaseName) -> AsyncIOMotorDatabase:
+        return self.client[database_name.value]
 
-    @database.setter
-    def database(self, database_name: DatabaseName) -> None:
-        self._database_name = database_name.value
+    async def __warm_up(self, client: AsyncIOMotorClient) -> None:
+        connections = max(self._config["min_pool_size"], 1)
+        await asyncio.gather(*(client.admin.command("ping") for _ in range(connections)))
 
     def __get_app(self) -> AsyncIOMotorClient:
+        options: dict[str, Any] = {
+            "appname": self._service_name,
+            "maxPoolSize": self._config["max_pool_size"],
+            "minPoolSize": self._config["min_pool_size"],
+            "maxIdleTimeMS": self._config["max_idle_time_ms"],
+            "waitQueueTimeoutMS": self._config["wait_queue_timeout_ms"],
+            "readPreference": self._config["read_preference"],
+            "event_listeners": [self._pool_listener],
+        }
+        if self._config["compressors"]:
+            options["compressors"] = self._config["compressors"]
+        if self._config["read_concern_level"]:
+            options["readConcernLevel"] = self._config["read_concern_level"]
         if self._sandbox:
-            return AsyncIOMotorClient(self._database_uri, appname=self._service_name)
+            return AsyncIOMotorClient(self._database_uri, **options)
         ca = certifi.where()
-        return AsyncIOMotorClient(self._database_uri, appname=self._service_name, tls=True, tlsCAFile=ca)
+        return AsyncIOMotorClient(self._database_uri, tls=True, tlsCAFile=ca, **options)
@@ -1,15 +1,36 @@
+import asyncio
 import base64
-from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import TypedDict
+import importlib
+import logging
+import os
+import random
+import ssl
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any, AsyncIterator, Mapping, NamedTuple, TypedDict
 
-from efipay import EfiPay
-from google.cloud import secretmanager_v1
-from google.oauth2 import service_account
+import certifi
+from aiohttp import BasicAuth, ClientError, ClientResponseError, ClientSession, TCPConnector
 
-from domain_payment.adapters.interface_adapters.exceptions import PixQRCodeImageTemporarilyUnavailable
-from domain_payment.adapters.interface_adapters.interfaces import PixProvider
+from domain_payment.adapters.interface_adapters.exceptions import (
+    PixChargeTemporarilyUnavailable,
+    PixQRCodeImageTemporarilyUnavailable,
+)
+from domain_payment.adapters.interface_adapters.interfaces import (
+    CacheProvider,
+    MetricsProvider,
+    PixProvider,
+    WarmupProvider,
+)
 from domain_payment.models import PixChargeModel, PixModel
+from domain_payment.types.deadline import create_background_task
+
+from ..circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitBreakerMetrics
+
+if TYPE_CHECKING:
+    from google.cloud.secretmanager_v1 import SecretManagerServiceAsyncClient
 
 
 class GCPSecretConfig(TypedDict):
@@ -23,48 +44,393 @@ class PixFrameworkConfig(GCPSecretConfig):
     client_id: str
     client_secret: str
     sandbox: bool
+    base_url: str | None
+    certificate_file: str | None
+    ca_file: str | None
+    token_refresh_margin: int
+    rate_limit: float
+    rate_limit_burst: int
+    max_concurrency: int
+    throttling_retries: int
+    keepalive_timeout: float
+    warmup_connections: int
+    circuit_breaker: CircuitBreakerConfig
+
+
+class TokenCacheMetrics(NamedTuple):
+    hits: int
+    misses: int
+    refreshes: int
+
+
+class EfiTokenManager:  # pylint: disable=R0902
+    EXPIRATION_SKEW = 5
+    CACHE_KEY = "efi:token:{client_id}"
+
+    def __init__(
+        self,
+        config: PixFrameworkConfig,
+        base_url: str,
+        session: ClientSession,
+        cache_provider: CacheProvider,
+    ) -> None:
+        self.__logger = logging.getLogger(self.__class__.__name__)
+        self.__url = f"{base_url}/oauth/token"
+        self.__credentials = BasicAuth(config["client_id"], config["client_secret"])
+        self.__refresh_margin = config["token_refresh_margin"]
+        self.__session = session
+        self.__cache = cache_provider
+        self.__cache_key = self.CACHE_KEY.format(client_id=config["client_id"])
+        self.__access_token = ""
+        self.__expiration = 0.0
+        self.__expires_at = 0.0
+        self.__refreshing: asyncio.Task[str] | None = None
+        self.__scheduled_refresh: asyncio.Task[None] | None = None
+        self.__hits = 0
+        self.__misses = 0
+        self.__refreshes = 0
+
+    @property
+    def metrics(self) -> TokenCacheMetrics:
+        return TokenCacheMetrics(hits=self.__hits, misses=self.__misses, refreshes=self.__refreshes)
+
+    async def access_token(self) -> str:
+        if time.monotonic() < self.__expiration:
+            self.__hits += 1
+            return self.__access_token
+        self.__misses += 1
+        return await asyncio.shield(self.__refresh())
+
+    def close(self) -> None:
+        for task in (self.__scheduled_refresh, self.__refreshing):
+            if task is not None:
+                task.cancel()
+
+    def __refresh(self) -> asyncio.Task[str]:
+        if self.__refreshing is None or self.__refreshing.done():
+            self.__refreshing = asyncio.create_task(self.__fetch_token())
+        return self.__refreshing
+
+    async def __fetch_token(self) -> str:
+        token = await self.__cache.get(self.__cache_key)
+        if token is None or token["expires_at"] <= max(self.__expires_at, time.time() + self.EXPIRATION_SKEW):
+            token = await self.__request_token()
+            await self.__cache.set(self.__cache_key, token, token["expires_at"] - time.time())
+        expires_in = token["expires_at"] - time.time()
+        self.__access_token = token["access_token"]
+        self.__expires_at = token["expires_at"]
+        self.__expiration = time.monotonic() + expires_in - self.EXPIRATION_SKEW
+        refresh_margin = self.__refresh_margin * random.uniform(0.75, 1.0)
+        self.__schedule_refresh(max(expires_in - refresh_margin, self.EXPIRATION_SKEW))
+        return self.__access_token
 
+    async def __request_token(self) -> dict[str, Any]:
+        async with self.__session.post(
+            self.__url,
+            json={"grant_type": "client_credentials"},
+            auth=self.__credentials,
+            raise_for_status=True,
+        ) as response:
+            token = await response.json()
+        self.__refreshes += 1
+        return {"access_token": token["access_token"], "expires_at": time.time() + int(token["expires_in"])}
 
-class PixManager(PixProvider):
-    __app: EfiPay
-    __temporary_filename: str
+    def __schedule_refresh(self, delay: float) -> None:
+        if self.__scheduled_refresh is not None:
+            self.__scheduled_refresh.cancel()
+        self.__scheduled_refresh = create_background_task(self.__refresh_later(delay))
 
+    async def __refresh_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self.__scheduled_refresh = None
+        try:
+            await asyncio.shield(self.__refresh())
+        except ClientError as error:
+            self.__logger.warning("Background Efí token refresh failed: %s", error)
+
+
+class RateLimiterMetrics(NamedTuple):
+    queue_depth: int
+    in_flight: int
+    acquired: int
+    throttled: int
+    wait_time_total: float
+    wait_time_max: float
+
+    @property
+    def wait_time_average(self) -> float:
+        return self.wait_time_total / self.acquired if self.acquired else 0.0
+
+
+class EfiRateLimiter:  # pylint: disable=R0902
     def __init__(self, config: PixFrameworkConfig) -> None:
+        self.__rate = config["rate_limit"]
+        self.__capacity = float(config["rate_limit_burst"])
+        self.__max_concurrency = config["max_concurrency"]
+        self.__tokens = self.__capacity
+        self.__updated_at = time.monotonic()
+        self.__blocked_until = 0.0
+        self.__token_lock = asyncio.Lock()
+        self.__semaphore = asyncio.Semaphore(self.__max_concurrency)
+        self.__queued = 0
+        self.__in_flight = 0
+        self.__acquired = 0
+        self.__throttled = 0
+        self.__wait_time_total = 0.0
+        self.__wait_time_max = 0.0
+
+    @property
+    def metrics(self) -> RateLimiterMetrics:
+        return RateLimiterMetrics(
+            queue_depth=self.__queued,
+            in_flight=self.__in_flight,
+            acquired=self.__acquired,
+            throttled=self.__throttled,
+            wait_time_total=self.__wait_time_total,
+            wait_time_max=self.__wait_time_max,
+        )
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        started_at = time.monotonic()
+        self.__queued += 1
+        queued = True
+        try:
+            async with self.__semaphore:
+                await self.__take_token()
+                self.__queued -= 1
+                queued = False
+                self.__record_wait(time.monotonic() - started_at)
+                self.__in_flight += 1
+                try:
+                    yield
+                finally:
+                    self.__in_flight -= 1
+        finally:
+            if queued:
+                self.__queued -= 1
+
+    def throttle(self, retry_after: float) -> None:
+        self.__throttled += 1
+        self.__tokens = 0.0
+        self.__updated_at = time.monotonic()
+        self.__blocked_until = max(self.__blocked_until, self.__updated_at + retry_after)
+
+    async def __take_token(self) -> None:
+        async with self.__token_lock:
+            while True:
+                now = time.monotonic()
+                if now < self.__blocked_until:
+                    await asyncio.sleep(self.__blocked_until - now)
+                    continue
+                self.__tokens = min(self.__capacity, self.__tokens + (now - self.__updated_at) * self.__rate)
+                self.__updated_at = now
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.__tokens) / self.__rate)
+
+    def __record_wait(self, wait_time: float) -> None:
+        self.__acquired += 1
+        self.__wait_time_total += wait_time
+        self.__wait_time_max = max(self.__wait_time_max, wait_time)
+
+
+class EfiThrottled(Exception):
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"Efí throttled the request for {retry_after}s")
+        self.retry_after = retry_after
+
+
+class EfiPixClient:
+    DEFAULT_RETRY_AFTER = 1.0
+
+    def __init__(
+        self,
+        config: PixFrameworkConfig,
+        base_url: str,
+        session: ClientSession,
+        token_manager: EfiTokenManager,
+    ) -> None:
+        self.__throttling_retries = config["throttling_retries"]
+        self.__base_url = base_url
+        self.__session = session
+        self.__token_manager = token_manager
+        self.__rate_limiter = EfiRateLimiter(config)
+        self.__circuit_breaker = CircuitBreaker("Efí Pix API", config["circuit_breaker"], self.__is_failure)
+
+    @property
+    def rate_limiter_metrics(self) -> RateLimiterMetrics:
+        return self.__rate_limiter.metrics
+
+    @property
+    def circuit_breaker_metrics(self) -> CircuitBreakerMetrics:
+        return self.__circuit_breaker.metrics
+
+    async def create_immediate_charge(self, body: dict[str, Any]) -> dict[str, Any]:
+        return await self.__request("POST", "/v2/cob", json=body)
+
+    async def generate_qrcode(self, location_id: int) -> dict[str, Any]:
+        return await self.__request("GET", f"/v2/loc/{location_id}/qrcode")
+
+    async def __request(self, method: str, route: str, **kwargs: Any) -> dict[str, Any]:
+        attempt = 0
+        while True:
+            self.__circuit_breaker.guard()
+            retry_on_throttling = attempt < self.__throttling_retries
+            try:
+                async with self.__rate_limiter.slot():
+                    send = partial(self.__send, method, route, retry_on_throttling, **kwargs)
+                    return await self.__circuit_breaker.call(send)
+            except EfiThrottled as throttled:
+                self.__rate_limiter.throttle(throttled.retry_after)
+            attempt += 1
+
+    async def __send(self, method: str, route: str, retry_on_throttling: bool, **kwargs: Any) -> dict[str, Any]:
+        headers = {"Authorization": f"Bearer {await self.__token_manager.access_token()}"}
+        async with self.__session.request(
+            method,
+            f"{self.__base_url}{route}",
+            headers=headers,
+            **kwargs,
+        ) as response:
+            if response.status == 429 and retry_on_throttling:
+                raise EfiThrottled(self.__retry_after(response.headers))
+            response.raise_for_status()
+            return await response.json()
+
+    @staticmethod
+    def __is_failure(error: Exception) -> bool:
+        if isinstance(error, EfiThrottled):
+            return False
+        return not isinstance(error, ClientResponseError) or error.status >= 500
+
+    @classmethod
+    def __retry_after(cls, headers: Mapping[str, str]) -> float:
+        retry_after = headers.get("Retry-After")
+        if retry_after is None:
+            return cls.DEFAULT_RETRY_AFTER
+        if retry_after.isdigit():
+            return float(retry_after)
+        try:
+            return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return cls.DEFAULT_RETRY_AFTER
+
+
+class PixManager(PixProvider, WarmupProvider):  # pylint: disable=R0902
+    PRODUCTION_URL = "https://pix.api.efipay.com.br"
+    SANDBOX_URL = "https://pix-h.api.efipay.com.br"
+
+    __client: EfiPixClient
+    __token_manager: EfiTokenManager
+    __session: ClientSession
+    __base_url: str
+
+    def __init__(
+        self, config: PixFrameworkConfig, metrics_provider: MetricsProvider, cache_provider: CacheProvider
+    ) -> None:
         self.__config = config
+        self.__metrics = metrics_provider
+        self.__cache = cache_provider
+        self.__warm = False
 
     async def connect(self) -> None:
-        await self.__create_certificate_file()
-        self.__app = EfiPay({**self.__config, "certificate": self.__temporary_filename})
+        ssl_context = await self.__create_ssl_context()
+        connector = TCPConnector(
+            ssl=ssl_context,
+            limit=self.__config["max_concurrency"],
+            keepalive_timeout=self.__config["keepalive_timeout"],
+        )
+        self.__session = ClientSession(connector=connector)
+        base_url = self.__config["base_url"] or (self.SANDBOX_URL if self.__config["sandbox"] else self.PRODUCTION_URL)
+        self.__base_url = base_url
+        self.__token_manager = EfiTokenManager(self.__config, base_url, self.__session, self.__cache)
+        self.__client = EfiPixClient(self.__config, base_url, self.__session, self.__token_manager)
 
-    def close(self) -> None:
-        Path(self.__temporary_filename).unlink()
+    async def close(self) -> None:
+        self.__warm = False
+        self.__token_manager.close()
+        await self.__session.close()
+
+    async def warm_up(self) -> None:
+        extra_connections = max(self.__config["warmup_connections"] - 1, 0)
+        try:
+            await asyncio.gather(
+                self.__token_manager.access_token(),
+                *(self.__open_connection() for _ in range(extra_connections)),
+            )
+        except (ClientError, TimeoutError):
+            self.__warm = False
+            raise
+        self.__warm = True
+
+    def readiness(self) -> dict[str, bool]:
+        return {"efi": self.__warm}
+
+    @property
+    def token_metrics(self) -> TokenCacheMetrics:
+        return self.__token_manager.metrics
 
-    async def create_charge(self, pix_model: PixModel) -> PixChargeModel:
+    @property
+    def rate_limiter_metrics(self) -> RateLimiterMetrics:
+        return self.__client.rate_limiter_metrics
+
+    @property
+    def circuit_breaker_metrics(self) -> CircuitBreakerMetrics:
+        return self.__client.circuit_breaker_metrics
+
+    async def create_charge(self, pix_model: PixModel, qrcode_image: bool = True) -> PixChargeModel:
         body = pix_model.model_dump()
-        pix = self.__app.pix_create_immediate_charge(body=body)
-        params = {"id": pix["loc"]["id"]}
-        qrcode_response = self.__app.pix_generate_qrcode(params=params)
+        try:
+            with self.__metrics.measure("efi_charge"):
+                pix = await self.__client.create_immediate_charge(body)
+        except (ClientError, TimeoutError) as error:
+            raise PixChargeTemporarilyUnavailable() from error
+        if not qrcode_image:
+            return PixChargeModel(txid=pix["txid"], pix_copy_paste=pix["pixCopiaECola"])
+        try:
+            with self.__metrics.measure("efi_qrcode"):
+                qrcode_response = await self.__client.generate_qrcode(pix["loc"]["id"])
+        except (ClientError, TimeoutError) as error:
+            raise PixQRCodeImageTemporarilyUnavailable() from error
         if "imagemQrcode" in qrcode_response:
             image_bytes = base64.b64decode(qrcode_response["imagemQrcode"].replace("data:image/png;base64,", ""))
-            return PixChargeModel(pix_qrcode_image=image_bytes, pix_copy_paste=qrcode_response["qrcode"])
+            return PixChargeModel(
+                txid=pix["txid"],
+                pix_copy_paste=qrcode_response["qrcode"],
+                pix_qrcode_image=image_bytes,
+            )
         raise PixQRCodeImageTemporarilyUnavailable()
 
-    async def __create_certificate_file(self) -> None:
-        secret_manager = SecretManager(self.__config)
-        certificate = await secret_manager.retrieve_secret("CERTIFICATE")
-        certificate_tmp_file = NamedTemporaryFile(  # pylint: disable=R1732
-            mode="w",
-            suffix=".pem",
-            delete=False,
-            delete_on_close=False,
-        )
-        certificate_tmp_file.write(certificate)
-        certificate_tmp_file.seek(0)
-        self.__temporary_filename = certificate_tmp_file.name
+    async def __open_connection(self) -> None:
+        async with self.__session.head(self.__base_url) as response:
+            await response.read()
+
+    async def __create_ssl_context(self) -> ssl.SSLContext:
+        ssl_context = ssl.create_default_context(cafile=self.__config["ca_file"] or certifi.where())
+        certificate_file = self.__config["certificate_file"]
+        if certificate_file is not None:
+            await asyncio.to_thread(ssl_context.load_cert_chain, certificate_file)
+            return ssl_context
+        if not hasattr(os, "memfd_create"):
+            raise RuntimeError(
+                "Loading the Efí certificate from Secret Manager needs memfd_create, set PIX_CERTIFICATE_FILE"
+            )
+        await asyncio.to_thread(importlib.import_module, SecretManager.CLIENT_MODULE)
+        certificate = await SecretManager(self.__config).retrieve_secret("CERTIFICATE")
+        with os.fdopen(os.memfd_create("efi-certificate", os.MFD_CLOEXEC), "wb") as memory_file:
+            memory_file.write(certificate.encode())
+            memory_file.flush()
+            ssl_context.load_cert_chain(f"/proc/self/fd/{memory_file.fileno()}")
+        return ssl_context
 
 
 class SecretManager:
+    CLIENT_MODULE = "google.cloud.secretmanager_v1"
+
     def __init__(self, config: GCPSecretConfig) -> None:
+        self.__secretmanager = importlib.import_module(self.CLIENT_MODULE)
         self.__project_id = config["project_id"]
         self.__credentials = config["credentials"]
         self.__service_tag = config["service_tag"]
@@ -74,12 +440,14 @@ class SecretManager:
     async def retrieve_secret(self, secret_name: str) -> str:
         secret_id = f"{self.__env}_{self.__service_tag}_{secret_name}"
         secret_path = f"projects/{self.__project_id}/secrets/{secret_id}/versions/latest"
-        request = secretmanager_v1.AccessSecretVersionRequest(name=secret_path)
+        request = self.__secretmanager.AccessSecretVersionRequest(name=secret_path)
         response = await self.__app.access_secret_version(request=request)
         return response.payload.data.decode("utf-8")
 
-    def __get_app(self) -> secretmanager_v1.SecretManagerServiceAsyncClient:
+    def __get_app(self) -> "SecretManagerServiceAsyncClient":
         if self.__credentials:
+            from google.oauth2 import service_account  # pylint: disable=C0415
+
             certificate = service_account.Credentials.from_service_account_file(self.__credentials)
-            return secretmanager_v1.SecretManagerServiceAsyncClient(credentials=certificate)
-        return secretmanager_v1.SecretManagerServiceAsyncClient()
+            return self.__secretmanager.SecretManagerServiceAsyncClient(credentials=certificate)
+        return self.__secretmanager.SecretManagerServiceAsyncClient()
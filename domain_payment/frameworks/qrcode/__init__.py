@@ -0,0 +1,3 @@
+from .manager import QRCodeFrameworkConfig, QRCodeManager
+
+__all__ = ["QRCodeManager", "QRCodeFrameworkConfig"]
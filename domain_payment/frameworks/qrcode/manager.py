@@ -0,0 +1,39 @@
+import asyncio
+import io
+from collections import OrderedDict
+from typing import TypedDict
+
+import segno
+
+from domain_payment.adapters.interface_adapters.interfaces import QRCodeProvider
+
+
+class QRCodeFrameworkConfig(TypedDict):
+    scale: int
+    cache_size: int
+
+
+class QRCodeManager(QRCodeProvider):
+    BORDER = 4
+    MASK = 0
+
+    def __init__(self, config: QRCodeFrameworkConfig) -> None:
+        self.__scale = config["scale"]
+        self.__cache_size = config["cache_size"]
+        self.__images: OrderedDict[str, bytes] = OrderedDict()
+
+    async def render_png(self, payload: str) -> bytes:
+        image = self.__images.get(payload)
+        if image is None:
+            image = await asyncio.to_thread(self.__render, payload)
+            self.__images[payload] = image
+            if len(self.__images) > self.__cache_size:
+                self.__images.popitem(last=False)
+        self.__images.move_to_end(payload)
+        return image
+
+    def __render(self, payload: str) -> bytes:
+        buffer = io.BytesIO()
+        qrcode = segno.make_qr(payload, error="m", mask=self.MASK)
+        qrcode.save(buffer, kind="png", scale=self.__scale, border=self.BORDER)
+        return buffer.getvalue()
@@ -1,26 +1,30 @@
+import logging
 from contextlib import _AsyncGeneratorContextManager, asynccontextmanager
 from typing import AsyncGenerator, Callable
 
 from fastapi import FastAPI
 
 from domain_payment.containers_config import AppBinding, ProjectConfig
-from domain_payment.frameworks.__factory__ import FrameworksFactory
+from domain_payment.types.startup import StartupTimings
 
 LifespanType = Callable[[FastAPI], _AsyncGeneratorContextManager[None]]
 
 
-def lifespan_dependencies(factory: FrameworksFactory) -> LifespanType:
+def lifespan_dependencies(app_binding: AppBinding) -> LifespanType:
     @asynccontextmanager
-    async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
-        await factory.connect()
+    async def lifespan(base_app: FastAPI) -> AsyncGenerator[None, None]:
+        startup_timings: StartupTimings = base_app.state.startup_timings
+        with startup_timings.phase("startup"):
+            startup_timings.merge("startup", await app_binding.startup())
+        logging.getLogger("Lifespan").info("Application started: %s", startup_timings)
         yield
-        await factory.close()
+        await app_binding.shutdown()
 
     return lifespan
 
 
 def simple_app(app_binding: AppBinding) -> FastAPI:
-    lifespan = lifespan_dependencies(factory=app_binding.frameworks)
+    lifespan = lifespan_dependencies(app_binding=app_binding)
     return FastAPI(lifespan=lifespan)
 
 
@@ -28,12 +32,24 @@ def register_routes(base_app: FastAPI, app_binding: AppBinding) -> None:
     app_binding.adapters.register_routes(base_app)
 
 
+def register_metrics(base_app: FastAPI, app_binding: AppBinding) -> None:
+    app_binding.adapters.register_metrics(base_app)
+
+
 def create_app() -> FastAPI:
-    project_config = ProjectConfig()
-    app_binding = AppBinding(project_config.frameworks_config, project_config.adapters_config)
-    app_binding.facade()
-    base_app = simple_app(app_binding)
-    register_routes(base_app, app_binding)
+    startup_timings = StartupTimings()
+    with startup_timings.phase("create_app"):
+        project_config = ProjectConfig()
+        app_binding = AppBinding(
+            project_config.frameworks_config,
+            project_config.adapters_config,
+            project_config.business_config,
+        )
+        app_binding.facade()
+        base_app = simple_app(app_binding)
+        register_routes(base_app, app_binding)
+        register_metrics(base_app, app_binding)
+    base_app.state.startup_timings = startup_timings
     return base_app
 
 
@@ -1,10 +1,16 @@
-from .pix_model import PixChargeModel, PixChargeResponseModel, PixModel
+from .charge_model import ChargeModel, ChargePageModel, ChargeStatus, ChargeSummaryModel
+from .pix_model import PixChargeModel, PixChargeResponseModel, PixModel, PixPaymentModel
 from .user_model import AccountModel, AuthenticatedUserModel
 
 __all__ = [
     "PixModel",
     "PixChargeModel",
     "PixChargeResponseModel",
+    "PixPaymentModel",
     "AuthenticatedUserModel",
     "AccountModel",
+    "ChargeModel",
+    "ChargePageModel",
+    "ChargeStatus",
+    "ChargeSummaryModel",
 ]
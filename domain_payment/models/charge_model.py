@@ -0,0 +1,29 @@
+from datetime import datetime
+from enum import UNIQUE, Enum, verify
+
+from pydantic import BaseModel, Field
+
+
+@verify(UNIQUE)
+class ChargeStatus(Enum):
+    ACTIVE = "ATIVA"
+    COMPLETED = "CONCLUIDA"
+    REMOVED_BY_RECEIVER = "REMOVIDA_PELO_USUARIO_RECEBEDOR"
+    REMOVED_BY_PSP = "REMOVIDA_PELO_PSP"
+
+
+class ChargeSummaryModel(BaseModel):
+    txid: str
+    value: str = Field(examples=["123.45"])
+    status: str = Field(examples=[ChargeStatus.ACTIVE.value])
+    created_at: datetime
+    expires_at: datetime
+
+
+class ChargeModel(ChargeSummaryModel):
+    pix_copy_paste: str
+
+
+class ChargePageModel(BaseModel):
+    charges: list[ChargeSummaryModel]
+    next_cursor: str | None = None
@@ -1,3 +1,4 @@
+from datetime import datetime
 from decimal import Decimal
 
 from pydantic import BaseModel, Field, field_validator
@@ -32,10 +33,19 @@ class PixModel(BaseModel):
 
 
 class PixChargeModel(BaseModel):
-    pix_qrcode_image: bytes
+    txid: str
     pix_copy_paste: str
+    pix_qrcode_image: bytes | None = None
 
 
 class PixChargeResponseModel(BaseModel):
+    txid: str
     pix_qrcode_path: str
     pix_copy_paste: str
+
+
+class PixPaymentModel(BaseModel):
+    endToEndId: str = Field(pattern=r"^[a-zA-Z0-9]{32}$")
+    txid: str | None = None
+    valor: str = Field(examples=["123.45"])
+    horario: datetime
@@ -0,0 +1,30 @@
+import asyncio
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Any, Coroutine, Iterator, TypeVar
+
+T_result = TypeVar("T_result")
+
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar("deadline", default=None)
+
+
+@contextmanager
+def request_deadline(timeout: float) -> Iterator[None]:
+    token = _deadline.set(time.monotonic() + timeout)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time(limit: float | None = None) -> float | None:
+    deadline = _deadline.get()
+    if deadline is None:
+        return limit
+    remaining = max(deadline - time.monotonic(), 0.0)
+    return remaining if limit is None else min(limit, remaining)
+
+
+def create_background_task(coroutine: Coroutine[Any, Any, T_result]) -> asyncio.Task[T_result]:
+    return asyncio.create_task(coroutine, context=contextvars.Context())
@@ -0,0 +1,28 @@
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Iterator, TypeVar
+
+T_result = TypeVar("T_result")
+
+
+class StartupTimings:
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - started_at
+
+    async def measure(self, name: str, awaitable: Awaitable[T_result]) -> T_result:
+        with self.phase(name):
+            return await awaitable
+
+    def merge(self, prefix: str, timings: "StartupTimings") -> None:
+        self.phases.update({f"{prefix}.{name}": duration for name, duration in timings.phases.items()})
+
+    def __str__(self) -> str:
+        return ", ".join(f"{name}={duration * 1000:.1f}ms" for name, duration in self.phases.items())
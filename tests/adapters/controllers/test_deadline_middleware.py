@@ -0,0 +1,49 @@
+import asyncio
+from typing import Any
+
+import pytest
+from starlette.types import Message, Receive, Scope, Send
+
+from domain_payment.adapters.controllers.__middlewares__ import DeadlineMiddleware
+
+
+class SlowApp:
+    def __init__(self, latency: float, error: Exception | None = None) -> None:
+        self.__latency = latency
+        self.__error = error
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await asyncio.sleep(self.__latency)
+        if self.__error is not None:
+            raise self.__error
+        await send({"type": "http.response.start", "status": 201, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+
+def request(app: Any, timeout: str) -> list[Message]:
+    messages: list[Message] = []
+    scope = {"type": "http", "path": "/charge-pix", "headers": [(b"x-request-timeout", timeout.encode())]}
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    asyncio.run(DeadlineMiddleware(app, request_timeout=30)(scope, receive, send))
+    return messages
+
+
+def test_answers_504_when_the_request_deadline_passes() -> None:
+    messages = request(SlowApp(latency=1), timeout="0.05")
+    assert messages[0]["status"] == 504
+
+
+def test_lets_upstream_timeouts_within_the_deadline_through() -> None:
+    with pytest.raises(TimeoutError):
+        request(SlowApp(latency=0, error=TimeoutError()), timeout="5")
+
+
+def test_passes_through_responses_within_the_deadline() -> None:
+    messages = request(SlowApp(latency=0), timeout="5")
+    assert messages[0]["status"] == 201
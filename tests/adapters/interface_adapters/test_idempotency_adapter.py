@@ -0,0 +1,210 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, cast
+
+import pytest
+from pymongo.errors import DuplicateKeyError
+from pymongo.results import DeleteResult, InsertOneResult, UpdateResult
+
+from domain_payment.adapters.interface_adapters.exceptions import IdempotencyKeyInProgress, IdempotencyKeyReused
+from domain_payment.adapters.interface_adapters.idempotency_adapter import (
+    IdempotencyAdapter,
+    IdempotencyAdapterConfig,
+    IdempotencyProviders,
+    ProviderType,
+)
+
+OPERATORS = {
+    "$lt": lambda value, bound: value < bound,
+    "$lte": lambda value, bound: value <= bound,
+    "$gt": lambda value, bound: value > bound,
+}
+
+
+def matches(document: dict[str, Any], query: dict[str, Any]) -> bool:
+    for field, condition in query.items():
+        if field == "$or":
+            if not any(matches(document, alternative) for alternative in condition):
+                return False
+        elif isinstance(condition, dict):
+            if field not in document:
+                return False
+            if not all(OPERATORS[operator](document[field], bound) for operator, bound in condition.items()):
+                return False
+        elif document.get(field) != condition:
+            return False
+    return True
+
+
+class InMemoryCollection:
+    def __init__(self) -> None:
+        self.documents: dict[str, dict[str, Any]] = {}
+
+    async def create_index(self, *_: Any, **__: Any) -> None: ...
+
+    async def insert_one(self, document: dict[str, Any]) -> InsertOneResult:
+        if document["_id"] in self.documents:
+            raise DuplicateKeyError("duplicate key")
+        self.documents[document["_id"]] = dict(document)
+        return InsertOneResult(document["_id"], acknowledged=True)
+
+    async def find_one(self, query: dict[str, Any]) -> dict[str, Any] | None:
+        document = self.documents.get(query["_id"])
+        return dict(document) if document is not None and matches(document, query) else None
+
+    async def replace_one(self, query: dict[str, Any], replacement: dict[str, Any]) -> UpdateResult:
+        document = self.documents.get(query["_id"])
+        if document is None or not matches(document, query):
+            return UpdateResult({"n": 0, "nModified": 0}, acknowledged=True)
+        self.documents[query["_id"]] = dict(replacement)
+        return UpdateResult({"n": 1, "nModified": 1}, acknowledged=True)
+
+    async def update_one(self, query: dict[str, Any], update: dict[str, Any]) -> UpdateResult:
+        document = self.documents.get(query["_id"])
+        if document is None or not matches(document, query):
+            return UpdateResult({"n": 0, "nModified": 0}, acknowledged=True)
+        document.update(update["$set"])
+        return UpdateResult({"n": 1, "nModified": 1}, acknowledged=True)
+
+    async def delete_one(self, query: dict[str, Any]) -> DeleteResult:
+        document = self.documents.get(query["_id"])
+        if document is None or not matches(document, query):
+            return DeleteResult({"n": 0}, acknowledged=True)
+        del self.documents[query["_id"]]
+        return DeleteResult({"n": 1}, acknowledged=True)
+
+
+class InMemoryDatabaseProvider:
+    def __init__(self, collection: InMemoryCollection) -> None:
+        self.__collection = collection
+
+    def get_database(self, _: Any) -> dict[str, InMemoryCollection]:
+        return {"idempotency_keys": self.__collection}
+
+
+class ChargeOperation:
+    def __init__(self, latency: float = 0.0, error: BaseException | None = None) -> None:
+        self.__latency = latency
+        self.__error = error
+        self.calls = 0
+
+    async def __call__(self) -> dict[str, Any]:
+        self.calls += 1
+        await asyncio.sleep(self.__latency)
+        if self.__error is not None:
+            raise self.__error
+        return {"txid": f"charge-{self.calls}"}
+
+
+def create_adapter(collection: InMemoryCollection, wait_timeout: float = 0.2) -> IdempotencyAdapter:
+    provider = cast(ProviderType, InMemoryDatabaseProvider(collection))
+    config = IdempotencyAdapterConfig(key_ttl=60, lease_timeout=30, wait_timeout=wait_timeout, poll_interval=0.01)
+    return IdempotencyAdapter(IdempotencyProviders(provider), config)
+
+
+def pending_record(fingerprint: str, locked_until: datetime, expires_at: datetime) -> dict[str, Any]:
+    return {
+        "_id": "user:key",
+        "fingerprint": fingerprint,
+        "status": "pending",
+        "lease_id": "crashed-worker",
+        "locked_until": locked_until,
+        "created_at": datetime.now(timezone.utc),
+        "expires_at": expires_at,
+    }
+
+
+def test_replays_the_completed_response() -> None:
+    async def scenario() -> None:
+        collection = InMemoryCollection()
+        operation = ChargeOperation()
+        first = await create_adapter(collection).execute("user", "key", "10.50", operation)
+        replay = await create_adapter(collection).execute("user", "key", "10.50", operation)
+        assert first == replay == {"txid": "charge-1"}
+        assert operation.calls == 1
+
+    asyncio.run(scenario())
+
+
+def test_rejects_a_key_reused_with_another_request() -> None:
+    async def scenario() -> None:
+        collection = InMemoryCollection()
+        await create_adapter(collection).execute("user", "key", "10.50", ChargeOperation())
+        with pytest.raises(IdempotencyKeyReused):
+            await create_adapter(collection).execute("user", "key", "99.00", ChargeOperation())
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_request_waits_for_the_lease_holder() -> None:
+    async def scenario() -> None:
+        collection = InMemoryCollection()
+        operation = ChargeOperation(latency=0.05)
+        responses = await asyncio.gather(
+            create_adapter(collection).execute("user", "key", "10.50", operation),
+            create_adapter(collection).execute("user", "key", "10.50", operation),
+        )
+        assert responses == [{"txid": "charge-1"}, {"txid": "charge-1"}]
+        assert operation.calls == 1
+
+    asyncio.run(scenario())
+
+
+def test_active_lease_blocks_retries_until_the_wait_timeout() -> None:
+    async def scenario() -> None:
+        collection = InMemoryCollection()
+        now = datetime.now(timezone.utc)
+        await collection.insert_one(pending_record("10.50", now + timedelta(seconds=30), now + timedelta(seconds=60)))
+        operation = ChargeOperation()
+        with pytest.raises(IdempotencyKeyInProgress):
+            await create_adapter(collection, wait_timeout=0.05).execute("user", "key", "10.50", operation)
+        assert operation.calls == 0
+
+    asyncio.run(scenario())
+
+
+def test_takes_over_an_expired_lease() -> None:
+    async def scenario() -> None:
+        collection = InMemoryCollection()
+        now = datetime.now(timezone.utc)
+        await collection.insert_one(pending_record("10.50", now - timedelta(seconds=1), now + timedelta(seconds=60)))
+        response = await create_adapter(collection).execute("user", "key", "10.50", ChargeOperation())
+        assert response == {"txid": "charge-1"}
+        assert collection.documents["user:key"]["status"] == "completed"
+        assert collection.documents["user:key"]["lease_id"] != "crashed-worker"
+
+    asyncio.run(scenario())
+
+
+def test_expired_record_is_not_replayed() -> None:
+    async def scenario() -> None:
+        collection = InMemoryCollection()
+        now = datetime.now(timezone.utc)
+        expired = pending_record("10.50", now - timedelta(seconds=90), now - timedelta(seconds=1))
+        await collection.insert_one({**expired, "status": "completed", "response": {"txid": "stale"}})
+        response = await create_adapter(collection).execute("user", "key", "10.50", ChargeOperation())
+        assert response == {"txid": "charge-1"}
+
+    asyncio.run(scenario())
+
+
+def test_failed_operation_releases_the_key() -> None:
+    async def scenario() -> None:
+        collection = InMemoryCollection()
+        with pytest.raises(ValueError):
+            await create_adapter(collection).execute("user", "key", "10.50", ChargeOperation(error=ValueError()))
+        assert "user:key" not in collection.documents
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_operation_keeps_the_lease() -> None:
+    async def scenario() -> None:
+        collection = InMemoryCollection()
+        with pytest.raises(asyncio.CancelledError):
+            await create_adapter(collection).execute(
+                "user", "key", "10.50", ChargeOperation(error=asyncio.CancelledError())
+            )
+        assert collection.documents["user:key"]["status"] == "pending"
+
+    asyncio.run(scenario())
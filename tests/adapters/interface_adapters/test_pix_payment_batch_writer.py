@@ -0,0 +1,38 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Mapping, cast
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import UpdateOne
+from pymongo.results import BulkWriteResult
+
+from domain_payment.adapters.interface_adapters.charge_adapter import ChargeAdapterConfig, PixPaymentBatchWriter
+from domain_payment.models import PixPaymentModel
+
+
+class SlowCharges:
+    def __init__(self, latency: float) -> None:
+        self.__latency = latency
+        self.written: list[Mapping[str, Any]] = []
+
+    async def bulk_write(self, operations: list[UpdateOne], ordered: bool) -> BulkWriteResult:
+        assert not ordered
+        await asyncio.sleep(self.__latency)
+        self.written.extend(operation._filter for operation in operations)  # pylint: disable=W0212
+        return BulkWriteResult({"nMatched": len(operations)}, acknowledged=True)
+
+
+def create_payment(txid: str) -> PixPaymentModel:
+    return PixPaymentModel(endToEndId="E" * 32, txid=txid, valor="10.50", horario=datetime.now(timezone.utc))
+
+
+def test_close_writes_the_batch_in_flight() -> None:
+    async def scenario() -> None:
+        charges = SlowCharges(latency=0.2)
+        writer = PixPaymentBatchWriter(cast(AsyncIOMotorCollection, charges), ChargeAdapterConfig(2, 10, 100))
+        writer.submit([create_payment("first"), create_payment("second")])
+        await asyncio.sleep(0.05)
+        await writer.close()
+        assert charges.written == [{"_id": "first"}, {"_id": "second"}]
+
+    asyncio.run(scenario())
@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from domain_payment.frameworks.circuit_breaker.manager import CircuitBreaker, CircuitOpen, CircuitState
+from domain_payment.types.deadline import request_deadline
+
+
+class FlakyOperation:
+    def __init__(self, latency: float = 0, error: Exception | None = None) -> None:
+        self.latency = latency
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if self.error is not None:
+            raise self.error
+        return "ok"
+
+
+def create_circuit_breaker(reset_timeout: float = 0.05, call_timeout: float = 1) -> CircuitBreaker:
+    return CircuitBreaker(
+        "upstream",
+        {"failure_threshold": 2, "reset_timeout": reset_timeout, "call_timeout": call_timeout},
+        is_failure=lambda error: not isinstance(error, ValueError),
+    )
+
+
+async def fail(circuit_breaker: CircuitBreaker, operation: FlakyOperation, times: int) -> None:
+    for _ in range(times):
+        with pytest.raises(ConnectionError):
+            await circuit_breaker.call(operation)
+
+
+def test_opens_after_consecutive_failures_and_rejects_calls() -> None:
+    async def scenario() -> None:
+        circuit_breaker = create_circuit_breaker(reset_timeout=60)
+        operation = FlakyOperation(error=ConnectionError())
+        await fail(circuit_breaker, operation, times=2)
+        with pytest.raises(CircuitOpen) as rejection:
+            await circuit_breaker.call(operation)
+        assert rejection.value.status_code == 503
+        assert rejection.value.headers == {"Retry-After": "60"}
+        assert operation.calls == 2
+        assert circuit_breaker.metrics.state is CircuitState.OPEN
+        assert circuit_breaker.metrics.rejections == 1
+        assert circuit_breaker.metrics.openings == 1
+
+    asyncio.run(scenario())
+
+
+def test_ignores_errors_that_are_not_failures() -> None:
+    async def scenario() -> None:
+        circuit_breaker = create_circuit_breaker()
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                await circuit_breaker.call(FlakyOperation(error=ValueError()))
+        assert circuit_breaker.metrics.state is CircuitState.CLOSED
+        assert circuit_breaker.metrics.failures == 0
+
+    asyncio.run(scenario())
+
+
+def test_half_open_allows_a_single_probe_that_closes_the_circuit() -> None:
+    async def scenario() -> None:
+        circuit_breaker = create_circuit_breaker()
+        await fail(circuit_breaker, FlakyOperation(error=ConnectionError()), times=2)
+        await asyncio.sleep(0.06)
+        probe = asyncio.create_task(circuit_breaker.call(FlakyOperation(latency=0.02)))
+        await asyncio.sleep(0)
+        assert circuit_breaker.metrics.state is CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpen):
+            await circuit_breaker.call(FlakyOperation())
+        assert await probe == "ok"
+        assert circuit_breaker.metrics.state is CircuitState.CLOSED
+        assert circuit_breaker.metrics.consecutive_failures == 0
+
+    asyncio.run(scenario())
+
+
+def test_failed_probe_opens_the_circuit_again() -> None:
+    async def scenario() -> None:
+        circuit_breaker = create_circuit_breaker()
+        operation = FlakyOperation(error=ConnectionError())
+        await fail(circuit_breaker, operation, times=2)
+        await asyncio.sleep(0.06)
+        await fail(circuit_breaker, operation, times=1)
+        assert circuit_breaker.metrics.state is CircuitState.OPEN
+        assert circuit_breaker.metrics.openings == 2
+        with pytest.raises(CircuitOpen):
+            await circuit_breaker.call(operation)
+        assert operation.calls == 3
+
+    asyncio.run(scenario())
+
+
+def test_call_timeout_counts_as_a_failure() -> None:
+    async def scenario() -> None:
+        circuit_breaker = create_circuit_breaker(call_timeout=0.01)
+        with pytest.raises(TimeoutError):
+            await circuit_breaker.call(FlakyOperation(latency=1))
+        assert circuit_breaker.metrics.timeouts == 1
+        assert circuit_breaker.metrics.failures == 1
+
+    asyncio.run(scenario())
+
+
+def test_clamps_the_call_timeout_to_the_request_deadline() -> None:
+    async def scenario() -> None:
+        circuit_breaker = create_circuit_breaker(call_timeout=1)
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        with request_deadline(0.02), pytest.raises(TimeoutError):
+            await circuit_breaker.call(FlakyOperation(latency=1))
+        assert loop.time() - started_at < 0.5
+        assert circuit_breaker.metrics.timeouts == 0
+        assert circuit_breaker.metrics.failures == 0
+        assert circuit_breaker.metrics.state is CircuitState.CLOSED
+
+    asyncio.run(scenario())
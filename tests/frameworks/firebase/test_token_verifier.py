@@ -0,0 +1,20 @@
+import asyncio
+from typing import cast
+
+import jwt
+import pytest
+
+from domain_payment.frameworks.firebase.manager import FirebaseTokenVerifier, GooglePublicKeys
+
+
+class EmptyPublicKeys:
+    async def get(self, _: str) -> jwt.PyJWK | None:
+        return None
+
+
+def test_unknown_key_id_is_an_invalid_token() -> None:
+    verifier = FirebaseTokenVerifier("project", cast(GooglePublicKeys, EmptyPublicKeys()), 8)
+    token = jwt.encode({"sub": "user"}, "secret", algorithm="HS256", headers={"kid": "unknown"})
+
+    with pytest.raises(jwt.InvalidTokenError):
+        asyncio.run(verifier.verify(token))
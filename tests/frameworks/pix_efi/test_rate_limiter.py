@@ -0,0 +1,65 @@
+import asyncio
+from typing import cast
+
+from domain_payment.frameworks.pix_efi.manager import EfiRateLimiter, PixFrameworkConfig
+
+
+def create_rate_limiter(rate_limit: float, rate_limit_burst: int, max_concurrency: int) -> EfiRateLimiter:
+    config = {"rate_limit": rate_limit, "rate_limit_burst": rate_limit_burst, "max_concurrency": max_concurrency}
+    return EfiRateLimiter(cast(PixFrameworkConfig, config))
+
+
+def test_spends_the_burst_then_refills_tokens_at_the_rate_limit() -> None:
+    async def scenario() -> None:
+        rate_limiter = create_rate_limiter(rate_limit=20, rate_limit_burst=2, max_concurrency=8)
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        acquired_at: list[float] = []
+
+        async def acquire() -> None:
+            async with rate_limiter.slot():
+                acquired_at.append(loop.time() - started_at)
+
+        await asyncio.gather(*(acquire() for _ in range(4)))
+        assert acquired_at[1] < 0.02
+        assert acquired_at[2] >= 0.04
+        assert acquired_at[3] >= 0.09
+        assert rate_limiter.metrics.acquired == 4
+        assert rate_limiter.metrics.wait_time_max >= 0.09
+
+    asyncio.run(scenario())
+
+
+def test_caps_the_number_of_requests_in_flight() -> None:
+    async def scenario() -> None:
+        rate_limiter = create_rate_limiter(rate_limit=1000, rate_limit_burst=10, max_concurrency=2)
+        in_flight: list[int] = []
+
+        async def hold() -> None:
+            async with rate_limiter.slot():
+                in_flight.append(rate_limiter.metrics.in_flight)
+                await asyncio.sleep(0.01)
+
+        tasks = [asyncio.create_task(hold()) for _ in range(5)]
+        await asyncio.sleep(0.005)
+        assert rate_limiter.metrics.in_flight == 2
+        assert rate_limiter.metrics.queue_depth == 3
+        await asyncio.gather(*tasks)
+        assert max(in_flight) == 2
+        assert rate_limiter.metrics.in_flight == 0
+        assert rate_limiter.metrics.queue_depth == 0
+
+    asyncio.run(scenario())
+
+
+def test_throttle_blocks_new_slots_until_retry_after() -> None:
+    async def scenario() -> None:
+        rate_limiter = create_rate_limiter(rate_limit=1000, rate_limit_burst=10, max_concurrency=8)
+        loop = asyncio.get_running_loop()
+        rate_limiter.throttle(0.05)
+        started_at = loop.time()
+        async with rate_limiter.slot():
+            assert loop.time() - started_at >= 0.05
+        assert rate_limiter.metrics.throttled == 1
+
+    asyncio.run(scenario())
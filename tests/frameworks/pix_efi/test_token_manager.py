@@ -0,0 +1,71 @@
+import asyncio
+from types import TracebackType
+from typing import Any, cast
+
+import pytest
+from aiohttp import ClientSession
+
+from domain_payment.frameworks.cache import CacheBackend, CacheManager
+from domain_payment.frameworks.pix_efi.manager import EfiTokenManager, PixFrameworkConfig
+
+
+class FakeTokenResponse:
+    def __init__(self, access_token: str, latency: float) -> None:
+        self.__access_token = access_token
+        self.__latency = latency
+
+    async def __aenter__(self) -> "FakeTokenResponse":
+        await asyncio.sleep(self.__latency)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None: ...
+
+    async def json(self) -> dict[str, Any]:
+        return {"access_token": self.__access_token, "expires_in": 1}
+
+
+class FakeTokenSession:
+    def __init__(self, latencies: list[float]) -> None:
+        self.__latencies = latencies
+        self.requests = 0
+
+    def post(self, *_: Any, **__: Any) -> FakeTokenResponse:
+        self.requests += 1
+        return FakeTokenResponse(f"token-{self.requests}", self.__latencies[self.requests - 1])
+
+
+def create_token_manager(session: FakeTokenSession) -> EfiTokenManager:
+    config = cast(PixFrameworkConfig, {"client_id": "client", "client_secret": "secret", "token_refresh_margin": 1})
+    cache = CacheManager(
+        {
+            "backend": CacheBackend.LOCAL,
+            "key_prefix": "",
+            "local_max_entries": 8,
+            "shared_slots": 1,
+            "shared_slot_size": 64,
+            "redis_url": None,
+        }
+    )
+    return EfiTokenManager(config, "https://efi.test", cast(ClientSession, session), cache)
+
+
+def test_concurrent_caller_receives_the_token_refreshed_in_background(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(EfiTokenManager, "EXPIRATION_SKEW", 0.05)
+
+    async def scenario() -> None:
+        session = FakeTokenSession([0.0, 1.0, 0.0])
+        token_manager = create_token_manager(session)
+        try:
+            assert await token_manager.access_token() == "token-1"
+            await asyncio.sleep(1.0)
+            assert session.requests == 2
+            assert await asyncio.wait_for(token_manager.access_token(), 2) == "token-2"
+        finally:
+            token_manager.close()
+
+    asyncio.run(scenario())